@@ -0,0 +1,315 @@
+"""
+Mide el rendimiento de los caminos críticos de los modelos y de la vista de
+cartas, y guarda los resultados en JSON para compararlos entre commits.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.ejecutar --salida resultados.json
+    python -m benchmarks.ejecutar --comparar base.json
+"""
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+from typing import Callable, Dict
+
+
+def medir(funcion: Callable[[], None], operaciones: int,
+          repeticiones: int = 5) -> Dict[str, float]:
+    """
+    Mide una función que realiza `operaciones` operaciones por llamada.
+
+    Args:
+        funcion: Función a medir
+        operaciones: Operaciones que realiza cada llamada
+        repeticiones: Veces que se repite la medición (se toma la mejor)
+
+    Returns:
+        Diccionario con la mejor duración y las operaciones por segundo
+    """
+    funcion()  # Calentamiento
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        tiempos.append(time.perf_counter() - inicio)
+    mejor = min(tiempos)
+    return {
+        "operaciones": operaciones,
+        "segundos": mejor,
+        "por_segundo": operaciones / mejor if mejor else float("inf"),
+    }
+
+
+def casos_modelos(escala: int) -> Dict[str, tuple]:
+    """
+    Define los casos de los modelos.
+
+    Args:
+        escala: Multiplicador del número de operaciones por caso
+
+    Returns:
+        Diccionario nombre -> (función, operaciones)
+    """
+    import random
+    from modelos.juego_cartas import JuegoCartas
+    from modelos.juego_puertas import JuegoPuertas, jugar_rondas_puertas
+    from modelos.pool_juegos import PoolJuegos
+
+    rng = random.Random(0)
+    n = 20_000 * escala
+
+    def crear_puertas():
+        for _ in range(n):
+            JuegoPuertas(rng)
+
+    puertas = JuegoPuertas(rng)
+
+    def reiniciar_puertas():
+        for _ in range(n):
+            puertas.reiniciar()
+
+    def revelar_puerta():
+        for _ in range(n):
+            puertas.reiniciar()
+            puertas.seleccionar_opcion(1)
+            puertas.revelar_puerta()
+
+    puertas.reiniciar()
+    puertas.seleccionar_opcion(1)
+    puertas.revelar_puerta()
+
+    def puerta_restante():
+        for _ in range(n):
+            puertas.obtener_puerta_restante()
+
+    def ronda_puertas():
+        for _ in range(n):
+            puertas.reiniciar()
+            puertas.seleccionar_opcion(rng.randint(1, 3))
+            puertas.revelar_puerta()
+            puertas.cambiar_eleccion()
+            puertas.verificar_victoria()
+
+    def rondas_puertas_rapidas():
+        jugar_rondas_puertas(n, rng)
+
+    def rondas_puertas_un_sorteo():
+        jugar_rondas_puertas(n, rng, compatible=False)
+
+    cartas = JuegoCartas(rng)
+    n_cartas = n // 10
+
+    def crear_cartas():
+        for _ in range(n_cartas):
+            JuegoCartas(rng)
+
+    def revelar_cartas():
+        for _ in range(n_cartas):
+            cartas.reiniciar()
+            cartas.seleccionar_opcion(1)
+            cartas.revelar_cartas()
+
+    def crear_baraja():
+        for _ in range(n_cartas):
+            cartas._crear_baraja()
+
+    estado_cartas = cartas.capturar_estado()
+
+    def capturar_restaurar():
+        for _ in range(n):
+            cartas.restaurar_estado(estado_cartas)
+            cartas.capturar_estado()
+
+    pool = PoolJuegos(lambda: JuegoPuertas(rng))
+    estado_puertas = pool.aparcar(pool.obtener())
+
+    def reanudar_aparcar():
+        for _ in range(n):
+            pool.aparcar(pool.reanudar(estado_puertas))
+
+    return {
+        "JuegoPuertas.__init__": (crear_puertas, n),
+        "JuegoMontyHall.reiniciar": (reiniciar_puertas, n),
+        "JuegoPuertas.revelar_puerta": (revelar_puerta, n),
+        "JuegoPuertas.obtener_puerta_restante": (puerta_restante, n),
+        "JuegoPuertas.ronda_completa": (ronda_puertas, n),
+        "jugar_rondas_puertas": (rondas_puertas_rapidas, n),
+        "jugar_rondas_puertas(compatible=False)": (rondas_puertas_un_sorteo, n),
+        "JuegoCartas.__init__": (crear_cartas, n_cartas),
+        "JuegoCartas.revelar_cartas": (revelar_cartas, n_cartas),
+        "JuegoCartas._crear_baraja": (crear_baraja, n_cartas),
+        "JuegoMontyHall.capturar_restaurar_estado": (capturar_restaurar, n),
+        "PoolJuegos.reanudar_aparcar": (reanudar_aparcar, n),
+    }
+
+
+def casos_lotes(escala: int) -> Dict[str, tuple]:
+    """
+    Define los casos de los simuladores por lotes (requieren NumPy).
+
+    Args:
+        escala: Multiplicador del número de rondas por caso
+
+    Returns:
+        Diccionario nombre -> (función, rondas)
+    """
+    try:
+        from modelos.estrategias import (AnfitrionSesgado, JugadorMixto,
+                                         evaluar_lote)
+        from modelos.simulador import SimuladorMontyHall
+        from modelos.acelerado import NUMBA_DISPONIBLE, SimuladorEscalar
+    except ImportError:
+        return {}
+
+    rondas = 2_000_000 * escala
+    puertas = SimuladorMontyHall(3, 0)
+    generalizado = SimuladorMontyHall(100, 0, reveladas=50)
+
+    escalar = SimuladorEscalar(3, AnfitrionSesgado(0.7), 0, compilar=False)
+    rondas_escalar = rondas // 10
+
+    casos = {
+        "SimuladorMontyHall.simular(3)": (lambda: puertas.simular(rondas), rondas),
+        "SimuladorMontyHall.simular(100, K=50)": (
+            lambda: generalizado.simular(rondas), rondas),
+        "estrategias.evaluar_lote": (
+            lambda: evaluar_lote(AnfitrionSesgado(0.7), JugadorMixto(0.5), 3,
+                                 rondas, 0), rondas),
+        "SimuladorEscalar.simular (Python)": (
+            lambda: escalar.simular(rondas_escalar), rondas_escalar),
+    }
+    if NUMBA_DISPONIBLE:
+        compilado = SimuladorEscalar(3, AnfitrionSesgado(0.7), 0, compilar=True)
+        compilado.simular(1)  # La primera llamada incluye la compilación
+        casos["SimuladorEscalar.simular (Numba)"] = (
+            lambda: compilado.simular(rondas), rondas)
+    return casos
+
+
+def casos_vistas(escala: int) -> Dict[str, tuple]:
+    """
+    Define los casos de redibujado de la vista de cartas.
+
+    La vista se construye con su constructor sobre una ventana oculta; si
+    no hay pantalla, los casos se omiten.
+
+    Args:
+        escala: Multiplicador del número de revelados por caso
+
+    Returns:
+        Diccionario nombre -> (función, revelados)
+    """
+    try:
+        import tkinter as tk
+        from vistas.vista_cartas import VistaCartas
+    except ImportError:
+        return {}
+    try:
+        ventana = tk.Tk()
+    except tk.TclError:
+        return {}
+    ventana.withdraw()
+    vista = VistaCartas(ventana, lambda: None)
+    n = 200 * escala
+
+    def revelar():
+        for _ in range(n):
+            vista.juego.reiniciar()
+            vista.juego.seleccionar_opcion(1)
+            vista.revelar_cartas()
+            vista.planificador.vaciar()
+
+    return {"VistaCartas.revelar_cartas": (revelar, n)}
+
+
+def commit_actual() -> str:
+    """Obtiene el commit de git actual, si existe."""
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"],
+                              capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def comparar(actual: dict, base: dict, umbral: float) -> bool:
+    """
+    Compara dos resultados e informa de las regresiones.
+
+    Args:
+        actual: Resultados de esta ejecución
+        base: Resultados de referencia
+        umbral: Caída relativa de operaciones/s considerada regresión
+
+    Returns:
+        True si no hay regresiones
+    """
+    sin_regresiones = True
+    for nombre, medida in actual["resultados"].items():
+        referencia = base["resultados"].get(nombre)
+        if referencia is None:
+            continue
+        relacion = medida["por_segundo"] / referencia["por_segundo"]
+        marca = ""
+        if relacion < 1 - umbral:
+            marca = "  <-- REGRESIÓN"
+            sin_regresiones = False
+        print(f"{nombre:45s} {relacion:6.2f}x{marca}", file=sys.stderr)
+    return sin_regresiones
+
+
+def main(argumentos=None):
+    """
+    Ejecuta los benchmarks.
+
+    Args:
+        argumentos: Lista de argumentos (por defecto, sys.argv)
+    """
+    parser = argparse.ArgumentParser(description="Benchmarks de Monty Hall")
+    parser.add_argument("--salida", help="archivo JSON donde guardar los resultados")
+    parser.add_argument("--comparar", metavar="JSON",
+                        help="resultados de referencia con los que comparar")
+    parser.add_argument("--umbral", type=float, default=0.1,
+                        help="caída relativa considerada regresión (por defecto: 0.1)")
+    parser.add_argument("--escala", type=int, default=1,
+                        help="multiplicador del trabajo de cada caso")
+    parser.add_argument("--filtro", default="",
+                        help="ejecutar solo los casos que contengan este texto")
+    args = parser.parse_args(argumentos)
+
+    casos = {}
+    casos.update(casos_modelos(args.escala))
+    casos.update(casos_lotes(args.escala))
+    casos.update(casos_vistas(args.escala))
+
+    resultados = {}
+    for nombre, (funcion, operaciones) in casos.items():
+        if args.filtro not in nombre:
+            continue
+        resultados[nombre] = medir(funcion, operaciones)
+        print(f"{nombre:45s} {resultados[nombre]['por_segundo']:>14,.0f} ops/s",
+              file=sys.stderr)
+
+    informe = {
+        "commit": commit_actual(),
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "resultados": resultados,
+    }
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as archivo:
+            json.dump(informe, archivo, indent=2, ensure_ascii=False)
+    else:
+        print(json.dumps(informe, indent=2, ensure_ascii=False))
+
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as archivo:
+            base = json.load(archivo)
+        if not comparar(informe, base, args.umbral):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,23 @@
-import tkinter as tk
-from vistas.menu_principal import MenuPrincipal
+import argparse
+import sys
 
 
-def main():
+def main(ruta_registro: str = None, ruta_perfil: str = None):
     """
     Función principal que inicia la aplicación.
+    
+    Args:
+        ruta_registro: Archivo opcional donde anotar las partidas jugadas
+        ruta_perfil: Archivo JSON opcional donde guardar una traza de Chrome
+            con los tiempos de los juegos y del redibujado
+    
+    tkinter y el menú se importan aquí para que importar este módulo no
+    cargue la interfaz gráfica; las vistas de cada juego las importa el
+    menú solo cuando se eligen.
     """
+    import tkinter as tk
+    from vistas.menu_principal import MenuPrincipal
+    
     # Crear ventana principal
     ventana = tk.Tk()
     ventana.title("Paradoja de Monty Hall")
@@ -21,12 +33,38 @@ def main():
     y = (alto_pantalla // 2) - (alto_ventana // 2)
     ventana.geometry(f'{ancho_ventana}x{alto_ventana}+{x}+{y}')
     
+    instrumentacion = None
+    if ruta_perfil:
+        from utils.instrumentacion import Instrumentacion
+        instrumentacion = Instrumentacion()
+        instrumentacion.activar(vistas=True)
+    
+    registro = None
+    if ruta_registro:
+        from utils.registro import EscritorRegistro
+        registro = EscritorRegistro(ruta_registro)
+    
     # Iniciar menú principal
-    MenuPrincipal(ventana)
+    MenuPrincipal(ventana, registro)
     
     # Iniciar loop de la aplicación
-    ventana.mainloop()
+    try:
+        ventana.mainloop()
+    finally:
+        if registro is not None:
+            registro.cerrar()
+        if instrumentacion is not None:
+            instrumentacion.desactivar()
+            instrumentacion.exportar_chrome(ruta_perfil)
+            print(instrumentacion.informe(), file=sys.stderr)
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Paradoja de Monty Hall")
+    parser.add_argument("--registro", metavar="RUTA",
+                        help="archivo binario donde anotar las partidas jugadas")
+    parser.add_argument("--perfil", metavar="RUTA",
+                        help="archivo JSON donde guardar una traza de Chrome "
+                             "con los tiempos de la sesión")
+    args = parser.parse_args()
+    main(args.registro, args.perfil)
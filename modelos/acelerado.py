@@ -0,0 +1,228 @@
+from importlib.util import find_spec
+from typing import Optional
+
+import numpy as np
+from modelos.estrategias import Anfitrion
+from modelos.juego_general import validar_configuracion
+from modelos.simulador import ResultadoSimulacion
+
+# Numba tarda en importarse; solo se comprueba si está instalado y se
+# importa al compilar el primer bucle
+NUMBA_DISPONIBLE = find_spec("numba") is not None
+
+
+# Presentadores por ronda. Reciben la opción ganadora, la elección inicial,
+# una opción sorteada distinta de la elegida, un número en [0, 1), el
+# parámetro del presentador y el número de opciones, y devuelven la opción
+# que queda cerrada (0 si no se ofrece cambiar). Solo usan aritmética para
+# que Numba pueda compilarlos; cualquier función con la misma firma sirve
+# como presentador propio.
+
+def anfitrion_informado(ganadora: int, eleccion: int, otra: int, azar: float,
+                        parametro: float, total_opciones: int) -> int:
+    """Equivalente por ronda de AnfitrionInformado."""
+    if eleccion == ganadora:
+        return otra
+    return ganadora
+
+
+def anfitrion_ignorante(ganadora: int, eleccion: int, otra: int, azar: float,
+                        parametro: float, total_opciones: int) -> int:
+    """Equivalente por ronda de AnfitrionIgnorante."""
+    return otra
+
+
+def anfitrion_sesgado(ganadora: int, eleccion: int, otra: int, azar: float,
+                      parametro: float, total_opciones: int) -> int:
+    """Equivalente por ronda de AnfitrionSesgado (parametro = p)."""
+    if eleccion != ganadora:
+        return ganadora
+    if azar < parametro:
+        if eleccion != total_opciones:
+            return total_opciones
+        return total_opciones - 1
+    return otra
+
+
+def anfitrion_infernal(ganadora: int, eleccion: int, otra: int, azar: float,
+                       parametro: float, total_opciones: int) -> int:
+    """Equivalente por ronda de AnfitrionInfernal."""
+    if eleccion == ganadora:
+        return otra
+    return 0
+
+
+ANFITRIONES_POR_NOMBRE = {
+    "informado": anfitrion_informado,
+    "ignorante": anfitrion_ignorante,
+    "sesgado": anfitrion_sesgado,
+    "menor_indice": anfitrion_sesgado,
+    "infernal": anfitrion_infernal,
+}
+
+
+def _contar_victorias(ganadoras, elecciones, otras, azares, parametro,
+                      total_opciones, elegir_oculta):
+    """
+    Juega un lote ronda a ronda y cuenta las victorias de cada estrategia.
+
+    Returns:
+        Tupla (victorias manteniendo, victorias cambiando)
+    """
+    mantener = 0
+    cambiar = 0
+    for i in range(len(ganadoras)):
+        ganadora = ganadoras[i]
+        eleccion = elecciones[i]
+        if eleccion == ganadora:
+            mantener += 1
+        oculta = elegir_oculta(ganadora, eleccion, otras[i], azares[i],
+                               parametro, total_opciones)
+        # Si no se ofrece cambiar, quien cambiaría se queda con su elección
+        final = oculta if oculta > 0 else eleccion
+        if final == ganadora:
+            cambiar += 1
+    return mantener, cambiar
+
+
+class SimuladorEscalar:
+    """
+    Simulador ronda a ronda con presentadores arbitrarios.
+
+    SimuladorMontyHall y evaluar_lote necesitan expresar cada presentador
+    con operaciones sobre arreglos; aquí el presentador es una función por
+    ronda con ramas normales. Los sorteos se generan por lotes con NumPy y
+    el bucle por ronda se compila con Numba si está instalado; si no, o si
+    Numba no puede compilar un presentador propio, el mismo código se
+    ejecuta en Python sobre listas. Como ambos recorren los mismos sorteos,
+    con la misma semilla dan exactamente el mismo resultado.
+
+    Attributes:
+        total_opciones (int): Número total de opciones en cada ronda
+        elegir_oculta (Callable): Presentador por ronda
+        parametro (float): Parámetro que se pasa al presentador
+        compilar (Optional[bool]): Modo de compilación pedido
+        compilado (bool): Indica si el bucle se ejecuta compilado
+        generador (np.random.Generator): Generador de los sorteos
+    """
+
+    TAMANO_LOTE = 1 << 20
+
+    _compilados = {}
+
+    def __init__(self, total_opciones: int, anfitrion=None, semilla=None,
+                 parametro: float = 0.0, compilar: Optional[bool] = None):
+        """
+        Inicializa el simulador.
+
+        Args:
+            total_opciones: Número total de opciones (mínimo 2)
+            anfitrion: Anfitrion de modelos.estrategias o función por ronda
+                con la firma de anfitrion_informado (por defecto, informado)
+            semilla: Semilla o generador de NumPy para reproducir resultados
+            parametro: Parámetro de un presentador propio (con un Anfitrion
+                se toma de él)
+            compilar: True para exigir Numba, False para usar Python puro,
+                None para compilar solo si Numba está instalado y puede
+                compilar el presentador
+
+        Raises:
+            ValueError: Si la configuración o el presentador no son válidos
+            RuntimeError: Si se pide compilar y Numba no está instalado
+        """
+        validar_configuracion(total_opciones, None)
+        if compilar and not NUMBA_DISPONIBLE:
+            raise RuntimeError("Se pidió compilar pero Numba no está instalado")
+        if anfitrion is None:
+            anfitrion = anfitrion_informado
+        elif isinstance(anfitrion, Anfitrion):
+            funcion = ANFITRIONES_POR_NOMBRE.get(anfitrion.nombre)
+            if funcion is None:
+                raise ValueError(f"Presentador sin versión por ronda: {anfitrion!r}")
+            parametro = float(getattr(anfitrion, "p", parametro))
+            anfitrion = funcion
+        self.total_opciones = total_opciones
+        self.elegir_oculta = anfitrion
+        self.parametro = parametro
+        self.compilar = compilar
+        self.compilado = NUMBA_DISPONIBLE if compilar is None else compilar
+        self.generador = np.random.default_rng(semilla)
+
+    def _bucle(self):
+        """Obtiene el bucle por ronda y el presentador, compilados si toca."""
+        if not self.compilado:
+            return _contar_victorias, self.elegir_oculta
+        from numba import njit
+        compilados = SimuladorEscalar._compilados
+        if _contar_victorias not in compilados:
+            compilados[_contar_victorias] = njit(_contar_victorias)
+        if self.elegir_oculta not in compilados:
+            compilados[self.elegir_oculta] = njit(self.elegir_oculta)
+        return compilados[_contar_victorias], compilados[self.elegir_oculta]
+
+    def _contar(self, sorteos):
+        """
+        Cuenta las victorias de un lote con el bucle que corresponda.
+
+        Numba compila al primer uso, así que un presentador propio que no
+        sabe compilar solo falla aquí; si no se exigió compilar, el lote se
+        repite en Python con los mismos sorteos y los siguientes también.
+
+        Args:
+            sorteos: Tupla (ganadoras, elecciones, otras, azares)
+
+        Returns:
+            Tupla (victorias manteniendo, victorias cambiando)
+        """
+        contar, elegir_oculta = self._bucle()
+        if not self.compilado:
+            # Python recorre listas bastante más rápido que arreglos
+            listas = [arreglo.tolist() for arreglo in sorteos]
+            return contar(*listas, self.parametro, self.total_opciones,
+                          elegir_oculta)
+        from numba.core.errors import NumbaError
+        try:
+            return contar(*sorteos, self.parametro, self.total_opciones,
+                          elegir_oculta)
+        except NumbaError:
+            if self.compilar:
+                raise
+            self.compilado = False
+            return self._contar(sorteos)
+
+    def _sortear_lote(self, rondas: int):
+        """
+        Genera los sorteos de un lote.
+
+        Returns:
+            Tupla (ganadoras, elecciones, otras, azares) de arreglos de NumPy
+        """
+        n = self.total_opciones
+        ganadoras = self.generador.integers(1, n + 1, size=rondas, dtype=np.int64)
+        elecciones = self.generador.integers(1, n + 1, size=rondas, dtype=np.int64)
+        otras = self.generador.integers(1, n, size=rondas, dtype=np.int64)
+        otras += otras >= elecciones
+        azares = self.generador.random(rondas)
+        return ganadoras, elecciones, otras, azares
+
+    def simular(self, rondas: int, tamano_lote: int = None) -> ResultadoSimulacion:
+        """
+        Simula rondas contando las victorias de mantener y de cambiar.
+
+        Args:
+            rondas: Número total de rondas a simular
+            tamano_lote: Rondas por lote (limita el uso de memoria)
+
+        Returns:
+            Conteo total de victorias para cada estrategia
+        """
+        tamano_lote = tamano_lote or self.TAMANO_LOTE
+        resultado = ResultadoSimulacion()
+        restantes = int(rondas)
+        while restantes > 0:
+            lote = min(restantes, tamano_lote)
+            mantener, cambiar = self._contar(self._sortear_lote(lote))
+            resultado = resultado + ResultadoSimulacion(lote, int(mantener),
+                                                        int(cambiar))
+            restantes -= lote
+        return resultado
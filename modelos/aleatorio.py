@@ -0,0 +1,117 @@
+import random
+from typing import List, Sequence
+
+
+class GeneradorNumPy:
+    """
+    Adapta un numpy.random.Generator a la interfaz de random.Random
+    usada por los modelos (randint, choice y random).
+
+    Attributes:
+        generador: Generador de NumPy adaptado
+    """
+
+    def __init__(self, generador):
+        """
+        Inicializa el adaptador.
+
+        Args:
+            generador: Instancia de numpy.random.Generator
+        """
+        self.generador = generador
+
+    def randint(self, a: int, b: int) -> int:
+        """Devuelve un entero aleatorio en el intervalo [a, b]."""
+        return int(self.generador.integers(a, b + 1))
+
+    def choice(self, secuencia: Sequence):
+        """Devuelve un elemento aleatorio de una secuencia no vacía."""
+        return secuencia[int(self.generador.integers(len(secuencia)))]
+
+    def random(self) -> float:
+        """Devuelve un número real aleatorio en [0, 1)."""
+        return float(self.generador.random())
+
+
+class BufferAleatorio:
+    """
+    Fuente de azar que sirve números precalculados en bloque.
+
+    En lugar de una llamada al generador por sorteo, obtiene muchos valores
+    uniformes en [0, 1) de una sola vez y los consume desde una lista, lo
+    que abarata los bucles que hacen muchos sorteos pequeños.
+
+    Attributes:
+        fuente: Generador del que se recargan los valores, o None si el
+            buffer se creó a partir de valores fijos
+        tamano (int): Número de valores que se obtienen en cada recarga
+    """
+
+    def __init__(self, fuente=None, tamano: int = 4096):
+        """
+        Inicializa el buffer.
+
+        Args:
+            fuente: random.Random, numpy.random.Generator o una secuencia de
+                valores en [0, 1) ya generados (None usa un random.Random nuevo)
+            tamano: Valores por recarga cuando la fuente es un generador
+        """
+        self.tamano = tamano
+        self._valores: List[float] = []
+        self._posicion = 0
+        if fuente is None:
+            fuente = random.Random()
+        if hasattr(fuente, "random"):
+            self.fuente = fuente
+        else:
+            self.fuente = None
+            self._valores = [float(v) for v in fuente]
+
+    def _recargar(self):
+        """Obtiene un nuevo bloque de valores de la fuente."""
+        if self.fuente is None:
+            raise ValueError("El buffer de números aleatorios se ha agotado")
+        if hasattr(self.fuente, "integers"):
+            self._valores = self.fuente.random(self.tamano).tolist()
+        else:
+            aleatorio = self.fuente.random
+            self._valores = [aleatorio() for _ in range(self.tamano)]
+        self._posicion = 0
+
+    def random(self) -> float:
+        """Devuelve el siguiente número real del buffer en [0, 1)."""
+        if self._posicion >= len(self._valores):
+            self._recargar()
+        valor = self._valores[self._posicion]
+        self._posicion += 1
+        return valor
+
+    def randint(self, a: int, b: int) -> int:
+        """Devuelve un entero aleatorio en el intervalo [a, b]."""
+        return a + int(self.random() * (b - a + 1))
+
+    def choice(self, secuencia: Sequence):
+        """Devuelve un elemento aleatorio de una secuencia no vacía."""
+        return secuencia[int(self.random() * len(secuencia))]
+
+
+def adaptar_generador(rng=None):
+    """
+    Convierte el generador recibido en un objeto con randint, choice y random.
+
+    Args:
+        rng: None (módulo random global), una semilla entera, un
+            random.Random, un numpy.random.Generator o un BufferAleatorio
+
+    Returns:
+        Objeto generador utilizable por los modelos
+    """
+    if rng is None:
+        return random
+    if isinstance(rng, int):
+        return random.Random(rng)
+    if hasattr(rng, "integers"):
+        return GeneradorNumPy(rng)
+    if hasattr(rng, "randint") and hasattr(rng, "choice"):
+        return rng
+    raise TypeError(f"Generador de números aleatorios no soportado: {rng!r}")
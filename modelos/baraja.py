@@ -0,0 +1,102 @@
+from functools import lru_cache
+from typing import Iterable, Iterator
+
+
+PALOS = ('♠', '♥', '♦', '♣')
+VALORES = ('A', '2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K')
+PALOS_ROJOS = frozenset(('♥', '♦'))
+
+
+class Baraja:
+    """
+    Baraja inmutable con tablas precalculadas por posición.
+
+    El palo, el valor y el color de cada carta se calculan una sola vez al
+    crear la baraja, de modo que consultarlos es una lectura de tabla. Las
+    posiciones empiezan en 1, igual que las opciones de JuegoMontyHall.
+
+    Attributes:
+        cartas (Tuple[str, ...]): Texto de cada carta (p. ej. "10♥")
+        palos (Tuple[int, ...]): Índice del palo de cada carta en PALOS
+            (-1 si el palo no es estándar)
+        valores (Tuple[int, ...]): Índice del valor de cada carta en VALORES
+            (-1 si el valor no es estándar)
+        colores (Tuple[str, ...]): "red" o "black" para cada carta
+    """
+
+    __slots__ = ("cartas", "palos", "valores", "colores")
+
+    def __init__(self, cartas: Iterable[str]):
+        """
+        Crea una baraja a partir del texto de sus cartas.
+
+        Args:
+            cartas: Cartas en orden; el último carácter de cada una es el palo
+        """
+        self.cartas = tuple(cartas)
+        if not self.cartas:
+            raise ValueError("La baraja debe tener al menos una carta")
+        self.palos = tuple(PALOS.index(c[-1]) if c[-1] in PALOS else -1
+                           for c in self.cartas)
+        self.valores = tuple(VALORES.index(c[:-1]) if c[:-1] in VALORES else -1
+                             for c in self.cartas)
+        self.colores = tuple("red" if c[-1] in PALOS_ROJOS else "black"
+                             for c in self.cartas)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def estandar(mazos: int = 1) -> "Baraja":
+        """
+        Obtiene la baraja francesa de 52 cartas, repetida `mazos` veces.
+
+        Las barajas estándar se crean una vez y se comparten.
+
+        Args:
+            mazos: Número de mazos de 52 cartas que se juntan
+
+        Returns:
+            Baraja compartida con 52 * mazos cartas
+        """
+        if mazos < 1:
+            raise ValueError("Se necesita al menos un mazo")
+        mazo = [f"{valor}{palo}" for palo in PALOS for valor in VALORES]
+        return Baraja(mazo * mazos)
+
+    def obtener_carta(self, posicion: int) -> str:
+        """
+        Obtiene la carta en una posición.
+
+        Args:
+            posicion: Posición de la carta (desde 1)
+
+        Returns:
+            String representando la carta
+        """
+        return self.cartas[posicion - 1]
+
+    def obtener_color(self, posicion: int) -> str:
+        """
+        Obtiene el color de la carta en una posición.
+
+        Args:
+            posicion: Posición de la carta (desde 1)
+
+        Returns:
+            "red" o "black"
+        """
+        return self.colores[posicion - 1]
+
+    def __len__(self) -> int:
+        return len(self.cartas)
+
+    def __getitem__(self, indice):
+        return self.cartas[indice]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.cartas)
+
+    def __repr__(self) -> str:
+        return f"Baraja({len(self.cartas)} cartas)"
+
+
+BARAJA_ESTANDAR = Baraja.estandar()
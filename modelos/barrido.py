@@ -0,0 +1,223 @@
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import product
+from typing import Callable, Iterable, List, Optional
+
+import numpy as np
+from modelos import estrategias
+from modelos.estrategias import (Anfitrion, Jugador, ResultadoEstrategias,
+                                 evaluar_lote)
+
+
+def version_codigo() -> str:
+    """
+    Calcula una huella del código que produce los resultados.
+
+    Solo se incluye el código que produce el resultado de una celda
+    (modelos/estrategias.py, donde está evaluar_lote): si cambia, las
+    entradas antiguas de la caché dejan de coincidir, y los cambios en
+    otros módulos no invalidan la caché ni alteran las semillas.
+
+    Returns:
+        Primeros 16 caracteres del SHA-256 del código fuente
+    """
+    huella = hashlib.sha256()
+    with open(estrategias.__file__, "rb") as archivo:
+        huella.update(archivo.read())
+    return huella.hexdigest()[:16]
+
+
+def _evaluar_celda(anfitrion: Anfitrion, jugador: Jugador, total_opciones: int,
+                   rondas: int, semilla: np.random.SeedSequence) -> ResultadoEstrategias:
+    """
+    Evalúa una celda del barrido en un proceso trabajador.
+
+    Args:
+        anfitrion: Comportamiento del presentador
+        jugador: Comportamiento del jugador
+        total_opciones: Número total de opciones
+        rondas: Rondas a simular
+        semilla: Semilla de la celda
+
+    Returns:
+        Resultado de la celda
+    """
+    return evaluar_lote(anfitrion, jugador, total_opciones, rondas, semilla)
+
+
+class CeldaBarrido:
+    """
+    Configuración de una celda del barrido.
+
+    Attributes:
+        total_opciones (int): Número total de opciones
+        anfitrion (Anfitrion): Comportamiento del presentador
+        jugador (Jugador): Comportamiento del jugador
+        rondas (int): Rondas a simular
+    """
+
+    def __init__(self, total_opciones: int, anfitrion: Anfitrion,
+                 jugador: Jugador, rondas: int):
+        """
+        Inicializa la celda.
+
+        Args:
+            total_opciones: Número total de opciones
+            anfitrion: Comportamiento del presentador
+            jugador: Comportamiento del jugador
+            rondas: Rondas a simular
+        """
+        self.total_opciones = total_opciones
+        self.anfitrion = anfitrion
+        self.jugador = jugador
+        self.rondas = rondas
+
+    def configuracion(self, semilla: int, version: Optional[str] = None) -> dict:
+        """
+        Describe la celda de forma estable para usarla como clave.
+
+        Args:
+            semilla: Semilla maestra del barrido
+            version: Versión del código (se omite si es None)
+
+        Returns:
+            Diccionario serializable con la configuración completa
+        """
+        configuracion = {
+            "total_opciones": self.total_opciones,
+            "anfitrion": repr(self.anfitrion),
+            "jugador": repr(self.jugador),
+            "rondas": self.rondas,
+            "semilla": semilla,
+        }
+        if version is not None:
+            configuracion["version"] = version
+        return configuracion
+
+    def __repr__(self) -> str:
+        return (f"CeldaBarrido({self.total_opciones}, {self.anfitrion!r}, "
+                f"{self.jugador!r}, {self.rondas})")
+
+
+class BarridoParametros:
+    """
+    Expande una cuadrícula de configuraciones y la evalúa en paralelo.
+
+    Cada celda terminada se guarda de inmediato en la caché, con una clave
+    que incluye la configuración, la semilla y la versión del código. Al
+    volver a ejecutar un barrido ampliado o interrumpido solo se calculan
+    las celdas que faltan. La semilla de cada celda se deriva de su propia
+    configuración, sin la versión, así que no depende del resto de la
+    cuadrícula y un cambio de código que invalida la caché vuelve a
+    simular con los mismos sorteos.
+
+    Attributes:
+        celdas (List[CeldaBarrido]): Celdas de la cuadrícula, en orden
+        semilla (int): Semilla maestra
+        cache: CacheResultados opcional
+        procesos (int): Número de procesos trabajadores
+        version (str): Versión del código usada en las claves
+    """
+
+    def __init__(self, opciones: Iterable[int], anfitriones: Iterable[Anfitrion],
+                 jugadores: Iterable[Jugador], rondas: Iterable[int],
+                 semilla: int = 0, cache=None, procesos: int = None):
+        """
+        Inicializa el barrido.
+
+        Args:
+            opciones: Valores de total_opciones
+            anfitriones: Comportamientos del presentador
+            jugadores: Comportamientos del jugador
+            rondas: Números de rondas por celda
+            semilla: Semilla maestra
+            cache: CacheResultados donde guardar y buscar celdas
+            procesos: Número de procesos (por defecto, todos los núcleos)
+        """
+        self.celdas = [CeldaBarrido(*valores) for valores in
+                       product(opciones, anfitriones, jugadores, rondas)]
+        self.semilla = semilla
+        self.cache = cache
+        self.procesos = procesos or os.cpu_count() or 1
+        self.version = version_codigo()
+
+    @staticmethod
+    def _resumen(configuracion: dict) -> str:
+        """Hash estable de una configuración."""
+        texto = json.dumps(configuracion, sort_keys=True)
+        return hashlib.sha256(texto.encode()).hexdigest()
+
+    def _clave(self, celda: CeldaBarrido) -> str:
+        """Clave de caché de una celda."""
+        return self._resumen(celda.configuracion(self.semilla, self.version))
+
+    def _semilla_celda(self, celda: CeldaBarrido) -> np.random.SeedSequence:
+        """Semilla independiente derivada de la configuración de la celda."""
+        resumen = self._resumen(celda.configuracion(self.semilla))
+        return np.random.SeedSequence([self.semilla, int(resumen[:16], 16)])
+
+    def ejecutar(self, progreso: Optional[Callable[[ResultadoEstrategias, int, int], None]] = None
+                 ) -> List[ResultadoEstrategias]:
+        """
+        Evalúa todas las celdas, reutilizando las que estén en la caché.
+
+        Args:
+            progreso: Función opcional llamada al terminar cada celda con
+                (resultado, celdas terminadas, total de celdas)
+
+        Returns:
+            Resultados en el mismo orden que las celdas
+        """
+        resultados: List[Optional[ResultadoEstrategias]] = [None] * len(self.celdas)
+        pendientes = []
+        terminadas = 0
+
+        for i, celda in enumerate(self.celdas):
+            clave = self._clave(celda)
+            guardado = (self.cache.obtener(clave)
+                        if self.cache is not None else None)
+            if guardado is None:
+                pendientes.append((i, clave))
+                continue
+            resultados[i] = ResultadoEstrategias(
+                celda.anfitrion, celda.jugador, celda.total_opciones, *guardado)
+            terminadas += 1
+            if progreso:
+                progreso(resultados[i], terminadas, len(self.celdas))
+
+        def completar(i, clave, resultado):
+            nonlocal terminadas
+            resultados[i] = resultado
+            terminadas += 1
+            if self.cache is not None:
+                celda = self.celdas[i]
+                self.cache.guardar(clave,
+                                   celda.configuracion(self.semilla, self.version),
+                                   resultado.rondas, resultado.victorias)
+            if progreso:
+                progreso(resultado, terminadas, len(self.celdas))
+
+        if self.procesos == 1 or len(pendientes) <= 1:
+            for i, clave in pendientes:
+                celda = self.celdas[i]
+                completar(i, clave, _evaluar_celda(
+                    celda.anfitrion, celda.jugador, celda.total_opciones,
+                    celda.rondas, self._semilla_celda(celda)))
+            return resultados
+
+        with ProcessPoolExecutor(max_workers=min(self.procesos,
+                                                 len(pendientes))) as ejecutor:
+            futuros = {}
+            for i, clave in pendientes:
+                celda = self.celdas[i]
+                futuro = ejecutor.submit(
+                    _evaluar_celda, celda.anfitrion, celda.jugador,
+                    celda.total_opciones, celda.rondas,
+                    self._semilla_celda(celda))
+                futuros[futuro] = (i, clave)
+            for futuro in as_completed(futuros):
+                i, clave = futuros[futuro]
+                completar(i, clave, futuro.result())
+        return resultados
@@ -0,0 +1,126 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, List, Optional
+
+import numpy as np
+from modelos.juego_general import validar_configuracion
+from modelos.simulador import ResultadoSimulacion, SimuladorMontyHall
+
+
+def _simular_fragmento(total_opciones: int, semilla: np.random.SeedSequence,
+                       rondas: int, reveladas: int = None) -> ResultadoSimulacion:
+    """
+    Simula un fragmento en un proceso trabajador.
+
+    Args:
+        total_opciones: Número total de opciones en cada ronda
+        semilla: Semilla independiente del fragmento
+        rondas: Número de rondas del fragmento
+        reveladas: Opciones que abre el presentador (por defecto N - 2)
+
+    Returns:
+        Conteo de victorias del fragmento
+    """
+    return SimuladorMontyHall(total_opciones, semilla,
+                              reveladas).simular(rondas)
+
+
+class EjecutorParalelo:
+    """
+    Reparte una simulación grande entre varios procesos.
+
+    La simulación se divide en fragmentos de tamaño fijo y cada fragmento
+    recibe su propio generador, derivado de una semilla maestra con
+    SeedSequence.spawn. Como la división no depende del número de procesos,
+    la misma semilla produce exactamente los mismos totales con cualquier
+    cantidad de trabajadores y en cada llamada a ejecutar. Los totales sí
+    dependen de rondas_por_fragmento: cambiarlo cambia la división y, con
+    ella, los sorteos de cada fragmento.
+
+    Attributes:
+        total_opciones (int): Número total de opciones en cada ronda
+        reveladas (int): Opciones que abre el presentador en cada ronda
+        semilla (np.random.SeedSequence): Semilla maestra de la simulación
+        procesos (int): Número de procesos trabajadores
+        rondas_por_fragmento (int): Rondas que simula cada fragmento
+    """
+
+    RONDAS_POR_FRAGMENTO = 1 << 24
+
+    def __init__(self, total_opciones: int, semilla=None, procesos: int = None,
+                 rondas_por_fragmento: int = None, reveladas: int = None):
+        """
+        Inicializa el ejecutor.
+
+        Args:
+            total_opciones: Número total de opciones en cada ronda
+            semilla: Semilla maestra (None para usar entropía del sistema)
+            procesos: Número de procesos (por defecto, todos los núcleos)
+            rondas_por_fragmento: Rondas por fragmento
+            reveladas: Opciones que abre el presentador (por defecto N - 2)
+        """
+        self.reveladas = validar_configuracion(total_opciones, reveladas)
+        self.total_opciones = total_opciones
+        self.semilla = np.random.SeedSequence(semilla)
+        self.procesos = procesos or os.cpu_count() or 1
+        self.rondas_por_fragmento = (rondas_por_fragmento
+                                     or self.RONDAS_POR_FRAGMENTO)
+
+    def _dividir(self, rondas: int) -> List[int]:
+        """
+        Divide las rondas en fragmentos de tamaño fijo.
+
+        Args:
+            rondas: Número total de rondas
+
+        Returns:
+            Lista con las rondas de cada fragmento
+        """
+        completos, resto = divmod(int(rondas), self.rondas_por_fragmento)
+        fragmentos = [self.rondas_por_fragmento] * completos
+        if resto:
+            fragmentos.append(resto)
+        return fragmentos
+
+    def ejecutar(self, rondas: int,
+                 progreso: Optional[Callable[[ResultadoSimulacion, int, int], None]] = None
+                 ) -> ResultadoSimulacion:
+        """
+        Ejecuta la simulación repartiendo los fragmentos entre los procesos.
+
+        Args:
+            rondas: Número total de rondas a simular
+            progreso: Función opcional llamada al terminar cada fragmento con
+                (resultado acumulado, fragmentos terminados, total de fragmentos)
+
+        Returns:
+            Conteo total de victorias para cada estrategia
+        """
+        fragmentos = self._dividir(rondas)
+        # spawn avanza el contador de la semilla maestra; se deriva de una
+        # copia para que cada llamada reparta las mismas semillas
+        maestra = np.random.SeedSequence(self.semilla.entropy,
+                                         spawn_key=self.semilla.spawn_key)
+        semillas = maestra.spawn(len(fragmentos))
+        resultado = ResultadoSimulacion()
+
+        if self.procesos == 1 or len(fragmentos) <= 1:
+            for i, (semilla, tamano) in enumerate(zip(semillas, fragmentos), 1):
+                resultado = resultado + _simular_fragmento(
+                    self.total_opciones, semilla, tamano, self.reveladas)
+                if progreso:
+                    progreso(resultado, i, len(fragmentos))
+            return resultado
+
+        procesos = min(self.procesos, len(fragmentos))
+        with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+            futuros = [
+                ejecutor.submit(_simular_fragmento, self.total_opciones,
+                                semilla, tamano, self.reveladas)
+                for semilla, tamano in zip(semillas, fragmentos)
+            ]
+            for i, futuro in enumerate(as_completed(futuros), 1):
+                resultado = resultado + futuro.result()
+                if progreso:
+                    progreso(resultado, i, len(fragmentos))
+        return resultado
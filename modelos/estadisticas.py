@@ -0,0 +1,194 @@
+from math import sqrt
+from statistics import NormalDist
+from typing import Tuple
+from modelos.juego_base import JuegoMontyHall
+
+
+def valor_z(confianza: float) -> float:
+    """
+    Obtiene el cuantil normal para un intervalo bilateral.
+
+    Args:
+        confianza: Nivel de confianza (p. ej. 0.95)
+
+    Returns:
+        Valor z tal que P(|Z| <= z) = confianza
+    """
+    return NormalDist().inv_cdf(0.5 + confianza / 2)
+
+
+class AcumuladorProporcion:
+    """
+    Estadístico en línea de una proporción de victorias.
+
+    Mantiene la media y la suma de cuadrados de las desviaciones con el
+    algoritmo de Welford, en memoria constante. Dos acumuladores se pueden
+    combinar (fórmula de Chan), lo que permite agregar fragmentos calculados
+    en procesos distintos. El número de victorias se cuenta aparte como
+    entero, para no reconstruirlo a partir de la media en coma flotante.
+
+    Attributes:
+        n (int): Número de observaciones
+        victorias (int): Número exacto de victorias
+        media (float): Proporción de victorias
+        m2 (float): Suma de cuadrados de las desviaciones respecto a la media
+    """
+
+    __slots__ = ("n", "victorias", "media", "m2")
+
+    def __init__(self):
+        """Inicializa un acumulador vacío."""
+        self.n = 0
+        self.victorias = 0
+        self.media = 0.0
+        self.m2 = 0.0
+
+    def agregar(self, valor: float):
+        """
+        Añade una observación (1 victoria, 0 derrota).
+
+        Args:
+            valor: Valor observado
+        """
+        self.n += 1
+        if valor:
+            self.victorias += 1
+        delta = valor - self.media
+        self.media += delta / self.n
+        self.m2 += delta * (valor - self.media)
+
+    def agregar_lote(self, partidas: int, victorias: int):
+        """
+        Añade de una vez un lote de partidas ya contadas.
+
+        Args:
+            partidas: Número de partidas del lote
+            victorias: Victorias en el lote
+        """
+        if partidas <= 0:
+            return
+        lote = AcumuladorProporcion()
+        lote.n = partidas
+        lote.victorias = victorias
+        lote.media = victorias / partidas
+        lote.m2 = victorias * (1 - lote.media)
+        self.combinar(lote)
+
+    def combinar(self, otro: "AcumuladorProporcion"):
+        """
+        Incorpora las observaciones de otro acumulador.
+
+        Args:
+            otro: Acumulador a combinar con este
+        """
+        if otro.n == 0:
+            return
+        total = self.n + otro.n
+        delta = otro.media - self.media
+        self.media += delta * otro.n / total
+        self.m2 += otro.m2 + delta * delta * self.n * otro.n / total
+        self.n = total
+        self.victorias += otro.victorias
+
+    @property
+    def varianza(self) -> float:
+        """Varianza muestral de las observaciones."""
+        return self.m2 / (self.n - 1) if self.n > 1 else 0.0
+
+    def intervalo_wilson(self, confianza: float = 0.95) -> Tuple[float, float]:
+        """
+        Calcula el intervalo de confianza de Wilson para la proporción.
+
+        Args:
+            confianza: Nivel de confianza
+
+        Returns:
+            Tupla (límite inferior, límite superior)
+        """
+        if self.n == 0:
+            return 0.0, 1.0
+        z = valor_z(confianza)
+        z2_n = z * z / self.n
+        centro = (self.media + z2_n / 2) / (1 + z2_n)
+        margen = (z / (1 + z2_n)) * sqrt(
+            self.media * (1 - self.media) / self.n + z2_n / (4 * self.n))
+        return max(0.0, centro - margen), min(1.0, centro + margen)
+
+    def semiancho(self, confianza: float = 0.95) -> float:
+        """
+        Obtiene la mitad del ancho del intervalo de Wilson.
+
+        Args:
+            confianza: Nivel de confianza
+
+        Returns:
+            Semiancho del intervalo
+        """
+        inferior, superior = self.intervalo_wilson(confianza)
+        return (superior - inferior) / 2
+
+
+class EstadisticasMontyHall:
+    """
+    Agrega resultados de partidas para las estrategias mantener y cambiar.
+
+    Acepta partidas sueltas (instancias de JuegoMontyHall ya terminadas) o
+    resultados por lotes del simulador.
+
+    Attributes:
+        mantener (AcumuladorProporcion): Victorias manteniendo la elección
+        cambiar (AcumuladorProporcion): Victorias cambiando de elección
+    """
+
+    def __init__(self):
+        """Inicializa las estadísticas vacías."""
+        self.mantener = AcumuladorProporcion()
+        self.cambiar = AcumuladorProporcion()
+
+    def registrar_partida(self, juego: JuegoMontyHall, cambio: bool):
+        """
+        Añade el resultado de una partida terminada.
+
+        Args:
+            juego: Juego en el que ya se tomó la decisión final
+            cambio: True si el usuario cambió de elección
+        """
+        acumulador = self.cambiar if cambio else self.mantener
+        acumulador.agregar(1.0 if juego.verificar_victoria() else 0.0)
+
+    def agregar_resultado(self, resultado):
+        """
+        Añade un resultado por lotes del simulador.
+
+        Args:
+            resultado: ResultadoSimulacion con las victorias de cada estrategia
+        """
+        self.mantener.agregar_lote(resultado.rondas, resultado.victorias_mantener)
+        self.cambiar.agregar_lote(resultado.rondas, resultado.victorias_cambiar)
+
+    def combinar(self, otras: "EstadisticasMontyHall"):
+        """
+        Incorpora las estadísticas de otro fragmento.
+
+        Args:
+            otras: Estadísticas a combinar con estas
+        """
+        self.mantener.combinar(otras.mantener)
+        self.cambiar.combinar(otras.cambiar)
+
+    def precision_alcanzada(self, semiancho: float,
+                            confianza: float = 0.95) -> bool:
+        """
+        Indica si los intervalos de ambas estrategias son suficientemente
+        estrechos. Las estrategias sin partidas no se tienen en cuenta.
+
+        Args:
+            semiancho: Semiancho máximo permitido para cada intervalo
+            confianza: Nivel de confianza
+
+        Returns:
+            True si se alcanzó la precisión pedida
+        """
+        acumuladores = [a for a in (self.mantener, self.cambiar) if a.n > 0]
+        return bool(acumuladores) and all(
+            a.semiancho(confianza) <= semiancho for a in acumuladores)
@@ -0,0 +1,450 @@
+from abc import ABC, abstractmethod
+from fractions import Fraction
+from typing import Iterable, List, Optional
+
+from modelos.estadisticas import AcumuladorProporcion
+from modelos.juego_base import JuegoMontyHall
+from modelos.probabilidad_exacta import probabilidades_exactas
+
+
+class Anfitrion(ABC):
+    """
+    Comportamiento del presentador.
+
+    Como en JuegoPuertas y JuegoCartas, el presentador abre todas las
+    opciones no elegidas menos una; cada estrategia decide cuál queda
+    cerrada. Se implementa dos veces: por partida, sobre un JuegoMontyHall,
+    y por lotes, sobre arreglos de NumPy.
+
+    Attributes:
+        nombre (str): Nombre del comportamiento para el cálculo exacto
+    """
+
+    nombre = ""
+
+    @abstractmethod
+    def elegir_oculta(self, juego: JuegoMontyHall) -> Optional[int]:
+        """
+        Elige la opción que queda cerrada además de la elegida.
+
+        Args:
+            juego: Juego con la elección inicial ya registrada
+
+        Returns:
+            Opción que queda cerrada, o None si no se ofrece cambiar
+        """
+
+    @abstractmethod
+    def elegir_ocultas_lote(self, ganadoras, elecciones, total_opciones: int,
+                            generador):
+        """
+        Elige la opción que queda cerrada en cada ronda de un lote.
+
+        Args:
+            ganadoras: Opciones ganadoras de cada ronda
+            elecciones: Elecciones iniciales de cada ronda
+            total_opciones: Número total de opciones
+            generador: numpy.random.Generator
+
+        Returns:
+            Arreglo con la opción cerrada de cada ronda (0 si no se ofrece cambiar)
+        """
+
+    def probabilidades_exactas(self, total_opciones: int):
+        """
+        Obtiene las probabilidades exactas de mantener y de cambiar.
+
+        Args:
+            total_opciones: Número total de opciones
+
+        Returns:
+            Tupla de Fraction (probabilidad al mantener, probabilidad al cambiar)
+        """
+        return probabilidades_exactas(total_opciones, None, self.nombre)
+
+    @staticmethod
+    def _otra_opcion(juego: JuegoMontyHall) -> int:
+        """Sortea una opción distinta de la elegida."""
+        opcion = juego.rng.randint(1, juego.total_opciones - 1)
+        return opcion + (opcion >= juego.eleccion_usuario)
+
+    @staticmethod
+    def _otras_opciones_lote(elecciones, total_opciones: int, generador):
+        """Sortea en cada ronda una opción distinta de la elegida."""
+        opciones = generador.integers(1, total_opciones, size=len(elecciones),
+                                      dtype=elecciones.dtype)
+        return opciones + (opciones >= elecciones)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+    def __eq__(self, otro) -> bool:
+        return type(self) is type(otro) and repr(self) == repr(otro)
+
+    def __hash__(self) -> int:
+        return hash(repr(self))
+
+
+class AnfitrionInformado(Anfitrion):
+    """Conoce la ganadora y abre solo perdedoras, al azar (juego clásico)."""
+
+    nombre = "informado"
+
+    def elegir_oculta(self, juego):
+        if juego.eleccion_usuario == juego.opcion_ganadora:
+            return self._otra_opcion(juego)
+        return juego.opcion_ganadora
+
+    def elegir_ocultas_lote(self, ganadoras, elecciones, total_opciones, generador):
+        import numpy as np
+        otras = self._otras_opciones_lote(elecciones, total_opciones, generador)
+        return np.where(ganadoras == elecciones, otras, ganadoras)
+
+
+class AnfitrionIgnorante(Anfitrion):
+    """No sabe dónde está el premio y abre opciones al azar; si descubre la
+    ganadora, la ronda se pierde con cualquier estrategia."""
+
+    nombre = "ignorante"
+
+    def elegir_oculta(self, juego):
+        return self._otra_opcion(juego)
+
+    def elegir_ocultas_lote(self, ganadoras, elecciones, total_opciones, generador):
+        return self._otras_opciones_lote(elecciones, total_opciones, generador)
+
+
+class AnfitrionSesgado(Anfitrion):
+    """
+    Informado, pero cuando el usuario eligió la ganadora prefiere abrir las
+    opciones de menor número: con probabilidad p deja cerrada la de mayor
+    número y en otro caso elige al azar.
+
+    Attributes:
+        p (float): Probabilidad de dejar cerrada la opción de mayor número
+    """
+
+    nombre = "sesgado"
+
+    def __init__(self, p: float = 0.5):
+        """
+        Inicializa el presentador sesgado.
+
+        Args:
+            p: Probabilidad de dejar cerrada la opción de mayor número
+        """
+        self.p = p
+
+    def elegir_oculta(self, juego):
+        if juego.eleccion_usuario != juego.opcion_ganadora:
+            return juego.opcion_ganadora
+        if juego.rng.random() < self.p:
+            mayor = juego.total_opciones
+            return mayor if juego.eleccion_usuario != mayor else mayor - 1
+        return self._otra_opcion(juego)
+
+    def elegir_ocultas_lote(self, ganadoras, elecciones, total_opciones, generador):
+        import numpy as np
+        otras = self._otras_opciones_lote(elecciones, total_opciones, generador)
+        mayores = np.where(elecciones == total_opciones,
+                           total_opciones - 1, total_opciones)
+        sesgadas = generador.random(len(elecciones)) < self.p
+        ocultas = np.where(sesgadas, mayores, otras)
+        return np.where(ganadoras == elecciones, ocultas, ganadoras)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(p={self.p!r})"
+
+
+class AnfitrionMenorIndice(AnfitrionSesgado):
+    """Informado que siempre abre las perdedoras de menor número."""
+
+    nombre = "menor_indice"
+
+    def __init__(self):
+        """Inicializa el presentador con sesgo total (p = 1)."""
+        super().__init__(1.0)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class AnfitrionInfernal(Anfitrion):
+    """"Monty from Hell": solo ofrece cambiar cuando el usuario eligió la
+    ganadora."""
+
+    nombre = "infernal"
+
+    def elegir_oculta(self, juego):
+        if juego.eleccion_usuario == juego.opcion_ganadora:
+            return self._otra_opcion(juego)
+        return None
+
+    def elegir_ocultas_lote(self, ganadoras, elecciones, total_opciones, generador):
+        import numpy as np
+        otras = self._otras_opciones_lote(elecciones, total_opciones, generador)
+        return np.where(ganadoras == elecciones, otras, 0)
+
+
+class Jugador(ABC):
+    """
+    Comportamiento del jugador ante la oferta de cambiar.
+
+    Attributes:
+        probabilidad_cambio (float): Probabilidad de cambiar de elección
+    """
+
+    @property
+    @abstractmethod
+    def probabilidad_cambio(self) -> float:
+        """Probabilidad de cambiar de elección (0 o 1 si es determinista)."""
+
+    def decidir_cambio(self, juego: JuegoMontyHall) -> bool:
+        """
+        Decide si cambiar de elección en una partida.
+
+        Args:
+            juego: Juego en el que ya se reveló la opción del presentador
+
+        Returns:
+            True si el jugador cambia
+        """
+        if self.probabilidad_cambio in (0.0, 1.0):
+            return bool(self.probabilidad_cambio)
+        return juego.rng.random() < self.probabilidad_cambio
+
+    def decidir_cambios_lote(self, rondas: int, generador):
+        """
+        Decide si cambiar de elección en cada ronda de un lote.
+
+        Args:
+            rondas: Número de rondas del lote
+            generador: numpy.random.Generator
+
+        Returns:
+            Arreglo booleano, True en las rondas en que se cambia
+        """
+        import numpy as np
+        if self.probabilidad_cambio in (0.0, 1.0):
+            return np.full(rondas, bool(self.probabilidad_cambio))
+        return generador.random(rondas) < self.probabilidad_cambio
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+    def __eq__(self, otro) -> bool:
+        return type(self) is type(otro) and repr(self) == repr(otro)
+
+    def __hash__(self) -> int:
+        return hash(repr(self))
+
+
+class JugadorMantener(Jugador):
+    """Nunca cambia de elección."""
+
+    probabilidad_cambio = 0.0
+
+
+class JugadorCambiar(Jugador):
+    """Siempre cambia de elección."""
+
+    probabilidad_cambio = 1.0
+
+
+class JugadorMixto(Jugador):
+    """
+    Cambia de elección con probabilidad p.
+
+    Attributes:
+        p (float): Probabilidad de cambiar de elección
+    """
+
+    def __init__(self, p: float):
+        """
+        Inicializa el jugador mixto.
+
+        Args:
+            p: Probabilidad de cambiar de elección
+        """
+        self.p = p
+
+    @property
+    def probabilidad_cambio(self) -> float:
+        """Probabilidad de cambiar de elección."""
+        return self.p
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(p={self.p!r})"
+
+
+class JugadorAleatorio(JugadorMixto):
+    """Cambia o mantiene a cara o cruz."""
+
+    def __init__(self):
+        """Inicializa el jugador con p = 0.5."""
+        super().__init__(0.5)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class ResultadoEstrategias:
+    """
+    Resultado de enfrentar un presentador y un jugador durante varias rondas.
+
+    Attributes:
+        anfitrion (Anfitrion): Comportamiento del presentador
+        jugador (Jugador): Comportamiento del jugador
+        total_opciones (int): Número total de opciones
+        rondas (int): Número de rondas jugadas
+        victorias (int): Rondas ganadas por el jugador
+    """
+
+    def __init__(self, anfitrion: Anfitrion, jugador: Jugador,
+                 total_opciones: int, rondas: int = 0, victorias: int = 0):
+        """
+        Inicializa el resultado.
+
+        Args:
+            anfitrion: Comportamiento del presentador
+            jugador: Comportamiento del jugador
+            total_opciones: Número total de opciones
+            rondas: Número de rondas jugadas
+            victorias: Rondas ganadas por el jugador
+        """
+        self.anfitrion = anfitrion
+        self.jugador = jugador
+        self.total_opciones = total_opciones
+        self.rondas = rondas
+        self.victorias = victorias
+
+    @property
+    def tasa(self) -> float:
+        """Proporción de rondas ganadas."""
+        return self.victorias / self.rondas if self.rondas else 0.0
+
+    def intervalo_wilson(self, confianza: float = 0.95):
+        """
+        Calcula el intervalo de Wilson de la tasa de victorias.
+
+        Args:
+            confianza: Nivel de confianza
+
+        Returns:
+            Tupla (límite inferior, límite superior)
+        """
+        acumulador = AcumuladorProporcion()
+        acumulador.agregar_lote(self.rondas, self.victorias)
+        return acumulador.intervalo_wilson(confianza)
+
+    def probabilidad_exacta(self) -> Fraction:
+        """Probabilidad exacta de ganar con esta pareja de estrategias."""
+        mantener, cambiar = self.anfitrion.probabilidades_exactas(self.total_opciones)
+        q = Fraction(self.jugador.probabilidad_cambio)
+        return (1 - q) * mantener + q * cambiar
+
+    def __repr__(self) -> str:
+        return (f"ResultadoEstrategias({self.anfitrion!r}, {self.jugador!r}, "
+                f"total_opciones={self.total_opciones}, rondas={self.rondas}, "
+                f"victorias={self.victorias})")
+
+
+def jugar_partida(juego: JuegoMontyHall, anfitrion: Anfitrion,
+                  jugador: Jugador) -> bool:
+    """
+    Juega una partida completa sobre un juego con las estrategias dadas.
+
+    Si el usuario todavía no eligió, se elige una opción al azar. Los
+    presentadores abren todas las opciones no elegidas menos una, así que
+    no se admiten juegos generalizados en los que se abren menos.
+
+    Args:
+        juego: Juego recién creado o reiniciado
+        anfitrion: Comportamiento del presentador
+        jugador: Comportamiento del jugador
+
+    Returns:
+        True si el jugador gana
+
+    Raises:
+        ValueError: Si el juego abre menos de N - 2 opciones
+    """
+    reveladas = getattr(juego, "reveladas", juego.total_opciones - 2)
+    if reveladas != juego.total_opciones - 2:
+        raise ValueError(
+            f"Las estrategias abren {juego.total_opciones - 2} opciones, "
+            f"pero el juego abre {reveladas}"
+        )
+    if juego.eleccion_usuario is None:
+        juego.seleccionar_opcion(juego.rng.randint(1, juego.total_opciones))
+    eleccion = juego.eleccion_usuario
+    oculta = anfitrion.elegir_oculta(juego)
+    if oculta is not None:
+        juego.opciones_reveladas = [
+            i for i in range(1, juego.total_opciones + 1)
+            if i != eleccion and i != oculta
+        ]
+        if jugador.decidir_cambio(juego):
+            juego.eleccion_usuario = oculta
+    return juego.verificar_victoria()
+
+
+def evaluar_lote(anfitrion: Anfitrion, jugador: Jugador, total_opciones: int,
+                 rondas: int, semilla=None,
+                 tamano_lote: int = 1 << 20) -> ResultadoEstrategias:
+    """
+    Evalúa una pareja de estrategias con la implementación por lotes.
+
+    Args:
+        anfitrion: Comportamiento del presentador
+        jugador: Comportamiento del jugador
+        total_opciones: Número total de opciones
+        rondas: Número de rondas a simular
+        semilla: Semilla o generador de NumPy
+        tamano_lote: Rondas por lote (limita el uso de memoria)
+
+    Returns:
+        Rondas jugadas y victorias del jugador
+    """
+    import numpy as np
+    generador = np.random.default_rng(semilla)
+    resultado = ResultadoEstrategias(anfitrion, jugador, total_opciones)
+    restantes = int(rondas)
+    while restantes > 0:
+        lote = min(restantes, tamano_lote)
+        ganadoras = generador.integers(1, total_opciones + 1, size=lote,
+                                       dtype=np.int32)
+        elecciones = generador.integers(1, total_opciones + 1, size=lote,
+                                        dtype=np.int32)
+        ocultas = anfitrion.elegir_ocultas_lote(ganadoras, elecciones,
+                                                total_opciones, generador)
+        cambios = jugador.decidir_cambios_lote(lote, generador) & (ocultas > 0)
+        finales = np.where(cambios, ocultas, elecciones)
+        resultado.rondas += lote
+        resultado.victorias += int(np.count_nonzero(finales == ganadoras))
+        restantes -= lote
+    return resultado
+
+
+def barrer_estrategias(anfitriones: Iterable[Anfitrion],
+                       jugadores: Iterable[Jugador], total_opciones: int,
+                       rondas: int, semilla=None) -> List[ResultadoEstrategias]:
+    """
+    Evalúa todas las parejas presentador-jugador con la implementación por
+    lotes. Cada pareja usa un generador independiente derivado de la semilla.
+
+    Args:
+        anfitriones: Comportamientos del presentador
+        jugadores: Comportamientos del jugador
+        total_opciones: Número total de opciones
+        rondas: Rondas por pareja
+        semilla: Semilla maestra
+
+    Returns:
+        Lista de resultados, uno por pareja
+    """
+    import numpy as np
+    parejas = [(a, j) for a in anfitriones for j in jugadores]
+    semillas = np.random.SeedSequence(semilla).spawn(len(parejas))
+    return [evaluar_lote(anfitrion, jugador, total_opciones, rondas, s)
+            for (anfitrion, jugador), s in zip(parejas, semillas)]
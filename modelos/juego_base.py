@@ -1,5 +1,5 @@
-import random
-from typing import List
+from typing import Iterable, List, Tuple
+from modelos.aleatorio import adaptar_generador
 
 
 class JuegoMontyHall:
@@ -10,20 +10,32 @@ class JuegoMontyHall:
         total_opciones (int): Número total de opciones en el juego
         opcion_ganadora (int): Opción que contiene el premio
         eleccion_usuario (int): Opción elegida por el usuario
-        opciones_reveladas (List[int]): Opciones que han sido reveladas
+        opciones_reveladas (Tuple[int, ...]): Opciones que han sido reveladas
+        rng: Generador de números aleatorios usado por el juego
+    
+    Para que millones de partidas quepan en memoria, el estado se guarda en
+    __slots__ y las opciones reveladas en una máscara de bits; la tupla
+    opciones_reveladas se construye a partir de ella cuando se consulta.
     """
     
-    def __init__(self, total_opciones: int):
+    __slots__ = ("rng", "total_opciones", "opcion_ganadora",
+                 "eleccion_usuario", "_mascara_reveladas")
+    
+    def __init__(self, total_opciones: int, rng=None):
         """
         Inicializa el juego con el número total de opciones.
         
         Args:
             total_opciones: Número total de opciones disponibles
+            rng: Generador de números aleatorios (random.Random,
+                numpy.random.Generator, BufferAleatorio o semilla entera).
+                Si es None se usa el módulo random global.
         """
+        self.rng = adaptar_generador(rng)
         self.total_opciones = total_opciones
-        self.opcion_ganadora = random.randint(1, total_opciones)
+        self.opcion_ganadora = self.rng.randint(1, total_opciones)
         self.eleccion_usuario = None
-        self.opciones_reveladas = []
+        self.opciones_reveladas = ()
         
     def seleccionar_opcion(self, opcion: int) -> bool:
         """
@@ -40,6 +52,42 @@ class JuegoMontyHall:
             return True
         return False
     
+    @property
+    def opciones_reveladas(self) -> Tuple[int, ...]:
+        """
+        Tupla ordenada de opciones reveladas.
+        
+        Se construye en cada consulta, así que es inmutable para que
+        modificarla falle en lugar de no tener efecto; para cambiar las
+        opciones reveladas se asigna una secuencia nueva.
+        """
+        opciones = []
+        mascara = self._mascara_reveladas
+        while mascara:
+            bit = mascara & -mascara
+            opciones.append(bit.bit_length() - 1)
+            mascara ^= bit
+        return tuple(opciones)
+    
+    @opciones_reveladas.setter
+    def opciones_reveladas(self, opciones: Iterable[int]):
+        mascara = 0
+        for opcion in opciones:
+            mascara |= 1 << opcion
+        self._mascara_reveladas = mascara
+    
+    def esta_revelada(self, opcion: int) -> bool:
+        """
+        Indica si una opción ya fue revelada.
+        
+        Args:
+            opcion: Número de la opción
+            
+        Returns:
+            True si la opción está revelada
+        """
+        return bool(self._mascara_reveladas >> opcion & 1)
+    
     def _obtener_opciones_perdedoras(self) -> List[int]:
         """
         Obtiene la lista de opciones que no son ganadoras.
@@ -61,6 +109,73 @@ class JuegoMontyHall:
     
     def reiniciar(self):
         """Reinicia el juego con nuevos valores aleatorios."""
-        self.opcion_ganadora = random.randint(1, self.total_opciones)
+        self.opcion_ganadora = self.rng.randint(1, self.total_opciones)
         self.eleccion_usuario = None
-        self.opciones_reveladas = []
+        self.opciones_reveladas = ()
+        
+    def _capturar_reveladas(self, ancho: int) -> bytes:
+        """
+        Serializa las opciones reveladas como máscara de bits.
+        
+        Args:
+            ancho: Bytes por opción (no se usa con la máscara)
+            
+        Returns:
+            Máscara de total_opciones // 8 + 1 bytes
+        """
+        return self._mascara_reveladas.to_bytes(self.total_opciones // 8 + 1,
+                                                "little")
+    
+    def _restaurar_reveladas(self, datos: bytes, ancho: int):
+        """
+        Recupera las opciones reveladas guardadas por _capturar_reveladas.
+        
+        Args:
+            datos: Bytes de las opciones reveladas
+            ancho: Bytes por opción
+            
+        Raises:
+            ValueError: Si el tamaño no corresponde a este juego
+        """
+        if len(datos) != self.total_opciones // 8 + 1:
+            raise ValueError(
+                f"Máscara de {len(datos)} bytes incompatible con un juego "
+                f"de {self.total_opciones} opciones"
+            )
+        self._mascara_reveladas = int.from_bytes(datos, "little")
+    
+    def capturar_estado(self) -> bytes:
+        """
+        Serializa el estado de la partida en unos pocos bytes.
+        
+        Se guardan la opción ganadora y la elección (con los bytes justos
+        para total_opciones, 0 si no hay elección) y las opciones reveladas
+        según _capturar_reveladas. Con 3 puertas ocupa 3 bytes y con 52
+        cartas 9. La configuración del juego (clase, baraja, generador) no
+        se guarda: el estado se restaura sobre un juego del mismo tipo.
+        
+        Returns:
+            Estado serializado
+        """
+        ancho = (self.total_opciones.bit_length() + 7) // 8
+        return (self.opcion_ganadora.to_bytes(ancho, "little")
+                + (self.eleccion_usuario or 0).to_bytes(ancho, "little")
+                + self._capturar_reveladas(ancho))
+    
+    def restaurar_estado(self, estado: bytes):
+        """
+        Recupera un estado obtenido con capturar_estado.
+        
+        Args:
+            estado: Estado serializado de un juego con las mismas opciones
+            
+        Raises:
+            ValueError: Si el estado no corresponde a este juego
+        """
+        ancho = (self.total_opciones.bit_length() + 7) // 8
+        if len(estado) < 2 * ancho:
+            raise ValueError(f"Estado de {len(estado)} bytes demasiado corto")
+        self._restaurar_reveladas(estado[2 * ancho:], ancho)
+        self.opcion_ganadora = int.from_bytes(estado[:ancho], "little")
+        self.eleccion_usuario = (int.from_bytes(estado[ancho:2 * ancho], "little")
+                                 or None)
@@ -1,33 +1,44 @@
-import random
 from typing import List, Tuple
+from modelos.baraja import BARAJA_ESTANDAR, PALOS, VALORES, Baraja
 from modelos.juego_base import JuegoMontyHall
 
 
 class JuegoCartas(JuegoMontyHall):
     """
     Implementación del problema de Monty Hall con 52 cartas.
+    
+    Por defecto se usa la baraja estándar compartida (BARAJA_ESTANDAR); se
+    puede pasar otra Baraja para jugar con varios mazos o cartas propias.
+    
+    Attributes:
+        baraja (Baraja): Baraja inmutable con la que se juega
     """
     
-    PALOS = ['♠', '♥', '♦', '♣']
-    VALORES = ['A', '2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K']
+    __slots__ = ("baraja",)
     
-    def __init__(self):
-        """Inicializa el juego de las 52 cartas."""
-        super().__init__(52)
-        self.baraja = self._crear_baraja()
+    PALOS = list(PALOS)
+    VALORES = list(VALORES)
+    
+    def __init__(self, rng=None, baraja: Baraja = None):
+        """
+        Inicializa el juego de las cartas.
         
-    def _crear_baraja(self) -> List[str]:
+        Args:
+            rng: Generador de números aleatorios (ver JuegoMontyHall)
+            baraja: Baraja a usar (por defecto, la estándar de 52 cartas)
+        """
+        self.baraja = baraja or BARAJA_ESTANDAR
+        super().__init__(len(self.baraja), rng)
+        
+    @classmethod
+    def _crear_baraja(cls) -> List[str]:
         """
         Crea una baraja completa de 52 cartas.
         
         Returns:
             Lista de strings representando las cartas
         """
-        baraja = []
-        for palo in self.PALOS:
-            for valor in self.VALORES:
-                baraja.append(f"{valor}{palo}")
-        return baraja
+        return list(BARAJA_ESTANDAR.cartas)
     
     def obtener_carta(self, posicion: int) -> str:
         """
@@ -39,7 +50,7 @@ class JuegoCartas(JuegoMontyHall):
         Returns:
             String representando la carta
         """
-        return self.baraja[posicion - 1]
+        return self.baraja.cartas[posicion - 1]
     
     def obtener_color_carta(self, posicion: int) -> str:
         """
@@ -51,27 +62,32 @@ class JuegoCartas(JuegoMontyHall):
         Returns:
             "red" o "black"
         """
-        carta = self.obtener_carta(posicion)
-        return "red" if '♥' in carta or '♦' in carta else "black"
+        return self.baraja.colores[posicion - 1]
     
     def revelar_cartas(self) -> Tuple[List[int], int]:
         """
-        Revela 50 de las 51 cartas restantes, dejando oculta la carta ganadora
-        (o una carta aleatoria si el usuario ya eligió la ganadora).
+        Revela todas las cartas no elegidas menos una (50 de las 51 restantes
+        con la baraja estándar), dejando oculta la carta ganadora (o una
+        carta aleatoria si el usuario ya eligió la ganadora).
         
         Returns:
             Tupla con (lista de posiciones reveladas, posición de carta oculta)
         """
-        cartas_no_elegidas = [i for i in range(1, 53) 
-                             if i != self.eleccion_usuario]
-        
-        if self.eleccion_usuario == self.opcion_ganadora:
-            carta_oculta = random.choice(cartas_no_elegidas)
+        eleccion = self.eleccion_usuario
+        if eleccion == self.opcion_ganadora:
+            carta_oculta = self.rng.randint(1, self.total_opciones - 1)
+            if carta_oculta >= eleccion:
+                carta_oculta += 1
         else:
             carta_oculta = self.opcion_ganadora
         
-        cartas_reveladas = [i for i in cartas_no_elegidas if i != carta_oculta]
-        self.opciones_reveladas = cartas_reveladas
+        cartas_reveladas = [i for i in range(1, self.total_opciones + 1)
+                            if i != eleccion and i != carta_oculta]
+        mascara = ((1 << (self.total_opciones + 1)) - 2) ^ (1 << carta_oculta)
+        if eleccion is not None:
+            # Sin elección se revelan todas menos la oculta
+            mascara ^= 1 << eleccion
+        self._mascara_reveladas = mascara
         
         return cartas_reveladas, carta_oculta
     
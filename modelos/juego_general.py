@@ -0,0 +1,222 @@
+from typing import Iterable, List, Set, Tuple
+from modelos.juego_base import JuegoMontyHall
+
+
+def validar_configuracion(total_opciones: int, reveladas: int = None) -> int:
+    """
+    Comprueba que la configuración del juego sea válida.
+
+    Args:
+        total_opciones: Número total de opciones (mínimo 2)
+        reveladas: Opciones que abre el presentador (por defecto N - 2)
+
+    Returns:
+        Número de opciones que abre el presentador
+    """
+    if total_opciones < 2:
+        raise ValueError("Se necesitan al menos 2 opciones")
+    if reveladas is None:
+        reveladas = total_opciones - 2
+    if not 0 <= reveladas <= total_opciones - 2:
+        raise ValueError("El presentador debe dejar al menos una opción "
+                         "cerrada además de la elegida")
+    return reveladas
+
+
+class JuegoGeneralizado(JuegoMontyHall):
+    """
+    Problema de Monty Hall con N opciones en el que el presentador abre K.
+
+    El presentador abre K opciones perdedoras distintas de la elegida y deja
+    cerradas las otras M = N - 1 - K. Para no recorrer las N opciones en cada
+    ronda solo se sortea el conjunto más pequeño de los dos (las K abiertas o
+    las M cerradas), con un costo de O(min(K, M)); la lista completa de
+    opciones reveladas se construye únicamente si se pide.
+
+    Attributes:
+        reveladas (int): Número de opciones que abre el presentador (K)
+    """
+
+    __slots__ = ("reveladas", "_abiertas", "_cerradas", "_lista_cerradas",
+                 "_lista_reveladas")
+
+    def __init__(self, total_opciones: int, reveladas: int = None, rng=None):
+        """
+        Inicializa el juego generalizado.
+
+        Args:
+            total_opciones: Número total de opciones (N)
+            reveladas: Opciones que abre el presentador (K). Por defecto
+                N - 2, como en los juegos de puertas y de cartas.
+            rng: Generador de números aleatorios (ver JuegoMontyHall)
+        """
+        self.reveladas = validar_configuracion(total_opciones, reveladas)
+        super().__init__(total_opciones, rng)
+
+    @property
+    def numero_cerradas(self) -> int:
+        """Opciones que quedan cerradas además de la elegida (M)."""
+        return self.total_opciones - 1 - self.reveladas
+
+    @property
+    def opciones_reveladas(self) -> Tuple[int, ...]:
+        """Tupla ordenada de opciones reveladas (se construye al pedirla)."""
+        if self._lista_reveladas is None:
+            if self._abiertas is not None:
+                self._lista_reveladas = tuple(sorted(self._abiertas))
+            elif self._cerradas is not None:
+                self._lista_reveladas = tuple(
+                    i for i in range(1, self.total_opciones + 1)
+                    if i not in self._cerradas
+                )
+            else:
+                self._lista_reveladas = ()
+        return self._lista_reveladas
+
+    @opciones_reveladas.setter
+    def opciones_reveladas(self, opciones: Iterable[int]):
+        self._abiertas = set(opciones) if opciones else None
+        self._cerradas = None
+        self._lista_cerradas = None
+        self._lista_reveladas = None
+
+    def _capturar_reveladas(self, ancho: int) -> bytes:
+        """
+        Serializa el menor de los conjuntos de opciones abiertas o cerradas.
+
+        Se guarda un byte que indica qué conjunto es (0 ninguno, 1 abiertas,
+        2 cerradas) seguido de sus opciones, así que el tamaño depende de
+        min(K, M) y no de N.
+
+        Args:
+            ancho: Bytes por opción
+
+        Returns:
+            Opciones reveladas serializadas
+        """
+        if self._abiertas is not None:
+            tipo, opciones = 1, self._abiertas
+            if 2 * len(opciones) > self.total_opciones:
+                tipo, opciones = 2, set(range(1, self.total_opciones + 1)) - opciones
+        elif self._cerradas is not None:
+            tipo, opciones = 2, self._cerradas
+        else:
+            return b"\0"
+        return bytes((tipo,)) + b"".join(opcion.to_bytes(ancho, "little")
+                                          for opcion in opciones)
+
+    def _restaurar_reveladas(self, datos: bytes, ancho: int):
+        """
+        Recupera las opciones guardadas por _capturar_reveladas.
+
+        Args:
+            datos: Bytes de las opciones reveladas
+            ancho: Bytes por opción
+
+        Raises:
+            ValueError: Si los datos no corresponden a este juego
+        """
+        if not datos or datos[0] > 2 or (len(datos) - 1) % ancho:
+            raise ValueError(
+                f"Opciones reveladas de {len(datos)} bytes incompatibles con "
+                f"un juego de {self.total_opciones} opciones"
+            )
+        opciones = {int.from_bytes(datos[i:i + ancho], "little")
+                    for i in range(1, len(datos), ancho)}
+        self.opciones_reveladas = ()
+        if datos[0] == 1:
+            self._abiertas = opciones
+        elif datos[0] == 2:
+            self._cerradas = opciones
+
+    def _muestrear(self, cantidad: int, excluidas: Set[int]) -> Set[int]:
+        """
+        Sortea opciones distintas que no estén en el conjunto excluido.
+
+        Args:
+            cantidad: Número de opciones a sortear
+            excluidas: Opciones que no pueden salir
+
+        Returns:
+            Conjunto con las opciones sorteadas
+        """
+        muestra = set()
+        while len(muestra) < cantidad:
+            opcion = self.rng.randint(1, self.total_opciones)
+            if opcion not in excluidas:
+                muestra.add(opcion)
+        return muestra
+
+    def revelar_opciones(self):
+        """
+        Abre K opciones perdedoras no elegidas por el usuario.
+
+        Solo se sortea el menor de los conjuntos de opciones abiertas o
+        cerradas; el otro queda definido implícitamente.
+        """
+        excluidas = {self.eleccion_usuario, self.opcion_ganadora}
+        perdedoras = self.total_opciones - len(excluidas)
+        self.opciones_reveladas = ()
+
+        if self.reveladas <= self.numero_cerradas:
+            self._abiertas = self._muestrear(self.reveladas, excluidas)
+        else:
+            cerradas = self._muestrear(perdedoras - self.reveladas, excluidas)
+            # Las cerradas incluyen la elección inicial y, si no coincide
+            # con ella, la opción ganadora
+            cerradas |= excluidas
+            self._cerradas = cerradas
+
+    def esta_revelada(self, opcion: int) -> bool:
+        """
+        Indica si una opción fue abierta por el presentador en O(1).
+
+        Args:
+            opcion: Número de la opción
+
+        Returns:
+            True si la opción está abierta
+        """
+        if self._abiertas is not None:
+            return opcion in self._abiertas
+        if self._cerradas is not None:
+            return opcion not in self._cerradas
+        return False
+
+    def obtener_opciones_cerradas(self) -> List[int]:
+        """
+        Obtiene las opciones cerradas distintas de la elegida.
+
+        Returns:
+            Lista de opciones a las que el usuario puede cambiar
+        """
+        if self._lista_cerradas is None:
+            if self._cerradas is not None:
+                self._lista_cerradas = sorted(self._cerradas
+                                              - {self.eleccion_usuario})
+            else:
+                self._lista_cerradas = [
+                    i for i in range(1, self.total_opciones + 1)
+                    if i != self.eleccion_usuario and not self.esta_revelada(i)
+                ]
+        return self._lista_cerradas
+
+    def cambiar_eleccion(self, nueva_opcion: int = None):
+        """
+        Cambia la elección del usuario a otra opción cerrada.
+
+        Args:
+            nueva_opcion: Opción elegida. Si es None se elige al azar una de
+                las opciones cerradas restantes.
+        """
+        if nueva_opcion is None:
+            if self._cerradas is not None:
+                nueva_opcion = self.rng.choice(self.obtener_opciones_cerradas())
+            else:
+                excluidas = {self.eleccion_usuario}
+                if self._abiertas is not None:
+                    excluidas |= self._abiertas
+                nueva_opcion = self._muestrear(1, excluidas).pop()
+        self.eleccion_usuario = nueva_opcion
+        self._lista_reveladas = None
+        self._lista_cerradas = None
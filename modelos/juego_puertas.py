@@ -1,15 +1,32 @@
-import random
+from modelos.aleatorio import BufferAleatorio, adaptar_generador
 from modelos.juego_base import JuegoMontyHall
 
 
+# Puertas distintas de cada puerta (índice 1-3), como tuplas constantes para
+# sortear entre ellas sin crear listas
+OTRAS_PUERTAS = ((), (2, 3), (1, 3), (1, 2))
+PUERTA_UNICA = ((), (1,), (2,), (3,))
+
+
 class JuegoPuertas(JuegoMontyHall):
     """
     Implementación del problema clásico de Monty Hall con 3 puertas.
+    
+    Con puertas numeradas 1, 2 y 3, dos puertas distintas determinan la
+    tercera (6 - a - b), así que la ronda se resuelve con aritmética y sin
+    crear listas.
     """
     
-    def __init__(self):
-        """Inicializa el juego de las 3 puertas."""
-        super().__init__(3)
+    __slots__ = ()
+    
+    def __init__(self, rng=None):
+        """
+        Inicializa el juego de las 3 puertas.
+        
+        Args:
+            rng: Generador de números aleatorios (ver JuegoMontyHall)
+        """
+        super().__init__(3, rng)
         
     def revelar_puerta(self) -> int:
         """
@@ -18,12 +35,16 @@ class JuegoPuertas(JuegoMontyHall):
         Returns:
             Número de la puerta revelada
         """
-        opciones_perdedoras = self._obtener_opciones_perdedoras()
-        opciones_a_revelar = [p for p in opciones_perdedoras 
-                              if p != self.eleccion_usuario]
-        
-        puerta_revelada = random.choice(opciones_a_revelar)
-        self.opciones_reveladas.append(puerta_revelada)
+        eleccion = self.eleccion_usuario
+        ganadora = self.opcion_ganadora
+        if eleccion is None or eleccion == ganadora:
+            # Sin elección se puede abrir cualquier puerta perdedora
+            candidatas = OTRAS_PUERTAS[ganadora]
+        else:
+            # Se sortea igualmente para consumir el generador como siempre
+            candidatas = PUERTA_UNICA[6 - eleccion - ganadora]
+        puerta_revelada = self.rng.choice(candidatas)
+        self._mascara_reveladas |= 1 << puerta_revelada
         return puerta_revelada
     
     def obtener_puerta_restante(self) -> int:
@@ -33,8 +54,15 @@ class JuegoPuertas(JuegoMontyHall):
         Returns:
             Número de la puerta restante
         """
+        mascara = self._mascara_reveladas
+        eleccion = self.eleccion_usuario
+        if eleccion is not None and mascara and mascara & (mascara - 1) == 0:
+            # Caso habitual: una sola puerta revelada distinta de la elegida
+            revelada = mascara.bit_length() - 1
+            if revelada != eleccion:
+                return 6 - eleccion - revelada
         for i in range(1, 4):
-            if i != self.eleccion_usuario and i not in self.opciones_reveladas:
+            if i != eleccion and not self.esta_revelada(i):
                 return i
         return -1
     
@@ -53,3 +81,65 @@ class JuegoPuertas(JuegoMontyHall):
             "AUTO" si es la puerta ganadora, "CABRA" en caso contrario
         """
         return "AUTO" if puerta == self.opcion_ganadora else "CABRA"
+
+
+def jugar_rondas_puertas(rondas: int, rng=None, cambiar: bool = True,
+                         compatible: bool = True) -> int:
+    """
+    Juega rondas completas de 3 puertas sin crear objetos.
+    
+    Cada ronda equivale a reiniciar un JuegoPuertas, elegir una puerta al
+    azar, revelar una cabra y (si se indica) cambiar: hace las mismas
+    llamadas al generador en el mismo orden, así que con la misma semilla
+    el resultado coincide con el de la clase, pero sin listas ni llamadas
+    a métodos.
+    
+    Con compatible=False se renuncia a esa coincidencia y cada ronda usa un
+    solo número aleatorio: los 9 pares (ganadora, elección) son igual de
+    probables y basta saber si coinciden, lo que multiplica la velocidad.
+    
+    Args:
+        rondas: Número de rondas a jugar
+        rng: Generador de números aleatorios (ver JuegoMontyHall)
+        cambiar: Si es True el jugador cambia siempre de puerta
+        compatible: Si es True se reproduce la secuencia de sorteos de
+            JuegoPuertas
+        
+    Returns:
+        Número de rondas ganadas
+    """
+    rng = adaptar_generador(rng)
+    if not compatible:
+        aleatorio = rng.random
+        # Con el par codificado como 3 * (ganadora - 1) + (elección - 1),
+        # coinciden exactamente los valores 0, 4 y 8
+        aciertos = sum(int(aleatorio() * 9) % 4 == 0 for _ in range(rondas))
+        return rondas - aciertos if cambiar else aciertos
+    otras = OTRAS_PUERTAS
+    victorias = 0
+    if isinstance(rng, BufferAleatorio):
+        # randint y choice del buffer son int(random() * n): se aplican en
+        # línea y el sorteo con una sola puerta solo avanza el buffer
+        aleatorio = rng.random
+        for _ in range(rondas):
+            ganadora = 1 + int(aleatorio() * 3)
+            eleccion = 1 + int(aleatorio() * 3)
+            aleatorio()
+            if eleccion == ganadora:
+                victorias += not cambiar
+            else:
+                victorias += cambiar
+        return victorias
+    randint = rng.randint
+    choice = rng.choice
+    unica = PUERTA_UNICA
+    for _ in range(rondas):
+        ganadora = randint(1, 3)
+        eleccion = randint(1, 3)
+        if eleccion == ganadora:
+            choice(otras[ganadora])
+            victorias += not cambiar
+        else:
+            choice(unica[6 - eleccion - ganadora])
+            victorias += cambiar
+    return victorias
@@ -0,0 +1,107 @@
+from contextlib import contextmanager
+from typing import Callable, List
+
+from modelos.juego_base import JuegoMontyHall
+
+
+class PoolJuegos:
+    """
+    Reserva de juegos reutilizables de un mismo tipo.
+
+    En lugar de crear un juego por partida, se toma uno de la reserva y se
+    devuelve al terminar. Junto con capturar_estado/restaurar_estado permite
+    aparcar muchas partidas en curso como unos pocos bytes cada una y
+    reanudarlas sobre cualquier instancia libre.
+
+    Attributes:
+        fabrica (Callable[[], JuegoMontyHall]): Crea un juego nuevo
+        max_libres (int): Juegos libres que se conservan como máximo
+        creados (int): Juegos creados por la fábrica
+        reutilizados (int): Veces que se entregó un juego de la reserva
+    """
+
+    def __init__(self, fabrica: Callable[[], JuegoMontyHall],
+                 max_libres: int = 1024):
+        """
+        Inicializa la reserva vacía.
+
+        Args:
+            fabrica: Función sin argumentos que crea un juego nuevo
+            max_libres: Juegos libres que se conservan como máximo
+        """
+        self.fabrica = fabrica
+        self.max_libres = max_libres
+        self.creados = 0
+        self.reutilizados = 0
+        self._libres: List[JuegoMontyHall] = []
+
+    def __len__(self) -> int:
+        return len(self._libres)
+
+    def _tomar(self) -> JuegoMontyHall:
+        """Saca un juego de la reserva o crea uno si está vacía."""
+        if self._libres:
+            self.reutilizados += 1
+            return self._libres.pop()
+        self.creados += 1
+        return self.fabrica()
+
+    def obtener(self) -> JuegoMontyHall:
+        """
+        Entrega un juego listo para una partida nueva.
+
+        Returns:
+            Juego reiniciado
+        """
+        reutilizado = bool(self._libres)
+        juego = self._tomar()
+        if reutilizado:
+            juego.reiniciar()
+        return juego
+
+    def devolver(self, juego: JuegoMontyHall):
+        """
+        Devuelve un juego que ya no se usa.
+
+        Args:
+            juego: Juego obtenido de esta reserva
+        """
+        if len(self._libres) < self.max_libres:
+            self._libres.append(juego)
+
+    def reanudar(self, estado: bytes) -> JuegoMontyHall:
+        """
+        Entrega un juego con una partida aparcada.
+
+        Args:
+            estado: Estado obtenido con aparcar o capturar_estado
+
+        Returns:
+            Juego con el estado restaurado
+        """
+        juego = self._tomar()
+        juego.restaurar_estado(estado)
+        return juego
+
+    def aparcar(self, juego: JuegoMontyHall) -> bytes:
+        """
+        Guarda el estado de un juego y lo devuelve a la reserva.
+
+        Args:
+            juego: Juego con una partida en curso
+
+        Returns:
+            Estado serializado para reanudar la partida más tarde
+        """
+        estado = juego.capturar_estado()
+        self.devolver(juego)
+        return estado
+
+    @contextmanager
+    def prestado(self):
+        """Presta un juego reiniciado y lo devuelve al salir del bloque."""
+        juego = self.obtener()
+        try:
+            yield juego
+        finally:
+            self.devolver(juego)
@@ -0,0 +1,81 @@
+from fractions import Fraction
+from functools import lru_cache
+from typing import Tuple
+from modelos.estadisticas import EstadisticasMontyHall
+from modelos.juego_general import validar_configuracion
+
+
+# Comportamientos del presentador con solución exacta:
+#   informado: abre siempre opciones perdedoras (JuegoPuertas, JuegoCartas)
+#   sesgado, menor_indice: informados con preferencia por ciertas opciones;
+#       sin condicionar a qué opción se abrió, ganan lo mismo que el informado
+#   ignorante: abre opciones al azar; si descubre la ganadora, nadie gana
+#   infernal: solo abre opciones cuando el usuario eligió la ganadora
+ANFITRIONES_EXACTOS = ("informado", "sesgado", "menor_indice", "ignorante",
+                       "infernal")
+
+
+@lru_cache(maxsize=None)
+def probabilidades_exactas(total_opciones: int, reveladas: int = None,
+                           anfitrion: str = "informado") -> Tuple[Fraction, Fraction]:
+    """
+    Calcula con aritmética racional la probabilidad de ganar de cada
+    estrategia. El resultado se memoriza por configuración.
+
+    Quien cambia elige al azar entre las opciones que siguen cerradas
+    (M = N - 1 - K); la probabilidad de que la elección inicial sea la
+    ganadora es siempre 1 / N.
+
+    Args:
+        total_opciones: Número total de opciones (N)
+        reveladas: Opciones que abre el presentador (K, por defecto N - 2)
+        anfitrion: Uno de ANFITRIONES_EXACTOS
+
+    Returns:
+        Tupla (probabilidad al mantener, probabilidad al cambiar)
+    """
+    reveladas = validar_configuracion(total_opciones, reveladas)
+    cerradas = total_opciones - 1 - reveladas
+    acierto_inicial = Fraction(1, total_opciones)
+
+    if anfitrion in ("informado", "sesgado", "menor_indice"):
+        # La ganadora nunca se abre: si no se eligió, está entre las cerradas
+        cambiar = (1 - acierto_inicial) / cerradas
+    elif anfitrion == "ignorante":
+        # La ganadora queda cerrada con probabilidad M / (N - 1)
+        cambiar = ((1 - acierto_inicial)
+                   * Fraction(cerradas, total_opciones - 1) / cerradas)
+    elif anfitrion == "infernal":
+        # Solo se ofrece cambiar cuando la elección inicial ya era la ganadora
+        cambiar = Fraction(0)
+    else:
+        raise ValueError(f"Presentador sin solución exacta: {anfitrion}")
+    return acierto_inicial, cambiar
+
+
+def validar_resultado(resultado, total_opciones: int, reveladas: int = None,
+                      confianza: float = 0.999) -> bool:
+    """
+    Comprueba que un resultado simulado sea compatible con el exacto.
+
+    Args:
+        resultado: ResultadoSimulacion o EstadisticasMontyHall a validar
+        total_opciones: Número total de opciones
+        reveladas: Opciones que abre el presentador
+        confianza: Nivel de confianza de los intervalos de Wilson
+
+    Returns:
+        True si ambas probabilidades exactas caen dentro de sus intervalos
+    """
+    if isinstance(resultado, EstadisticasMontyHall):
+        estadisticas = resultado
+    else:
+        estadisticas = EstadisticasMontyHall()
+        estadisticas.agregar_resultado(resultado)
+    exactas = probabilidades_exactas(total_opciones, reveladas)
+    for acumulador, exacta in zip((estadisticas.mantener, estadisticas.cambiar),
+                                  exactas):
+        inferior, superior = acumulador.intervalo_wilson(confianza)
+        if not inferior <= exacta <= superior:
+            return False
+    return True
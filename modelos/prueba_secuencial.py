@@ -0,0 +1,141 @@
+from math import log
+from typing import Optional
+
+from modelos.simulador import ResultadoSimulacion, SimuladorMontyHall
+
+
+class ResultadoSecuencial:
+    """
+    Resultado de una prueba secuencial.
+
+    Attributes:
+        decision (Optional[str]): "cambiar" si cambiar es mejor, "mantener" si
+            no lo es, o None si se agotaron las rondas sin decidir
+        resultado (ResultadoSimulacion): Rondas simuladas hasta detenerse
+        razon_log (float): Logaritmo de la razón de verosimilitudes final
+    """
+
+    def __init__(self, decision: Optional[str], resultado: ResultadoSimulacion,
+                 razon_log: float):
+        """
+        Inicializa el resultado.
+
+        Args:
+            decision: "cambiar", "mantener" o None
+            resultado: Rondas simuladas hasta detenerse
+            razon_log: Logaritmo de la razón de verosimilitudes final
+        """
+        self.decision = decision
+        self.resultado = resultado
+        self.razon_log = razon_log
+
+    @property
+    def rondas(self) -> int:
+        """Rondas consumidas por la prueba."""
+        return self.resultado.rondas
+
+    def __repr__(self) -> str:
+        return (f"ResultadoSecuencial(decision={self.decision!r}, "
+                f"rondas={self.rondas}, razon_log={self.razon_log:.3f})")
+
+
+class PruebaSecuencial:
+    """
+    Prueba de razón de probabilidades secuencial (SPRT de Wald) que decide
+    si cambiar gana más a menudo que mantener.
+
+    En una misma ronda no pueden ganar las dos estrategias, así que solo
+    informan las rondas discordantes (gana exactamente una). Entre ellas, p
+    es la proporción que gana cambiando, y se contrastan
+    H0: p = 1/2 - indiferencia (mantener es mejor) frente a
+    H1: p = 1/2 + indiferencia (cambiar es mejor). Como
+    log(p1 / p0) = -log((1 - p1) / (1 - p0)), la razón de verosimilitudes
+    solo depende de la diferencia de victorias entre estrategias:
+
+        razon_log = (victorias_cambiar - victorias_mantener) * log(p1 / p0)
+
+    Las rondas se simulan en lotes que se duplican y la prueba se detiene en
+    cuanto la razón cruza uno de los umbrales de Wald, con errores de tipo I
+    y II acotados por alfa y beta. Al comprobar solo entre lotes se pueden
+    consumir hasta el doble de rondas de las estrictamente necesarias, lo que
+    además hace la prueba algo más conservadora.
+
+    Attributes:
+        simulador (SimuladorMontyHall): Fuente de las rondas; solo se usan
+            su método público simular_lote y TAMANO_LOTE
+        alfa (float): Probabilidad de decidir "cambiar" si no es mejor
+        beta (float): Probabilidad de decidir "mantener" si cambiar es mejor
+        indiferencia (float): Semiancho de la zona de indiferencia sobre p
+    """
+
+    LOTE_INICIAL = 64
+
+    def __init__(self, simulador: SimuladorMontyHall, alfa: float = 0.05,
+                 beta: float = 0.05, indiferencia: float = 0.05):
+        """
+        Inicializa la prueba.
+
+        Args:
+            simulador: Simulador de la configuración a contrastar (o
+                cualquier objeto con simular_lote y TAMANO_LOTE)
+            alfa: Error de tipo I (entre 0 y 1)
+            beta: Error de tipo II (entre 0 y 1)
+            indiferencia: Semiancho de la zona de indiferencia (entre 0 y 1/2)
+
+        Raises:
+            ValueError: Si algún parámetro está fuera de rango
+        """
+        if not 0 < alfa < 1 or not 0 < beta < 1:
+            raise ValueError("alfa y beta deben estar entre 0 y 1")
+        if not 0 < indiferencia < 0.5:
+            raise ValueError("La indiferencia debe estar entre 0 y 1/2")
+        self.simulador = simulador
+        self.alfa = alfa
+        self.beta = beta
+        self.indiferencia = indiferencia
+        self.limite_superior = log((1 - beta) / alfa)
+        self.limite_inferior = log(beta / (1 - alfa))
+        self.paso = log((0.5 + indiferencia) / (0.5 - indiferencia))
+
+    def decidir(self, resultado: ResultadoSimulacion):
+        """
+        Aplica los umbrales de Wald a las rondas acumuladas.
+
+        Args:
+            resultado: Rondas simuladas hasta ahora
+
+        Returns:
+            Tupla (decisión o None, logaritmo de la razón de verosimilitudes)
+        """
+        razon_log = (resultado.victorias_cambiar
+                     - resultado.victorias_mantener) * self.paso
+        if razon_log >= self.limite_superior:
+            return "cambiar", razon_log
+        if razon_log <= self.limite_inferior:
+            return "mantener", razon_log
+        return None, razon_log
+
+    def ejecutar(self, max_rondas: int = 10**8,
+                 tamano_lote: int = None) -> ResultadoSecuencial:
+        """
+        Simula rondas hasta que la prueba decide o se alcanza el límite.
+
+        Args:
+            max_rondas: Límite de rondas aunque no se llegue a decidir
+            tamano_lote: Tamaño máximo de cada lote
+
+        Returns:
+            Decisión y rondas consumidas
+        """
+        tamano_lote = tamano_lote or self.simulador.TAMANO_LOTE
+        resultado = ResultadoSimulacion()
+        decision, razon_log = None, 0.0
+        lote = min(self.LOTE_INICIAL, tamano_lote)
+        while resultado.rondas < max_rondas:
+            lote = min(lote, max_rondas - resultado.rondas)
+            resultado = resultado + self.simulador.simular_lote(lote)
+            decision, razon_log = self.decidir(resultado)
+            if decision is not None:
+                break
+            lote = min(lote * 2, tamano_lote)
+        return ResultadoSecuencial(decision, resultado, razon_log)
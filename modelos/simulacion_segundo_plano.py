@@ -0,0 +1,87 @@
+import queue
+import threading
+import time
+
+from modelos.simulador import ResultadoSimulacion, SimuladorMontyHall
+
+
+class SimulacionSegundoPlano(threading.Thread):
+    """
+    Ejecuta el simulador por lotes en un hilo y publica los totales en una cola.
+
+    Los lotes empiezan pequeños y se duplican hasta el tamaño máximo, de modo
+    que la convergencia se ve desde las primeras rondas. Tras cada lote se
+    publica el resultado acumulado con las rondas por segundo; si la cola
+    está llena se descarta la publicación, ya que la siguiente contiene
+    todos los datos. El consumidor (p. ej. la interfaz gráfica) solo tiene
+    que leer la cola sin bloquearse.
+
+    Attributes:
+        simulador (SimuladorMontyHall): Simulador usado en cada lote
+        max_rondas (int): Rondas tras las que se detiene (None para no parar)
+        cola (queue.Queue): Tuplas (ResultadoSimulacion acumulado, rondas/s)
+        resultado (ResultadoSimulacion): Totales acumulados hasta ahora
+        velocidad (float): Rondas por segundo hasta ahora
+    """
+
+    LOTE_INICIAL = 4096
+
+    def __init__(self, total_opciones: int, reveladas: int = None,
+                 semilla=None, max_rondas: int = None, tamano_lote: int = None,
+                 tamano_cola: int = 64):
+        """
+        Inicializa el hilo sin arrancarlo.
+
+        Args:
+            total_opciones: Número total de opciones en cada ronda
+            reveladas: Opciones que abre el presentador (por defecto N - 2)
+            semilla: Semilla o generador de NumPy
+            max_rondas: Rondas tras las que se detiene (None para no parar)
+            tamano_lote: Tamaño máximo de cada lote
+            tamano_cola: Publicaciones que caben en la cola
+        """
+        super().__init__(daemon=True)
+        self.simulador = SimuladorMontyHall(total_opciones, semilla, reveladas)
+        self.max_rondas = max_rondas
+        self.tamano_lote = tamano_lote or SimuladorMontyHall.TAMANO_LOTE
+        self.cola = queue.Queue(maxsize=tamano_cola)
+        self.resultado = ResultadoSimulacion()
+        self.velocidad = 0.0
+        self._detener = threading.Event()
+
+    def run(self):
+        """Simula lotes hasta llegar al máximo de rondas o hasta detenerse."""
+        lote = min(self.LOTE_INICIAL, self.tamano_lote)
+        inicio = time.perf_counter()
+        while not self._detener.is_set():
+            if self.max_rondas is not None:
+                lote = min(lote, self.max_rondas - self.resultado.rondas)
+                if lote <= 0:
+                    break
+            self.resultado = self.resultado + self.simulador.simular_lote(lote)
+            transcurrido = time.perf_counter() - inicio
+            if transcurrido:
+                self.velocidad = self.resultado.rondas / transcurrido
+            try:
+                self.cola.put_nowait((self.resultado, self.velocidad))
+            except queue.Full:
+                pass
+            lote = min(lote * 2, self.tamano_lote)
+
+    def detener(self):
+        """Pide al hilo que termine tras el lote en curso."""
+        self._detener.set()
+
+    def ultimo(self):
+        """
+        Vacía la cola sin bloquear y devuelve la publicación más reciente.
+
+        Returns:
+            Tupla (ResultadoSimulacion, rondas/s) o None si no había ninguna
+        """
+        ultimo = None
+        while True:
+            try:
+                ultimo = self.cola.get_nowait()
+            except queue.Empty:
+                return ultimo
@@ -0,0 +1,236 @@
+import numpy as np
+from modelos.estadisticas import EstadisticasMontyHall
+from modelos.juego_base import JuegoMontyHall
+from modelos.juego_general import validar_configuracion
+from modelos.probabilidad_exacta import probabilidades_exactas
+
+
+class ResultadoSimulacion:
+    """
+    Resultado agregado de una simulación por lotes.
+
+    Attributes:
+        rondas (int): Número de rondas simuladas
+        victorias_mantener (int): Rondas ganadas manteniendo la elección
+        victorias_cambiar (int): Rondas ganadas cambiando de elección
+    """
+
+    def __init__(self, rondas: int = 0, victorias_mantener: int = 0,
+                 victorias_cambiar: int = 0):
+        """
+        Inicializa el resultado con los conteos indicados.
+
+        Args:
+            rondas: Número de rondas simuladas
+            victorias_mantener: Victorias de la estrategia "mantener"
+            victorias_cambiar: Victorias de la estrategia "cambiar"
+        """
+        self.rondas = rondas
+        self.victorias_mantener = victorias_mantener
+        self.victorias_cambiar = victorias_cambiar
+
+    @property
+    def tasa_mantener(self) -> float:
+        """Proporción de victorias manteniendo la elección."""
+        return self.victorias_mantener / self.rondas if self.rondas else 0.0
+
+    @property
+    def tasa_cambiar(self) -> float:
+        """Proporción de victorias cambiando de elección."""
+        return self.victorias_cambiar / self.rondas if self.rondas else 0.0
+
+    def __add__(self, otro: "ResultadoSimulacion") -> "ResultadoSimulacion":
+        return ResultadoSimulacion(
+            self.rondas + otro.rondas,
+            self.victorias_mantener + otro.victorias_mantener,
+            self.victorias_cambiar + otro.victorias_cambiar
+        )
+
+    def __eq__(self, otro) -> bool:
+        if not isinstance(otro, ResultadoSimulacion):
+            return NotImplemented
+        return (self.rondas == otro.rondas
+                and self.victorias_mantener == otro.victorias_mantener
+                and self.victorias_cambiar == otro.victorias_cambiar)
+
+    def __repr__(self) -> str:
+        return (f"ResultadoSimulacion(rondas={self.rondas}, "
+                f"victorias_mantener={self.victorias_mantener}, "
+                f"victorias_cambiar={self.victorias_cambiar})")
+
+
+class SimuladorMontyHall:
+    """
+    Simulador vectorizado del problema de Monty Hall.
+
+    Aplica las reglas de JuegoMontyHall a muchas rondas a la vez: sortea las
+    opciones ganadoras y las elecciones iniciales como arreglos de NumPy y
+    cuenta cuántas rondas se ganan manteniendo y cuántas cambiando. Por
+    defecto el presentador revela todas las opciones perdedoras no elegidas
+    menos una, igual que en JuegoPuertas y JuegoCartas; con `reveladas` se
+    reproduce el juego generalizado de JuegoGeneralizado, en el que quien
+    cambia elige al azar entre las opciones que siguen cerradas.
+
+    Attributes:
+        total_opciones (int): Número total de opciones en cada ronda
+        reveladas (int): Opciones que abre el presentador en cada ronda
+        generador (np.random.Generator): Generador de números aleatorios
+    """
+
+    TAMANO_LOTE = 1 << 20
+
+    def __init__(self, total_opciones: int, semilla=None, reveladas: int = None):
+        """
+        Inicializa el simulador.
+
+        Args:
+            total_opciones: Número total de opciones (mínimo 2)
+            semilla: Semilla o generador de NumPy para reproducir resultados
+            reveladas: Opciones que abre el presentador (por defecto N - 2)
+        """
+        self.reveladas = validar_configuracion(total_opciones, reveladas)
+        self.total_opciones = total_opciones
+        self.generador = np.random.default_rng(semilla)
+
+    @classmethod
+    def desde_juego(cls, juego: JuegoMontyHall, semilla=None):
+        """
+        Crea un simulador con la misma configuración que un juego.
+
+        Args:
+            juego: Instancia de JuegoMontyHall (p. ej. JuegoPuertas)
+            semilla: Semilla o generador de NumPy
+
+        Returns:
+            SimuladorMontyHall equivalente al juego
+        """
+        return cls(juego.total_opciones, semilla,
+                   getattr(juego, "reveladas", None))
+
+    def probabilidades_exactas(self):
+        """
+        Obtiene sin simular las probabilidades exactas de esta configuración.
+
+        Returns:
+            Tupla de Fraction (probabilidad al mantener, probabilidad al cambiar)
+        """
+        return probabilidades_exactas(self.total_opciones, self.reveladas)
+
+    def simular_lote(self, rondas: int, registro=None,
+                     cambiar: bool = True) -> ResultadoSimulacion:
+        """
+        Simula un lote de rondas que cabe en memoria.
+
+        Es la unidad que usan simular y quienes consumen las rondas por
+        partes (el panel en vivo o la prueba secuencial); conviene que el lote
+        no supere TAMANO_LOTE rondas.
+
+        Args:
+            rondas: Número de rondas del lote
+            registro: EscritorRegistro opcional donde anotar cada ronda
+            cambiar: Estrategia con la que se anotan las rondas en el registro
+
+        Returns:
+            Conteo de victorias del lote
+        """
+        ganadoras = self.generador.integers(1, self.total_opciones + 1,
+                                            size=rondas, dtype=np.int32)
+        elecciones = self.generador.integers(1, self.total_opciones + 1,
+                                             size=rondas, dtype=np.int32)
+        aciertos = ganadoras == elecciones
+        victorias_mantener = int(np.count_nonzero(aciertos))
+        cerradas = self.total_opciones - 1 - self.reveladas
+        if cerradas == 1:
+            # Con una sola opción cerrada además de la elegida, cambiar
+            # gana exactamente cuando mantener pierde.
+            if registro is None:
+                return ResultadoSimulacion(rondas, victorias_mantener,
+                                           rondas - victorias_mantener)
+            acierta_cambio = ~aciertos
+        else:
+            # La ganadora sigue cerrada cuando no fue elegida; quien cambia
+            # la encuentra con probabilidad 1 / cerradas.
+            acierta_cambio = self.generador.integers(
+                cerradas, size=rondas, dtype=np.int32) == 0
+            acierta_cambio &= ~aciertos
+        victorias_cambiar = int(np.count_nonzero(acierta_cambio))
+
+        if registro is not None:
+            ocultas = np.where(acierta_cambio, ganadoras,
+                               self._sortear_perdedoras(ganadoras, elecciones))
+            registro.registrar_lote(ganadoras, elecciones, ocultas, cambiar,
+                                    acierta_cambio if cambiar else aciertos)
+        return ResultadoSimulacion(rondas, victorias_mantener,
+                                   victorias_cambiar)
+
+    def _sortear_perdedoras(self, ganadoras, elecciones):
+        """
+        Sortea en cada ronda una opción distinta de la ganadora y la elegida.
+
+        Args:
+            ganadoras: Opciones ganadoras de cada ronda
+            elecciones: Elecciones iniciales de cada ronda
+
+        Returns:
+            Arreglo con la opción sorteada en cada ronda
+        """
+        distintas = ganadoras != elecciones
+        disponibles = self.total_opciones - 1 - distintas
+        opciones = (self.generador.random(len(ganadoras))
+                    * disponibles).astype(np.int64) + 1
+        # Se desplaza el sorteo para saltar las opciones excluidas
+        opciones += opciones >= np.minimum(ganadoras, elecciones)
+        opciones += (opciones >= np.maximum(ganadoras, elecciones)) & distintas
+        return opciones
+
+    def simular(self, rondas: int, tamano_lote: int = None, registro=None,
+                cambiar: bool = True) -> ResultadoSimulacion:
+        """
+        Simula un número arbitrario de rondas procesándolas por lotes.
+
+        Args:
+            rondas: Número total de rondas a simular
+            tamano_lote: Rondas por lote (limita el uso de memoria)
+            registro: EscritorRegistro opcional donde anotar cada ronda
+            cambiar: Estrategia con la que se anotan las rondas en el registro
+
+        Returns:
+            Conteo total de victorias para cada estrategia
+        """
+        tamano_lote = tamano_lote or self.TAMANO_LOTE
+        resultado = ResultadoSimulacion()
+        restantes = int(rondas)
+        while restantes > 0:
+            lote = min(restantes, tamano_lote)
+            resultado = resultado + self.simular_lote(lote, registro, cambiar)
+            restantes -= lote
+        return resultado
+
+    def simular_hasta_precision(self, semiancho: float, confianza: float = 0.95,
+                                max_rondas: int = 10**8,
+                                tamano_lote: int = None) -> EstadisticasMontyHall:
+        """
+        Simula hasta que los intervalos de confianza sean suficientemente
+        estrechos, en lotes que se duplican desde un tamaño pequeño.
+
+        Args:
+            semiancho: Semiancho máximo del intervalo de Wilson de cada estrategia
+            confianza: Nivel de confianza de los intervalos
+            max_rondas: Límite de rondas aunque no se alcance la precisión
+            tamano_lote: Tamaño máximo de cada lote
+
+        Returns:
+            Estadísticas acumuladas al detenerse
+        """
+        tamano_lote = tamano_lote or self.TAMANO_LOTE
+        estadisticas = EstadisticasMontyHall()
+        lote = min(4096, tamano_lote)
+        rondas = 0
+        while rondas < max_rondas:
+            lote = min(lote, max_rondas - rondas)
+            estadisticas.agregar_resultado(self.simular_lote(lote))
+            rondas += lote
+            if estadisticas.precision_alcanzada(semiancho, confianza):
+                break
+            lote = min(lote * 2, tamano_lote)
+        return estadisticas
@@ -0,0 +1,546 @@
+import argparse
+import asyncio
+import json
+import random
+import secrets
+import sys
+import time
+from collections import OrderedDict
+from typing import Callable, List, Optional
+
+from modelos.juego_cartas import JuegoCartas
+from modelos.juego_puertas import JuegoPuertas
+from modelos.pool_juegos import PoolJuegos
+
+
+JUEGOS_POR_MODO = {
+    "puertas": JuegoPuertas,
+    "cartas": JuegoCartas,
+}
+
+# Por encima de este tamaño del buffer de escritura se espera al cliente
+LIMITE_BUFFER_ESCRITURA = 1 << 16
+
+# Longitud máxima de una petición; las líneas más largas se descartan
+LIMITE_LINEA = 1 << 16
+
+
+class ErrorProtocolo(ValueError):
+    """Petición inválida o fuera de orden; se responde con ok=false."""
+
+
+class Sesion:
+    """
+    Partida de un cliente.
+
+    El juego no se guarda en la sesión: entre peticiones solo se conserva
+    su estado serializado, y cada petición lo restaura sobre un juego de la
+    reserva del gestor.
+
+    Attributes:
+        estado (bytes): Estado del juego según capturar_estado
+        modo (str): "puertas" o "cartas"
+        fase (str): "seleccion", "elegida", "revelada", "cambiada" o "final"
+        eleccion_inicial (int): Primera opción elegida
+        oculta (int): Opción que el presentador dejó cerrada
+        ultimo_uso (float): Instante de la última petición
+    """
+
+    __slots__ = ("estado", "modo", "fase", "eleccion_inicial", "oculta",
+                 "ultimo_uso")
+
+    def __init__(self, estado: bytes, modo: str, ahora: float):
+        """
+        Inicializa la sesión con un juego recién creado.
+
+        Args:
+            estado: Estado del juego de la sesión
+            modo: "puertas" o "cartas"
+            ahora: Instante de creación
+        """
+        self.estado = estado
+        self.modo = modo
+        self.fase = "seleccion"
+        self.eleccion_inicial = None
+        self.oculta = None
+        self.ultimo_uso = ahora
+
+
+class GestorSesiones:
+    """
+    Guarda las sesiones de juego y atiende las peticiones sobre ellas.
+
+    Las sesiones se mantienen ordenadas por último uso, así que expulsar
+    las inactivas solo recorre las que han caducado, y al superar el máximo
+    se descarta la usada hace más tiempo: la memoria queda acotada aunque
+    los clientes abandonen partidas. Cada sesión guarda solo el estado de
+    su juego en unos pocos bytes; los juegos se toman de una reserva por
+    modo (PoolJuegos) mientras se atiende la petición y se devuelven al
+    terminar, así que hay tantos juegos vivos como peticiones en curso y no
+    como sesiones. No depende de asyncio, por lo que se puede usar y probar
+    directamente.
+
+    Peticiones (diccionarios con "op"):
+        nueva (modo), seleccionar (sesion, opcion), revelar (sesion),
+        cambiar (sesion), verificar (sesion), reiniciar (sesion),
+        cerrar (sesion)
+    Si la petición incluye "id", la respuesta lo repite.
+
+    Attributes:
+        max_sesiones (int): Sesiones simultáneas como máximo
+        inactividad (float): Segundos sin peticiones tras los que se expulsa
+        rng: Generador compartido por los juegos (None para el módulo random)
+        registro: EscritorRegistro opcional donde anotar las partidas
+    """
+
+    def __init__(self, max_sesiones: int = 100_000, inactividad: float = 300.0,
+                 rng=None, registro=None, reloj: Callable[[], float] = time.monotonic):
+        """
+        Inicializa el gestor vacío.
+
+        Args:
+            max_sesiones: Sesiones simultáneas como máximo
+            inactividad: Segundos sin peticiones tras los que se expulsa
+            rng: Generador compartido por los juegos
+            registro: EscritorRegistro opcional donde anotar las partidas
+            reloj: Función que devuelve el instante actual en segundos
+        """
+        self.max_sesiones = max_sesiones
+        self.inactividad = inactividad
+        self.rng = rng
+        self.registro = registro
+        self.reloj = reloj
+        self._sesiones = OrderedDict()
+        self._pools = {
+            modo: PoolJuegos(lambda clase=clase: clase(self.rng))
+            for modo, clase in JUEGOS_POR_MODO.items()
+        }
+        self._operaciones = {
+            "seleccionar": self._seleccionar,
+            "revelar": self._revelar,
+            "cambiar": self._cambiar,
+            "verificar": self._verificar,
+            "reiniciar": self._reiniciar,
+            "cerrar": self._cerrar,
+        }
+
+    def __len__(self) -> int:
+        return len(self._sesiones)
+
+    def procesar(self, peticion: dict) -> dict:
+        """
+        Atiende una petición.
+
+        Args:
+            peticion: Diccionario con "op" y los campos de la operación
+
+        Returns:
+            Respuesta con ok=True y los datos, u ok=False y el error
+        """
+        try:
+            if not isinstance(peticion, dict):
+                raise ErrorProtocolo("La petición debe ser un objeto JSON")
+            op = peticion.get("op")
+            if not isinstance(op, str):
+                raise ErrorProtocolo("El campo op debe ser un texto")
+            if op == "nueva":
+                respuesta = self._nueva(peticion)
+            else:
+                operacion = self._operaciones.get(op)
+                if operacion is None:
+                    raise ErrorProtocolo(f"Operación desconocida: {op}")
+                sesion = self._obtener(peticion)
+                pool = self._pools[sesion.modo]
+                juego = pool.reanudar(sesion.estado)
+                try:
+                    respuesta = operacion(peticion, sesion, juego)
+                finally:
+                    sesion.estado = pool.aparcar(juego)
+        except ErrorProtocolo as error:
+            respuesta = {"ok": False, "error": str(error)}
+        if isinstance(peticion, dict) and "id" in peticion:
+            respuesta["id"] = peticion["id"]
+        return respuesta
+
+    def expulsar_inactivas(self) -> int:
+        """
+        Elimina las sesiones sin peticiones durante más de `inactividad`.
+
+        Returns:
+            Número de sesiones eliminadas
+        """
+        limite = self.reloj() - self.inactividad
+        expulsadas = 0
+        while self._sesiones:
+            sesion = next(iter(self._sesiones.values()))
+            if sesion.ultimo_uso > limite:
+                break
+            self._sesiones.popitem(last=False)
+            expulsadas += 1
+        return expulsadas
+
+    def _obtener(self, peticion: dict) -> Sesion:
+        """Busca la sesión de una petición y la marca como usada."""
+        clave = peticion.get("sesion")
+        if not isinstance(clave, str):
+            raise ErrorProtocolo("El campo sesion debe ser un texto")
+        sesion = self._sesiones.get(clave)
+        if sesion is None:
+            raise ErrorProtocolo("Sesión desconocida o expirada")
+        sesion.ultimo_uso = self.reloj()
+        self._sesiones.move_to_end(clave)
+        return sesion
+
+    def _nueva(self, peticion: dict) -> dict:
+        modo = peticion.get("modo", "puertas")
+        if not isinstance(modo, str):
+            raise ErrorProtocolo("El campo modo debe ser un texto")
+        pool = self._pools.get(modo)
+        if pool is None:
+            raise ErrorProtocolo(f"Modo desconocido: {modo}")
+        if len(self._sesiones) >= self.max_sesiones:
+            self._sesiones.popitem(last=False)
+        clave = secrets.token_urlsafe(9)
+        juego = pool.obtener()
+        opciones = juego.total_opciones
+        self._sesiones[clave] = Sesion(pool.aparcar(juego), modo, self.reloj())
+        return {"ok": True, "sesion": clave, "opciones": opciones}
+
+    def _seleccionar(self, peticion: dict, sesion: Sesion, juego) -> dict:
+        if sesion.fase != "seleccion":
+            raise ErrorProtocolo("La opción ya fue elegida")
+        opcion = peticion.get("opcion")
+        # bool es subclase de int, pero true no es una opción
+        if (not isinstance(opcion, int) or isinstance(opcion, bool)
+                or not juego.seleccionar_opcion(opcion)):
+            raise ErrorProtocolo(f"Opción inválida: {opcion}")
+        sesion.eleccion_inicial = opcion
+        sesion.fase = "elegida"
+        return {"ok": True}
+
+    def _revelar(self, peticion: dict, sesion: Sesion, juego) -> dict:
+        if sesion.fase != "elegida":
+            raise ErrorProtocolo("Primero hay que elegir una opción")
+        if sesion.modo == "puertas":
+            reveladas = [juego.revelar_puerta()]
+            sesion.oculta = juego.obtener_puerta_restante()
+        else:
+            reveladas, sesion.oculta = juego.revelar_cartas()
+        sesion.fase = "revelada"
+        return {"ok": True, "reveladas": reveladas, "oculta": sesion.oculta}
+
+    def _cambiar(self, peticion: dict, sesion: Sesion, juego) -> dict:
+        if sesion.fase != "revelada":
+            raise ErrorProtocolo("Solo se puede cambiar tras revelar")
+        if sesion.modo == "puertas":
+            juego.cambiar_eleccion()
+        else:
+            juego.cambiar_eleccion(sesion.oculta)
+        sesion.fase = "cambiada"
+        return {"ok": True, "eleccion": juego.eleccion_usuario}
+
+    def _verificar(self, peticion: dict, sesion: Sesion, juego) -> dict:
+        if sesion.fase not in ("revelada", "cambiada", "final"):
+            raise ErrorProtocolo("Solo se puede verificar tras revelar")
+        gano = juego.verificar_victoria()
+        if sesion.fase != "final" and self.registro is not None:
+            self.registro.registrar(juego.opcion_ganadora,
+                                    sesion.eleccion_inicial, sesion.oculta,
+                                    juego.eleccion_usuario != sesion.eleccion_inicial,
+                                    gano)
+        sesion.fase = "final"
+        return {"ok": True, "gano": gano, "ganadora": juego.opcion_ganadora}
+
+    def _reiniciar(self, peticion: dict, sesion: Sesion, juego) -> dict:
+        juego.reiniciar()
+        sesion.fase = "seleccion"
+        sesion.eleccion_inicial = None
+        sesion.oculta = None
+        return {"ok": True}
+
+    def _cerrar(self, peticion: dict, sesion: Sesion, juego) -> dict:
+        del self._sesiones[peticion["sesion"]]
+        return {"ok": True}
+
+
+class ServidorJuegos:
+    """
+    Servidor asyncio de JSON por líneas sobre TCP.
+
+    Cada línea recibida es una petición y cada respuesta es una línea. Las
+    peticiones de una conexión se atienden en orden, así que un cliente
+    puede enviar varias seguidas sin esperar (pipelining); solo se espera
+    a que el cliente lea cuando se acumula demasiada salida.
+
+    Attributes:
+        gestor (GestorSesiones): Sesiones y lógica de las peticiones
+    """
+
+    def __init__(self, gestor: GestorSesiones = None):
+        """
+        Inicializa el servidor.
+
+        Args:
+            gestor: Gestor de sesiones (por defecto, uno nuevo)
+        """
+        self.gestor = gestor or GestorSesiones()
+        self._servidor = None
+        self._limpieza = None
+
+    async def iniciar(self, host: str = "127.0.0.1", puerto: int = 8765):
+        """
+        Empieza a aceptar conexiones.
+
+        Args:
+            host: Dirección en la que escuchar
+            puerto: Puerto TCP (0 para uno libre)
+
+        Returns:
+            Puerto en el que escucha
+        """
+        self._servidor = await asyncio.start_server(self._atender, host, puerto,
+                                                    limit=LIMITE_LINEA)
+        self._limpieza = asyncio.ensure_future(self._expulsar_periodicamente())
+        return self._servidor.sockets[0].getsockname()[1]
+
+    async def cerrar(self):
+        """Deja de aceptar conexiones y detiene la limpieza de sesiones."""
+        if self._limpieza is not None:
+            self._limpieza.cancel()
+        if self._servidor is not None:
+            self._servidor.close()
+            await self._servidor.wait_closed()
+
+    async def servir_siempre(self):
+        """Atiende conexiones hasta que se cancele la tarea."""
+        async with self._servidor:
+            await self._servidor.serve_forever()
+
+    async def _expulsar_periodicamente(self):
+        """Expulsa sesiones inactivas cada cuarto del tiempo de inactividad."""
+        while True:
+            await asyncio.sleep(max(self.gestor.inactividad / 4, 0.01))
+            self.gestor.expulsar_inactivas()
+
+    @staticmethod
+    async def _leer_linea(lector: asyncio.StreamReader) -> Optional[bytes]:
+        """
+        Lee una línea completa.
+
+        Returns:
+            La línea (b"" al cerrarse la conexión), o None si superaba
+            LIMITE_LINEA, en cuyo caso se descarta hasta el salto de línea
+        """
+        try:
+            return await lector.readuntil(b"\n")
+        except asyncio.IncompleteReadError as error:
+            return error.partial
+        except asyncio.LimitOverrunError as error:
+            consumidos = error.consumed
+        while True:
+            try:
+                await lector.readexactly(consumidos)
+                await lector.readuntil(b"\n")
+                return None
+            except asyncio.IncompleteReadError:
+                return b""
+            except asyncio.LimitOverrunError as error:
+                consumidos = error.consumed
+
+    def _responder(self, linea: bytes) -> dict:
+        """Decodifica una línea y atiende la petición que contiene."""
+        try:
+            return self.gestor.procesar(json.loads(linea))
+        except UnicodeDecodeError:
+            return {"ok": False, "error": "La línea no es UTF-8"}
+        except json.JSONDecodeError:
+            return {"ok": False, "error": "JSON inválido"}
+        except (ValueError, TypeError) as error:
+            # Una petición malformada no debe cerrar la conexión
+            return {"ok": False, "error": f"Petición inválida: {error}"}
+
+    async def _atender(self, lector: asyncio.StreamReader,
+                       escritor: asyncio.StreamWriter):
+        """Atiende las peticiones de una conexión hasta que se cierre."""
+        try:
+            while True:
+                linea = await self._leer_linea(lector)
+                if linea is None:
+                    respuesta = {"ok": False, "error": "La petición supera "
+                                 f"{LIMITE_LINEA} bytes"}
+                elif not linea:
+                    break
+                else:
+                    respuesta = self._responder(linea)
+                escritor.write(json.dumps(respuesta, separators=(",", ":"))
+                               .encode() + b"\n")
+                if (escritor.transport.get_write_buffer_size()
+                        > LIMITE_BUFFER_ESCRITURA):
+                    await escritor.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            escritor.close()
+
+
+class ClienteJuegos:
+    """
+    Cliente asyncio del servidor, útil para pruebas y cargas locales.
+
+    Attributes:
+        lector (asyncio.StreamReader): Flujo de respuestas
+        escritor (asyncio.StreamWriter): Flujo de peticiones
+    """
+
+    def __init__(self, lector: asyncio.StreamReader,
+                 escritor: asyncio.StreamWriter):
+        self.lector = lector
+        self.escritor = escritor
+
+    @classmethod
+    async def conectar(cls, host: str = "127.0.0.1", puerto: int = 8765):
+        """
+        Abre una conexión con el servidor.
+
+        Args:
+            host: Dirección del servidor
+            puerto: Puerto TCP
+
+        Returns:
+            ClienteJuegos conectado
+        """
+        return cls(*await asyncio.open_connection(host, puerto))
+
+    async def enviar(self, op: str, **campos) -> dict:
+        """
+        Envía una petición y espera su respuesta.
+
+        Args:
+            op: Operación
+            **campos: Campos de la petición
+
+        Returns:
+            Respuesta del servidor
+        """
+        return (await self.enviar_lote([dict(campos, op=op)]))[0]
+
+    async def enviar_lote(self, peticiones: List[dict]) -> List[dict]:
+        """
+        Envía varias peticiones seguidas y espera todas las respuestas.
+
+        Args:
+            peticiones: Peticiones en orden
+
+        Returns:
+            Respuestas en el mismo orden
+        """
+        self.escritor.write(b"".join(
+            json.dumps(peticion, separators=(",", ":")).encode() + b"\n"
+            for peticion in peticiones))
+        await self.escritor.drain()
+        return [json.loads(await self.lector.readline()) for _ in peticiones]
+
+    async def cerrar(self):
+        """Cierra la conexión."""
+        self.escritor.close()
+        await self.escritor.wait_closed()
+
+
+async def medir_servidor(partidas: int, clientes: int = 4,
+                         modo: str = "puertas") -> float:
+    """
+    Mide las peticiones por segundo de un servidor en el mismo proceso.
+
+    Cada cliente juega partidas completas (nueva, seleccionar, revelar,
+    cambiar, verificar, cerrar) enviando cada paso a todas sus partidas a
+    la vez.
+
+    Args:
+        partidas: Partidas por cliente
+        clientes: Conexiones simultáneas
+        modo: "puertas" o "cartas"
+
+    Returns:
+        Peticiones atendidas por segundo
+    """
+    servidor = ServidorJuegos()
+    puerto = await servidor.iniciar(puerto=0)
+
+    async def jugar(cliente: ClienteJuegos):
+        nuevas = await cliente.enviar_lote([{"op": "nueva", "modo": modo}]
+                                           * partidas)
+        sesiones = [r["sesion"] for r in nuevas]
+        await cliente.enviar_lote([{"op": "seleccionar", "sesion": s, "opcion": 1}
+                                   for s in sesiones])
+        for op in ("revelar", "cambiar", "verificar", "cerrar"):
+            await cliente.enviar_lote([{"op": op, "sesion": s}
+                                       for s in sesiones])
+
+    conectados = [await ClienteJuegos.conectar(puerto=puerto)
+                  for _ in range(clientes)]
+    inicio = time.perf_counter()
+    await asyncio.gather(*(jugar(cliente) for cliente in conectados))
+    duracion = time.perf_counter() - inicio
+    for cliente in conectados:
+        await cliente.cerrar()
+    await servidor.cerrar()
+    return 6 * partidas * clientes / duracion
+
+
+async def ejecutar_servidor(args):
+    """Arranca el servidor con la configuración de la línea de comandos."""
+    registro = None
+    if args.registro:
+        from utils.registro import EscritorRegistro
+        registro = EscritorRegistro(args.registro)
+    rng = random.Random(args.semilla) if args.semilla is not None else None
+    gestor = GestorSesiones(args.max_sesiones, args.inactividad, rng, registro)
+    servidor = ServidorJuegos(gestor)
+    puerto = await servidor.iniciar(args.host, args.puerto)
+    print(f"Escuchando en {args.host}:{puerto}", file=sys.stderr)
+    try:
+        await servidor.servir_siempre()
+    finally:
+        if registro is not None:
+            registro.cerrar()
+
+
+def main(argumentos: Optional[List[str]] = None):
+    """
+    Punto de entrada del servidor.
+
+    Args:
+        argumentos: Lista de argumentos (por defecto, sys.argv)
+    """
+    parser = argparse.ArgumentParser(
+        description="Servidor de partidas de Monty Hall (JSON por líneas sobre TCP)")
+    parser.add_argument("--host", default="127.0.0.1",
+                        help="dirección en la que escuchar (por defecto: 127.0.0.1)")
+    parser.add_argument("--puerto", type=int, default=8765,
+                        help="puerto TCP (por defecto: 8765)")
+    parser.add_argument("--max-sesiones", type=int, default=100_000,
+                        help="sesiones simultáneas como máximo")
+    parser.add_argument("--inactividad", type=float, default=300.0,
+                        help="segundos sin peticiones tras los que se expulsa "
+                             "una sesión (por defecto: 300)")
+    parser.add_argument("--semilla", type=int,
+                        help="semilla para reproducir las partidas")
+    parser.add_argument("--registro", metavar="RUTA",
+                        help="archivo binario donde anotar las partidas")
+    parser.add_argument("--medir", type=int, metavar="PARTIDAS",
+                        help="medir el servidor en este proceso con tantas "
+                             "partidas por cliente y salir")
+    args = parser.parse_args(argumentos)
+
+    if args.medir:
+        velocidad = asyncio.run(medir_servidor(args.medir))
+        print(f"{velocidad:,.0f} peticiones/s")
+        return
+    try:
+        asyncio.run(ejecutar_servidor(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+import argparse
+import sys
+import time
+
+from modelos.ejecutor_paralelo import EjecutorParalelo
+from modelos.estadisticas import EstadisticasMontyHall
+from modelos.probabilidad_exacta import probabilidades_exactas, validar_resultado
+from modelos.prueba_secuencial import PruebaSecuencial
+from modelos.simulador import SimuladorMontyHall
+
+
+OPCIONES_POR_MODO = {
+    "puertas": 3,
+    "cartas": 52,
+}
+
+
+def leer_rondas(texto: str) -> int:
+    """
+    Interpreta el número de rondas, aceptando notación científica ("1e8").
+
+    Args:
+        texto: Valor recibido en la línea de comandos
+
+    Returns:
+        Número de rondas como entero positivo
+    """
+    try:
+        rondas = int(float(texto))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Número de rondas inválido: {texto}")
+    if rondas <= 0:
+        raise argparse.ArgumentTypeError("El número de rondas debe ser positivo")
+    return rondas
+
+
+def crear_parser() -> argparse.ArgumentParser:
+    """
+    Crea el parser de argumentos de la línea de comandos.
+
+    Returns:
+        Parser configurado
+    """
+    parser = argparse.ArgumentParser(
+        description="Simulación por lotes de la paradoja de Monty Hall "
+                    "(sin interfaz gráfica)."
+    )
+    parser.add_argument("--modo", choices=sorted(OPCIONES_POR_MODO),
+                        default="puertas",
+                        help="juego a simular (por defecto: puertas)")
+    parser.add_argument("--opciones", type=int,
+                        help="número de opciones; reemplaza al del modo")
+    parser.add_argument("--reveladas", type=int,
+                        help="opciones que abre el presentador "
+                             "(por defecto, todas menos una)")
+    parser.add_argument("--rondas", type=leer_rondas, default=1_000_000,
+                        help="rondas a simular, p. ej. 1e8 (por defecto: 1e6)")
+    parser.add_argument("--estrategia", choices=["mantener", "cambiar", "ambas"],
+                        default="ambas",
+                        help="estrategia cuyo resultado se muestra")
+    parser.add_argument("--procesos", type=int,
+                        help="procesos trabajadores (por defecto, todos los núcleos)")
+    parser.add_argument("--semilla", type=int,
+                        help="semilla maestra para reproducir los resultados")
+    parser.add_argument("--precision", type=float,
+                        help="detener la simulación cuando el semiancho del "
+                             "intervalo de confianza sea menor que este valor "
+                             "(--rondas pasa a ser el límite)")
+    parser.add_argument("--confianza", type=float, default=0.95,
+                        help="nivel de confianza de los intervalos (por defecto: 0.95)")
+    modo_calculo = parser.add_mutually_exclusive_group()
+    modo_calculo.add_argument("--secuencial", action="store_true",
+                        help="decidir si cambiar es mejor que mantener con una "
+                             "prueba secuencial (SPRT), simulando solo las rondas "
+                             "necesarias (--rondas pasa a ser el límite)")
+    parser.add_argument("--alfa", type=float, default=0.05,
+                        help="error de tipo I de la prueba secuencial "
+                             "(por defecto: 0.05)")
+    parser.add_argument("--beta", type=float, default=0.05,
+                        help="error de tipo II de la prueba secuencial "
+                             "(por defecto: 0.05)")
+    parser.add_argument("--indiferencia", type=float, default=0.05,
+                        help="zona de indiferencia de la prueba secuencial sobre "
+                             "la proporción de rondas discordantes que gana "
+                             "cambiando (por defecto: 0.05)")
+    modo_calculo.add_argument("--exacto", action="store_true",
+                              help="calcular las probabilidades exactas sin simular")
+    modo_calculo.add_argument("--validar", action="store_true",
+                              help="comparar el resultado simulado con el exacto")
+    parser.add_argument("--silencioso", action="store_true",
+                        help="no mostrar el progreso")
+    return parser
+
+
+def mostrar_progreso(inicio: float, rondas_totales: int):
+    """
+    Crea la función que informa del progreso por la salida de errores.
+
+    Args:
+        inicio: Instante de inicio según time.perf_counter
+        rondas_totales: Número total de rondas de la simulación
+
+    Returns:
+        Función compatible con EjecutorParalelo.ejecutar
+    """
+    def progreso(resultado, terminados, total):
+        transcurrido = time.perf_counter() - inicio
+        velocidad = resultado.rondas / transcurrido if transcurrido else 0.0
+        porcentaje = 100 * resultado.rondas / rondas_totales
+        print(f"\r[{porcentaje:5.1f}%] {resultado.rondas:,} rondas "
+              f"({terminados}/{total} fragmentos) "
+              f"{velocidad / 1e6:.1f} M rondas/s",
+              end="", file=sys.stderr, flush=True)
+        if terminados == total:
+            print(file=sys.stderr)
+    return progreso
+
+
+def describir_juego(args: argparse.Namespace, total_opciones: int,
+                    reveladas: int) -> str:
+    """
+    Describe la configuración que se simula realmente.
+
+    Args:
+        args: Argumentos de la línea de comandos
+        total_opciones: Número total de opciones efectivo
+        reveladas: Opciones que abre el presentador
+
+    Returns:
+        Línea de cabecera con el juego, las opciones y las reveladas
+    """
+    if args.opciones is None:
+        juego = f"{args.modo} ({total_opciones} opciones"
+    else:
+        juego = f"personalizado ({total_opciones} opciones"
+    return f"Juego: {juego}, {reveladas} reveladas)"
+
+
+def main(argumentos=None):
+    """
+    Función principal de la simulación por línea de comandos.
+
+    Args:
+        argumentos: Lista de argumentos (por defecto, sys.argv)
+    """
+    parser = crear_parser()
+    args = parser.parse_args(argumentos)
+    if args.precision and (args.exacto or args.secuencial):
+        parser.error("--precision no se puede combinar con "
+                     + ("--exacto" if args.exacto else "--secuencial"))
+    total_opciones = args.opciones or OPCIONES_POR_MODO[args.modo]
+
+    try:
+        ejecutor = EjecutorParalelo(total_opciones, semilla=args.semilla,
+                                    procesos=args.procesos,
+                                    reveladas=args.reveladas)
+    except ValueError as error:
+        parser.error(str(error))
+
+    if args.exacto:
+        exactas = probabilidades_exactas(total_opciones, ejecutor.reveladas)
+        print(describir_juego(args, total_opciones, ejecutor.reveladas))
+        for nombre, probabilidad in zip(("mantener", "cambiar"), exactas):
+            if args.estrategia in (nombre, "ambas"):
+                print(f"{nombre.capitalize()}: {probabilidad} "
+                      f"({float(probabilidad):.4%}, exacto)")
+        return
+
+    if args.secuencial:
+        simulador = SimuladorMontyHall(total_opciones, args.semilla,
+                                       args.reveladas)
+        try:
+            prueba = PruebaSecuencial(simulador, args.alfa, args.beta,
+                                      args.indiferencia)
+        except ValueError as error:
+            parser.error(str(error))
+        inicio = time.perf_counter()
+        secuencial = prueba.ejecutar(max_rondas=args.rondas)
+        duracion = time.perf_counter() - inicio
+        resultado = secuencial.resultado
+        print(describir_juego(args, total_opciones, ejecutor.reveladas))
+        print(f"Rondas: {resultado.rondas:,} en {duracion:.3f} s")
+        print(f"Mantener: {resultado.victorias_mantener:,} victorias "
+              f"({resultado.tasa_mantener:.4%})")
+        print(f"Cambiar: {resultado.victorias_cambiar:,} victorias "
+              f"({resultado.tasa_cambiar:.4%})")
+        if secuencial.decision == "cambiar":
+            print("Decisión: cambiar es mejor que mantener")
+        elif secuencial.decision == "mantener":
+            print("Decisión: cambiar no es mejor que mantener")
+        else:
+            print("Decisión: sin decidir al alcanzar el límite de rondas")
+        print(f"(alfa={args.alfa}, beta={args.beta}, "
+              f"indiferencia={args.indiferencia}, "
+              f"log razón={secuencial.razon_log:.2f})")
+        return
+
+    inicio = time.perf_counter()
+    if args.precision:
+        # La parada temprana se decide lote a lote en un solo proceso
+        simulador = SimuladorMontyHall(total_opciones, args.semilla,
+                                       args.reveladas)
+        estadisticas = simulador.simular_hasta_precision(
+            args.precision, args.confianza, max_rondas=args.rondas)
+        procesos = 1
+    else:
+        progreso = None if args.silencioso else mostrar_progreso(inicio, args.rondas)
+        estadisticas = EstadisticasMontyHall()
+        estadisticas.agregar_resultado(ejecutor.ejecutar(args.rondas, progreso))
+        procesos = ejecutor.procesos
+    duracion = time.perf_counter() - inicio
+    rondas = estadisticas.mantener.n
+
+    print(describir_juego(args, total_opciones, ejecutor.reveladas))
+    print(f"Rondas: {rondas:,} en {duracion:.2f} s "
+          f"({rondas / duracion / 1e6:.1f} M rondas/s, {procesos} procesos)")
+    for nombre, acumulador in (("mantener", estadisticas.mantener),
+                               ("cambiar", estadisticas.cambiar)):
+        if args.estrategia in (nombre, "ambas"):
+            inferior, superior = acumulador.intervalo_wilson(args.confianza)
+            print(f"{nombre.capitalize()}: {acumulador.victorias:,} "
+                  f"victorias ({acumulador.media:.4%}, IC {args.confianza:.0%}: "
+                  f"{inferior:.4%} - {superior:.4%})")
+
+    if args.validar:
+        if validar_resultado(estadisticas, total_opciones, ejecutor.reveladas):
+            print("Validación: el resultado coincide con la probabilidad exacta")
+        else:
+            print("Validación: el resultado NO coincide con la probabilidad exacta")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
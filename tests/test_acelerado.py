@@ -0,0 +1,50 @@
+import unittest
+
+import pytest
+
+pytest.importorskip("numba")
+
+from modelos.acelerado import SimuladorEscalar, anfitrion_sesgado
+
+RONDAS = 50_000
+
+_PREMIOS = {}
+
+
+def anfitrion_con_diccionario(ganadora: int, eleccion: int, otra: int,
+                              azar: float, parametro: float,
+                              total_opciones: int) -> int:
+    """Presentador propio que Numba no sabe compilar (usa un dict global)."""
+    return _PREMIOS.get(ganadora, otra)
+
+
+class PruebaSimuladorEscalar(unittest.TestCase):
+    """El bucle compilado cuenta lo mismo que el de Python."""
+
+    def simular(self, anfitrion, compilar):
+        """Simula con la misma semilla y devuelve el simulador y el conteo."""
+        simulador = SimuladorEscalar(5, anfitrion, semilla=11, parametro=0.3,
+                                     compilar=compilar)
+        resultado = simulador.simular(RONDAS, tamano_lote=RONDAS // 4)
+        return simulador, (resultado.victorias_mantener,
+                           resultado.victorias_cambiar)
+
+    def test_compilado_igual_que_python(self):
+        _, compilado = self.simular(anfitrion_sesgado, True)
+        _, python = self.simular(anfitrion_sesgado, False)
+        self.assertEqual(compilado, python)
+
+    def test_presentador_no_compilable(self):
+        simulador, conteo = self.simular(anfitrion_con_diccionario, None)
+        self.assertFalse(simulador.compilado)
+        self.assertEqual(conteo,
+                         self.simular(anfitrion_con_diccionario, False)[1])
+
+    def test_compilacion_exigida(self):
+        from numba.core.errors import NumbaError
+        with self.assertRaises(NumbaError):
+            self.simular(anfitrion_con_diccionario, True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Segundos que pueden tardar en importarse todos los modelos y simular.py
+# (NumPy incluido) en un proceso nuevo
+PRESUPUESTO_IMPORTACION_S = 1.0
+
+CODIGO_IMPORTACION = """
+import importlib, json, pkgutil, sys, time
+inicio = time.perf_counter()
+import modelos
+for modulo in pkgutil.iter_modules(modelos.__path__):
+    importlib.import_module("modelos." + modulo.name)
+import simular
+print(json.dumps({"segundos": time.perf_counter() - inicio,
+                  "tkinter": "tkinter" in sys.modules}))
+"""
+
+
+class PruebaArranque(unittest.TestCase):
+    """Los modelos y la simulación por línea de comandos arrancan rápido."""
+
+    def importar_en_proceso_nuevo(self) -> dict:
+        """Importa los modelos y simular.py en un intérprete limpio."""
+        salida = subprocess.run([sys.executable, "-c", CODIGO_IMPORTACION],
+                                cwd=RAIZ, capture_output=True, text=True,
+                                check=True).stdout
+        return json.loads(salida)
+
+    def test_modelos_sin_tkinter(self):
+        self.assertFalse(self.importar_en_proceso_nuevo()["tkinter"])
+
+    def test_presupuesto_de_importacion(self):
+        # Se toma el mejor de tres intentos para no depender de la caché
+        # de disco ni de la carga de la máquina
+        segundos = min(self.importar_en_proceso_nuevo()["segundos"]
+                       for _ in range(3))
+        self.assertLess(segundos, PRESUPUESTO_IMPORTACION_S)
+
+
+if __name__ == "__main__":
+    unittest.main()
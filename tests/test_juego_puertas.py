@@ -0,0 +1,66 @@
+import random
+import unittest
+
+import numpy as np
+from modelos.aleatorio import BufferAleatorio
+from modelos.juego_puertas import JuegoPuertas, jugar_rondas_puertas
+
+RONDAS = 20_000
+
+GENERADORES = {
+    "random.Random": lambda: random.Random(7),
+    "numpy.Generator": lambda: np.random.default_rng(7),
+    "BufferAleatorio": lambda: BufferAleatorio(random.Random(7)),
+}
+
+
+def jugar_con_la_clase(rng, rondas: int, cambiar: bool) -> int:
+    """Juega las rondas con JuegoPuertas, como lo hacen las vistas."""
+    juego = JuegoPuertas(rng)
+    victorias = 0
+    for ronda in range(rondas):
+        # El constructor ya sorteó la ganadora de la primera ronda
+        if ronda:
+            juego.reiniciar()
+        juego.seleccionar_opcion(juego.rng.randint(1, 3))
+        juego.revelar_puerta()
+        if cambiar:
+            juego.cambiar_eleccion()
+        victorias += juego.verificar_victoria()
+    return victorias
+
+
+class PruebaRondasPuertas(unittest.TestCase):
+    """jugar_rondas_puertas equivale a jugar con JuegoPuertas."""
+
+    def test_misma_semilla_mismo_resultado(self):
+        for nombre, crear in GENERADORES.items():
+            for cambiar in (True, False):
+                with self.subTest(generador=nombre, cambiar=cambiar):
+                    self.assertEqual(
+                        jugar_rondas_puertas(RONDAS, crear(), cambiar),
+                        jugar_con_la_clase(crear(), RONDAS, cambiar))
+
+    def test_revelar_sin_eleccion(self):
+        # Sin elección el presentador abre cualquier puerta perdedora
+        for semilla in range(50):
+            juego = JuegoPuertas(random.Random(semilla))
+            revelada = juego.revelar_puerta()
+            self.assertNotEqual(revelada, juego.opcion_ganadora)
+            self.assertEqual(juego.opciones_reveladas, (revelada,))
+
+    def test_un_sorteo_por_ronda(self):
+        # Sin compatibilidad solo se exige la probabilidad correcta
+        for nombre, crear in GENERADORES.items():
+            with self.subTest(generador=nombre):
+                victorias = jugar_rondas_puertas(RONDAS, crear(),
+                                                 compatible=False)
+                self.assertAlmostEqual(victorias / RONDAS, 2 / 3, delta=0.02)
+                self.assertEqual(
+                    jugar_rondas_puertas(RONDAS, crear(), False,
+                                         compatible=False),
+                    RONDAS - victorias)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import asyncio
+import json
+import unittest
+
+from servidor import LIMITE_LINEA, GestorSesiones, ServidorJuegos
+
+
+class PruebaServidor(unittest.TestCase):
+    """El servidor responde con errores sin cerrar la conexión."""
+
+    def conversar(self, envios):
+        """
+        Envía bloques de bytes a un servidor nuevo y lee las respuestas.
+
+        Args:
+            envios: Bloques que se escriben uno tras otro
+
+        Returns:
+            Respuestas decodificadas, una por línea recibida
+        """
+        async def conversacion():
+            servidor = ServidorJuegos(GestorSesiones())
+            puerto = await servidor.iniciar("127.0.0.1", 0)
+            lector, escritor = await asyncio.open_connection("127.0.0.1", puerto)
+            for bloque in envios:
+                escritor.write(bloque)
+                await escritor.drain()
+            escritor.write_eof()
+            respuestas = [json.loads(linea) async for linea in lector]
+            escritor.close()
+            await servidor.cerrar()
+            return respuestas
+        return asyncio.run(asyncio.wait_for(conversacion(), 10))
+
+    def test_linea_demasiado_larga(self):
+        larga = b'{"op": "' + b"x" * (4 * LIMITE_LINEA) + b'"}\n'
+        respuestas = self.conversar([larga, b'{"op": "nueva", "id": 1}\n'])
+        self.assertEqual(len(respuestas), 2)
+        self.assertFalse(respuestas[0]["ok"])
+        self.assertTrue(respuestas[1]["ok"])
+        self.assertEqual(respuestas[1]["id"], 1)
+
+    def test_linea_larga_en_varios_envios(self):
+        trozo = b"x" * LIMITE_LINEA
+        respuestas = self.conversar([b'{"op": "', trozo, trozo, b'"}\n',
+                                     b'{"op": "nueva"}\n'])
+        self.assertEqual([r["ok"] for r in respuestas], [False, True])
+
+    def test_peticiones_malformadas(self):
+        respuestas = self.conversar([
+            b'{"op": "revelar", "sesion": [1]}\n',
+            b'{"op": ["x"]}\n',
+            b'{"op": "nueva", "modo": {}}\n',
+            b'\xff\xfe\n',
+            b'no es json\n',
+            b'{"op": "nueva"}\n',
+        ])
+        self.assertEqual([r["ok"] for r in respuestas],
+                         [False] * 5 + [True])
+
+
+if __name__ == "__main__":
+    unittest.main()
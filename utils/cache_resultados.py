@@ -0,0 +1,102 @@
+import json
+import sqlite3
+import time
+from typing import Optional, Tuple
+
+
+class CacheResultados:
+    """
+    Caché en disco (SQLite) de resultados de simulación por configuración.
+
+    Cada entrada guarda las rondas y victorias de una configuración. Al
+    superar el máximo de entradas se eliminan las usadas hace más tiempo
+    (LRU).
+
+    Attributes:
+        ruta (str): Ruta del archivo SQLite (":memory:" para una caché temporal)
+        max_entradas (int): Número máximo de entradas que se conservan
+    """
+
+    def __init__(self, ruta: str, max_entradas: int = 100_000):
+        """
+        Abre (o crea) la caché.
+
+        Args:
+            ruta: Ruta del archivo SQLite
+            max_entradas: Número máximo de entradas que se conservan
+        """
+        self.ruta = ruta
+        self.max_entradas = max_entradas
+        self._conexion = sqlite3.connect(ruta)
+        self._conexion.execute(
+            "CREATE TABLE IF NOT EXISTS resultados ("
+            " clave TEXT PRIMARY KEY,"
+            " configuracion TEXT NOT NULL,"
+            " rondas INTEGER NOT NULL,"
+            " victorias INTEGER NOT NULL,"
+            " ultimo_acceso REAL NOT NULL)"
+        )
+        self._conexion.execute(
+            "CREATE INDEX IF NOT EXISTS idx_ultimo_acceso"
+            " ON resultados (ultimo_acceso)"
+        )
+        self._conexion.commit()
+
+    def obtener(self, clave: str) -> Optional[Tuple[int, int]]:
+        """
+        Busca un resultado y marca la entrada como usada.
+
+        Args:
+            clave: Clave de la configuración
+
+        Returns:
+            Tupla (rondas, victorias) o None si no está en la caché
+        """
+        fila = self._conexion.execute(
+            "SELECT rondas, victorias FROM resultados WHERE clave = ?", (clave,)
+        ).fetchone()
+        if fila is not None:
+            self._conexion.execute(
+                "UPDATE resultados SET ultimo_acceso = ? WHERE clave = ?",
+                (time.time(), clave)
+            )
+            self._conexion.commit()
+        return fila
+
+    def guardar(self, clave: str, configuracion: dict, rondas: int,
+                victorias: int):
+        """
+        Guarda un resultado y aplica el límite de entradas.
+
+        Args:
+            clave: Clave de la configuración
+            configuracion: Descripción legible de la configuración
+            rondas: Rondas simuladas
+            victorias: Victorias obtenidas
+        """
+        self._conexion.execute(
+            "INSERT OR REPLACE INTO resultados VALUES (?, ?, ?, ?, ?)",
+            (clave, json.dumps(configuracion, sort_keys=True), rondas,
+             victorias, time.time())
+        )
+        self._conexion.execute(
+            "DELETE FROM resultados WHERE clave IN ("
+            " SELECT clave FROM resultados ORDER BY ultimo_acceso DESC"
+            " LIMIT -1 OFFSET ?)",
+            (self.max_entradas,)
+        )
+        self._conexion.commit()
+
+    def __len__(self) -> int:
+        return self._conexion.execute(
+            "SELECT COUNT(*) FROM resultados").fetchone()[0]
+
+    def cerrar(self):
+        """Cierra la conexión con la base de datos."""
+        self._conexion.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.cerrar()
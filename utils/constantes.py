@@ -24,6 +24,21 @@ COLOR_CARTA_NEGRA = "#000000"
 ANCHO_VENTANA = 1200
 ALTO_VENTANA = 700
 
+# Área de las cartas (las barajas grandes se reducen para caber en ella)
+ANCHO_AREA_CARTAS = 1100
+ALTO_AREA_CARTAS = 360
+ESCALA_MINIMA_CARTA = 0.3
+
+# Dibujo repartido entre frames (~60 fps)
+INTERVALO_FRAME_MS = 16
+PRESUPUESTO_FRAME_MS = 8
+
+# Juego automático: partidas dibujadas por segundo como máximo
+MAX_PARTIDAS_DIBUJADAS_S = 4
+
+# Consulta de la simulación en segundo plano
+INTERVALO_SONDEO_MS = 100
+
 # === FUENTES ===
 FUENTE_TITULO = ("Arial", 32, "bold")
 FUENTE_SUBTITULO = ("Arial", 18)
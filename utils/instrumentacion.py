@@ -0,0 +1,216 @@
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+
+def objetivos_modelos() -> Dict[type, Tuple[str, ...]]:
+    """
+    Métodos del ciclo de vida de los juegos que se instrumentan por defecto.
+
+    Returns:
+        Diccionario clase -> nombres de métodos definidos en esa clase
+    """
+    from modelos.juego_base import JuegoMontyHall
+    from modelos.juego_cartas import JuegoCartas
+    from modelos.juego_general import JuegoGeneralizado
+    from modelos.juego_puertas import JuegoPuertas
+
+    return {
+        JuegoMontyHall: ("__init__", "seleccionar_opcion",
+                         "verificar_victoria", "reiniciar"),
+        JuegoPuertas: ("__init__", "revelar_puerta", "cambiar_eleccion"),
+        JuegoCartas: ("__init__", "revelar_cartas", "cambiar_eleccion"),
+        JuegoGeneralizado: ("__init__", "revelar_opciones", "cambiar_eleccion"),
+    }
+
+
+def objetivos_vistas() -> Dict[type, Tuple[str, ...]]:
+    """
+    Métodos de redibujado de las vistas que se instrumentan por defecto.
+
+    Importa tkinter, así que solo se usa al instrumentar la interfaz.
+
+    Returns:
+        Diccionario clase -> nombres de métodos definidos en esa clase
+    """
+    from vistas.planificador import PlanificadorDibujo
+    from vistas.vista_cartas import VistaCartas
+    from vistas.vista_puertas import VistaPuertas
+
+    return {
+        VistaPuertas: ("dibujar_puerta_cerrada", "dibujar_puerta_abierta",
+                       "dibujar_puerta_seleccionada", "revelar_resultado",
+                       "reiniciar_juego"),
+        VistaCartas: ("dibujar_carta_dorso", "dibujar_carta_frente",
+                      "dibujar_carta_seleccionada", "revelar_cartas",
+                      "revelar_resultado", "reiniciar_juego"),
+        PlanificadorDibujo: ("_procesar_frame",),
+    }
+
+
+class Instrumentacion:
+    """
+    Mide llamadas a métodos de los juegos y de las vistas bajo demanda.
+
+    Al activarla, los métodos indicados se sustituyen en sus clases por
+    envoltorios que toman el tiempo de cada llamada; al desactivarla se
+    restauran los originales, así que sin activar no añade ningún coste.
+    Cada llamada medida produce un evento (nombre, categoría, inicio,
+    duración, hilo) que se guarda en un buffer circular y se entrega a los
+    suscriptores. Los eventos se pueden resumir en un informe o exportar
+    en el formato de trazas de Chrome (chrome://tracing, Perfetto).
+
+    Attributes:
+        eventos (deque): Últimos eventos (nombre, categoría, inicio_ns,
+            duración_ns, hilo)
+        suscriptores (List[Callable]): Funciones llamadas con cada evento
+    """
+
+    def __init__(self, max_eventos: int = 1_000_000):
+        """
+        Inicializa la instrumentación desactivada.
+
+        Args:
+            max_eventos: Eventos que se conservan (se descartan los más antiguos)
+        """
+        self.eventos = deque(maxlen=max_eventos)
+        self.suscriptores: List[Callable[[tuple], None]] = []
+        self._originales = []
+        self._origen_ns = time.perf_counter_ns()
+
+    @property
+    def activa(self) -> bool:
+        """Indica si hay métodos instrumentados."""
+        return bool(self._originales)
+
+    def activar(self, objetivos: Optional[Dict[type, Iterable[str]]] = None,
+                vistas: bool = False):
+        """
+        Instrumenta los métodos indicados.
+
+        Args:
+            objetivos: Diccionario clase -> nombres de métodos (por defecto,
+                el ciclo de vida de los juegos)
+            vistas: Si es True, instrumenta también el redibujado de las vistas
+        """
+        if self.activa:
+            raise RuntimeError("La instrumentación ya está activa")
+        if objetivos is None:
+            objetivos = objetivos_modelos()
+            if vistas:
+                objetivos.update(objetivos_vistas())
+        for clase, nombres in objetivos.items():
+            categoria = clase.__module__.split(".")[0]
+            for nombre in nombres:
+                original = vars(clase)[nombre]
+                setattr(clase, nombre,
+                        self._envolver(original, f"{clase.__name__}.{nombre}",
+                                       categoria))
+                self._originales.append((clase, nombre, original))
+
+    def desactivar(self):
+        """Restaura los métodos originales."""
+        for clase, nombre, original in reversed(self._originales):
+            setattr(clase, nombre, original)
+        self._originales.clear()
+
+    def _envolver(self, funcion: Callable, nombre: str,
+                  categoria: str) -> Callable:
+        """Crea el envoltorio que mide una función."""
+        registrar = self.registrar
+        reloj = time.perf_counter_ns
+
+        @functools.wraps(funcion)
+        def envoltorio(*args, **kwargs):
+            inicio = reloj()
+            try:
+                return funcion(*args, **kwargs)
+            finally:
+                registrar(nombre, categoria, inicio, reloj() - inicio)
+        return envoltorio
+
+    def registrar(self, nombre: str, categoria: str, inicio_ns: int,
+                  duracion_ns: int):
+        """
+        Anota un evento medido.
+
+        Args:
+            nombre: Nombre del evento (p. ej. "JuegoPuertas.revelar_puerta")
+            categoria: Categoría ("modelos", "vistas"...)
+            inicio_ns: Instante de inicio según time.perf_counter_ns
+            duracion_ns: Duración en nanosegundos
+        """
+        evento = (nombre, categoria, inicio_ns, duracion_ns,
+                  threading.get_ident())
+        self.eventos.append(evento)
+        for suscriptor in self.suscriptores:
+            suscriptor(evento)
+
+    def suscribir(self, funcion: Callable[[tuple], None]):
+        """
+        Añade una función que recibe cada evento al registrarse.
+
+        Args:
+            funcion: Función llamada con la tupla del evento
+        """
+        self.suscriptores.append(funcion)
+
+    def resumen(self) -> Dict[str, Tuple[int, float, float]]:
+        """
+        Agrega los eventos por nombre.
+
+        Returns:
+            Diccionario nombre -> (llamadas, segundos totales, segundos máximos)
+        """
+        totales = {}
+        for nombre, _, _, duracion, _ in self.eventos:
+            llamadas, total, maximo = totales.get(nombre, (0, 0, 0))
+            totales[nombre] = (llamadas + 1, total + duracion,
+                               max(maximo, duracion))
+        return {nombre: (llamadas, total / 1e9, maximo / 1e9)
+                for nombre, (llamadas, total, maximo) in totales.items()}
+
+    def informe(self) -> str:
+        """
+        Genera una tabla con los tiempos por evento, de mayor a menor total.
+
+        Returns:
+            Texto del informe
+        """
+        lineas = [f"{'evento':45s} {'llamadas':>10s} {'total ms':>10s} "
+                  f"{'media µs':>10s} {'máx µs':>10s}"]
+        resumen = sorted(self.resumen().items(), key=lambda e: -e[1][1])
+        for nombre, (llamadas, total, maximo) in resumen:
+            lineas.append(f"{nombre:45s} {llamadas:10d} {total * 1e3:10.2f} "
+                          f"{total / llamadas * 1e6:10.2f} {maximo * 1e6:10.2f}")
+        return "\n".join(lineas)
+
+    def exportar_chrome(self, ruta: str):
+        """
+        Guarda los eventos como traza de Chrome (formato JSON de eventos "X").
+
+        Args:
+            ruta: Archivo JSON de destino
+        """
+        pid = os.getpid()
+        eventos = [
+            {"name": nombre, "cat": categoria, "ph": "X",
+             "ts": (inicio - self._origen_ns) / 1000,
+             "dur": duracion / 1000, "pid": pid, "tid": hilo}
+            for nombre, categoria, inicio, duracion, hilo in self.eventos
+        ]
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            json.dump({"traceEvents": eventos, "displayTimeUnit": "ms"},
+                      archivo)
+
+    def __enter__(self):
+        if not self.activa:
+            self.activar()
+        return self
+
+    def __exit__(self, *args):
+        self.desactivar()
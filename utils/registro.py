@@ -0,0 +1,189 @@
+import os
+import struct
+
+# Cabecera del archivo: identificador y versión del formato
+CABECERA = b"MHLOG\x00\x00\x01"
+
+# Cada ronda ocupa 14 bytes: ganadora, elección inicial y opción cerrada
+# restante (uint32) más cambio y victoria (uint8), en little-endian.
+FORMATO_RONDA = struct.Struct("<IIIBB")
+TAMANO_RONDA = FORMATO_RONDA.size
+
+CAMPOS = ("ganadora", "eleccion", "oculta", "cambio", "gano")
+
+
+def tipo_ronda():
+    """
+    Obtiene el dtype de NumPy equivalente a FORMATO_RONDA.
+
+    Returns:
+        numpy.dtype estructurado sin relleno
+    """
+    import numpy as np
+    return np.dtype([("ganadora", "<u4"), ("eleccion", "<u4"),
+                     ("oculta", "<u4"), ("cambio", "u1"), ("gano", "u1")])
+
+
+class EscritorRegistro:
+    """
+    Escribe rondas en un registro binario de solo anexado.
+
+    Las rondas se acumulan en un buffer en memoria y se escriben al archivo
+    en bloques, de modo que registrar una partida desde la interfaz o millones
+    desde el simulador no implica una escritura por ronda.
+
+    Attributes:
+        ruta (str): Ruta del archivo de registro
+        rondas_por_bloque (int): Rondas acumuladas antes de escribir
+    """
+
+    def __init__(self, ruta: str, rondas_por_bloque: int = 65536):
+        """
+        Abre (o crea) el registro para anexar rondas.
+
+        Args:
+            ruta: Ruta del archivo de registro
+            rondas_por_bloque: Rondas acumuladas antes de escribir al archivo
+        """
+        self.ruta = ruta
+        self.rondas_por_bloque = rondas_por_bloque
+        self._buffer = bytearray()
+        self._archivo = open(ruta, "ab")
+        if self._archivo.tell() == 0:
+            self._archivo.write(CABECERA)
+        else:
+            with open(ruta, "rb") as archivo:
+                if archivo.read(len(CABECERA)) != CABECERA:
+                    self._archivo.close()
+                    raise ValueError(f"{ruta} no es un registro de Monty Hall")
+
+    def registrar(self, ganadora: int, eleccion: int, oculta: int,
+                  cambio: bool, gano: bool):
+        """
+        Añade una ronda al registro.
+
+        Args:
+            ganadora: Opción ganadora
+            eleccion: Elección inicial del usuario
+            oculta: Opción que quedó cerrada además de la elegida
+            cambio: True si el usuario cambió de elección
+            gano: True si el usuario ganó
+        """
+        self._buffer += FORMATO_RONDA.pack(ganadora, eleccion, oculta,
+                                           cambio, gano)
+        if len(self._buffer) >= self.rondas_por_bloque * TAMANO_RONDA:
+            self.volcar()
+
+    def registrar_lote(self, ganadoras, elecciones, ocultas, cambios, victorias):
+        """
+        Añade un lote de rondas a partir de arreglos de NumPy.
+
+        Args:
+            ganadoras: Opciones ganadoras
+            elecciones: Elecciones iniciales
+            ocultas: Opciones que quedaron cerradas además de la elegida
+            cambios: Indica en qué rondas se cambió de elección
+            victorias: Indica qué rondas se ganaron
+        """
+        import numpy as np
+        lote = np.empty(len(ganadoras), dtype=tipo_ronda())
+        lote["ganadora"] = ganadoras
+        lote["eleccion"] = elecciones
+        lote["oculta"] = ocultas
+        lote["cambio"] = cambios
+        lote["gano"] = victorias
+        self.volcar()
+        self._archivo.write(lote.tobytes())
+
+    def volcar(self):
+        """Escribe en el archivo las rondas pendientes del buffer."""
+        if self._buffer:
+            self._archivo.write(self._buffer)
+            self._buffer = bytearray()
+        self._archivo.flush()
+
+    def cerrar(self):
+        """Escribe las rondas pendientes y cierra el archivo."""
+        if not self._archivo.closed:
+            self.volcar()
+            self._archivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.cerrar()
+
+
+class LectorRegistro:
+    """
+    Lee un registro binario proyectándolo en memoria con NumPy.
+
+    Las columnas son vistas sobre el archivo mapeado, sin copiarlo, por lo
+    que se pueden agregar registros mayores que la memoria disponible.
+
+    Attributes:
+        ruta (str): Ruta del archivo de registro
+        rondas: Arreglo estructurado (numpy.memmap) con una fila por ronda
+    """
+
+    def __init__(self, ruta: str):
+        """
+        Abre el registro para lectura.
+
+        Args:
+            ruta: Ruta del archivo de registro
+        """
+        import numpy as np
+        self.ruta = ruta
+        with open(ruta, "rb") as archivo:
+            if archivo.read(len(CABECERA)) != CABECERA:
+                raise ValueError(f"{ruta} no es un registro de Monty Hall")
+        total = (os.path.getsize(ruta) - len(CABECERA)) // TAMANO_RONDA
+        if total:
+            self.rondas = np.memmap(ruta, dtype=tipo_ronda(), mode="r",
+                                    offset=len(CABECERA), shape=(total,))
+        else:
+            self.rondas = np.empty(0, dtype=tipo_ronda())
+
+    def __len__(self) -> int:
+        return len(self.rondas)
+
+    def columna(self, nombre: str):
+        """
+        Obtiene una columna del registro sin copiarla.
+
+        Args:
+            nombre: Uno de CAMPOS
+
+        Returns:
+            Vista de NumPy sobre la columna
+        """
+        return self.rondas[nombre]
+
+    def resumen(self, tamano_bloque: int = 1 << 24) -> dict:
+        """
+        Cuenta partidas y victorias según si se cambió de elección.
+
+        Recorre el archivo por bloques para no cargarlo entero en memoria.
+
+        Args:
+            tamano_bloque: Rondas procesadas por bloque
+
+        Returns:
+            Diccionario con partidas y victorias de "mantener" y "cambiar"
+        """
+        import numpy as np
+        resumen = {"mantener": [0, 0], "cambiar": [0, 0]}
+        for inicio in range(0, len(self.rondas), tamano_bloque):
+            bloque = self.rondas[inicio:inicio + tamano_bloque]
+            cambio = bloque["cambio"].astype(bool)
+            gano = bloque["gano"].astype(bool)
+            cambios = int(np.count_nonzero(cambio))
+            victorias_cambio = int(np.count_nonzero(gano & cambio))
+            resumen["cambiar"][0] += cambios
+            resumen["cambiar"][1] += victorias_cambio
+            resumen["mantener"][0] += len(bloque) - cambios
+            resumen["mantener"][1] += int(np.count_nonzero(gano)) - victorias_cambio
+        return {estrategia: {"partidas": partidas, "victorias": victorias}
+                for estrategia, (partidas, victorias) in resumen.items()}
@@ -0,0 +1,170 @@
+import math
+import time
+import tkinter as tk
+from modelos.estadisticas import EstadisticasMontyHall
+from modelos.estrategias import JugadorAleatorio, JugadorCambiar, JugadorMantener
+from utils.constantes import *
+
+
+class PanelAutoJuego:
+    """
+    Panel que juega partidas automáticas en una vista de juego.
+
+    En cada frame se juegan las partidas que corresponden a la velocidad
+    elegida, sin pasar de un presupuesto de tiempo. Solo se dibuja una de
+    cada k partidas, con k elegido para no superar MAX_PARTIDAS_DIBUJADAS_S
+    partidas dibujadas por segundo; el resto se juegan solo sobre el modelo
+    y se suman a los contadores. La vista debe ofrecer
+    jugar_partida_automatica(jugador, dibujar) y reiniciar_juego().
+
+    Attributes:
+        vista: Vista de juego controlada (VistaPuertas o VistaCartas)
+        estadisticas (EstadisticasMontyHall): Resultados acumulados
+        jugadas (int): Partidas jugadas desde que se inició
+    """
+
+    JUGADORES = {
+        "Cambiar siempre": JugadorCambiar(),
+        "Mantener siempre": JugadorMantener(),
+        "Al azar": JugadorAleatorio(),
+    }
+
+    VELOCIDADES = {
+        "1 partida/s": 1,
+        "10 partidas/s": 10,
+        "100 partidas/s": 100,
+        "1000 partidas/s": 1000,
+        "10000 partidas/s": 10000,
+    }
+
+    def __init__(self, master, vista):
+        """
+        Crea los controles del panel.
+
+        Args:
+            master: Widget donde se coloca el panel
+            vista: Vista de juego controlada
+        """
+        self.vista = vista
+        self.ventana = vista.ventana
+        self.estadisticas = EstadisticasMontyHall()
+        self.jugadas = 0
+        self.pendientes = 0.0
+        self.ultimo_frame = None
+        self.tarea = None
+
+        frame = tk.Frame(master, bg=COLOR_FONDO)
+        frame.pack(pady=5)
+
+        self.jugador = tk.StringVar(self.ventana, value="Cambiar siempre")
+        selector_jugador = tk.OptionMenu(frame, self.jugador, *self.JUGADORES)
+        selector_jugador.configure(font=FUENTE_TEXTO, bg=COLOR_ACENTO,
+                                   fg=COLOR_TEXTO, highlightthickness=0)
+        selector_jugador.pack(side=tk.LEFT, padx=5)
+
+        self.velocidad = tk.StringVar(self.ventana, value="1 partida/s")
+        selector_velocidad = tk.OptionMenu(frame, self.velocidad,
+                                           *self.VELOCIDADES)
+        selector_velocidad.configure(font=FUENTE_TEXTO, bg=COLOR_ACENTO,
+                                     fg=COLOR_TEXTO, highlightthickness=0)
+        selector_velocidad.pack(side=tk.LEFT, padx=5)
+
+        self.solo_contadores = tk.BooleanVar(self.ventana, value=False)
+        casilla = tk.Checkbutton(
+            frame,
+            text="Solo contadores",
+            variable=self.solo_contadores,
+            font=FUENTE_TEXTO,
+            bg=COLOR_FONDO,
+            fg=COLOR_TEXTO_SECUNDARIO,
+            selectcolor=COLOR_FONDO_SECUNDARIO
+        )
+        casilla.pack(side=tk.LEFT, padx=5)
+
+        self.btn_auto = tk.Button(
+            frame,
+            text="▶ Auto",
+            font=FUENTE_TEXTO,
+            bg=COLOR_BOTON_SUCCESS,
+            fg=COLOR_TEXTO,
+            width=10,
+            cursor="hand2",
+            command=self.alternar
+        )
+        self.btn_auto.pack(side=tk.LEFT, padx=5)
+
+        self.contadores = tk.Label(
+            frame,
+            text="",
+            font=FUENTE_TEXTO,
+            bg=COLOR_FONDO,
+            fg=COLOR_TEXTO_SECUNDARIO
+        )
+        self.contadores.pack(side=tk.LEFT, padx=10)
+
+    @property
+    def activo(self):
+        """Indica si el juego automático está en marcha."""
+        return self.tarea is not None
+
+    def alternar(self):
+        """Inicia o detiene el juego automático."""
+        if self.activo:
+            self.detener()
+        else:
+            self.iniciar()
+
+    def iniciar(self):
+        """Empieza a jugar partidas automáticas desde cero."""
+        self.estadisticas = EstadisticasMontyHall()
+        self.jugadas = 0
+        self.pendientes = 1.0  # La primera partida se juega de inmediato
+        self.ultimo_frame = time.perf_counter()
+        self.vista.ocultar_botones()
+        self.vista.fase = "auto"
+        self.btn_auto.config(text="⏹ Parar", bg=COLOR_BOTON_WARNING)
+        self.tarea = self.ventana.after(0, self.jugar_frame)
+
+    def detener(self):
+        """Detiene el juego automático y deja la vista lista para jugar."""
+        if not self.activo:
+            return
+        self.ventana.after_cancel(self.tarea)
+        self.tarea = None
+        self.btn_auto.config(text="▶ Auto", bg=COLOR_BOTON_SUCCESS)
+        self.vista.reiniciar_juego()
+
+    def jugar_frame(self):
+        """Juega las partidas que corresponden a este frame."""
+        jugador = self.JUGADORES[self.jugador.get()]
+        velocidad = self.VELOCIDADES[self.velocidad.get()]
+        cada = max(1, math.ceil(velocidad / MAX_PARTIDAS_DIBUJADAS_S))
+        solo_contadores = self.solo_contadores.get()
+
+        # Partidas acumuladas, sin arrastrar más de un cuarto de segundo
+        ahora = time.perf_counter()
+        self.pendientes = min(self.pendientes
+                              + (ahora - self.ultimo_frame) * velocidad,
+                              velocidad / 4 + 1)
+        self.ultimo_frame = ahora
+
+        limite = ahora + PRESUPUESTO_FRAME_MS / 1000
+        while self.pendientes >= 1 and time.perf_counter() < limite:
+            self.pendientes -= 1
+            self.jugadas += 1
+            dibujar = not solo_contadores and self.jugadas % cada == 0
+            cambio = self.vista.jugar_partida_automatica(jugador, dibujar)
+            self.estadisticas.registrar_partida(self.vista.juego, cambio)
+
+        self.actualizar_contadores()
+        self.tarea = self.ventana.after(INTERVALO_FRAME_MS, self.jugar_frame)
+
+    def actualizar_contadores(self):
+        """Muestra las partidas jugadas y las tasas de victoria."""
+        partes = [f"Partidas: {self.jugadas:,}"]
+        for nombre, acumulador in (("Mantener", self.estadisticas.mantener),
+                                   ("Cambiar", self.estadisticas.cambiar)):
+            if acumulador.n:
+                partes.append(f"{nombre}: {acumulador.media:.1%} "
+                              f"({int(acumulador.n):,})")
+        self.contadores.config(text=" | ".join(partes))
@@ -5,16 +5,23 @@ from utils.constantes import *
 class MenuPrincipal:
     """
     Clase que representa el menú principal de la aplicación.
+    
+    Las vistas de juego se construyen la primera vez que se abren y se
+    guardan; al navegar solo se ocultan y se vuelven a mostrar.
     """
     
-    def __init__(self, ventana):
+    def __init__(self, ventana, registro=None):
         """
         Inicializa el menú principal.
         
         Args:
             ventana: Ventana principal de tkinter
+            registro: EscritorRegistro opcional donde anotar las partidas
         """
         self.ventana = ventana
+        self.registro = registro
+        self.vistas = {}
+        self.vista_actual = None
         self.ventana.title("Paradoja de Monty Hall")
         self.ventana.geometry(f"{ANCHO_VENTANA}x{ALTO_VENTANA}")
         self.ventana.configure(bg=COLOR_FONDO)
@@ -26,6 +33,7 @@ class MenuPrincipal:
         # Frame principal
         frame_principal = tk.Frame(self.ventana, bg=COLOR_FONDO)
         frame_principal.place(relx=0.5, rely=0.5, anchor="center")
+        self.frame_principal = frame_principal
         
         # Título
         titulo = tk.Label(
@@ -79,6 +87,20 @@ class MenuPrincipal:
         )
         btn_cartas.pack(side=tk.LEFT, padx=20)
         
+        # Botón simulación en vivo
+        btn_simulacion = tk.Button(
+            frame_botones,
+            text="📈 SIMULACIÓN EN VIVO\n\nMillones de rondas",
+            font=FUENTE_BOTON,
+            bg=COLOR_BOTON_PRIMARY,
+            fg=COLOR_TEXTO,
+            width=25,
+            height=6,
+            cursor="hand2",
+            command=self.iniciar_simulacion
+        )
+        btn_simulacion.pack(side=tk.LEFT, padx=20)
+        
         # Información
         info_frame = tk.Frame(frame_principal, bg=COLOR_FONDO_SECUNDARIO, 
                              relief=tk.RAISED, borderwidth=2)
@@ -109,21 +131,40 @@ class MenuPrincipal:
     def iniciar_juego_puertas(self):
         """Inicia el juego de las 3 puertas."""
         from vistas.vista_puertas import VistaPuertas
-        self.limpiar_ventana()
-        VistaPuertas(self.ventana, self.volver_menu)
+        self.mostrar_vista("puertas", VistaPuertas)
         
     def iniciar_juego_cartas(self):
         """Inicia el juego de las 52 cartas."""
         from vistas.vista_cartas import VistaCartas
-        self.limpiar_ventana()
-        VistaCartas(self.ventana, self.volver_menu)
+        self.mostrar_vista("cartas", VistaCartas)
+        
+    def iniciar_simulacion(self):
+        """Abre el panel de simulación en vivo."""
+        from vistas.vista_simulacion import VistaSimulacion
+        self.mostrar_vista("simulacion", VistaSimulacion)
+        
+    def mostrar_vista(self, nombre, clase_vista):
+        """
+        Muestra una vista de juego, creándola solo la primera vez.
         
-    def limpiar_ventana(self):
-        """Limpia todos los widgets de la ventana."""
-        for widget in self.ventana.winfo_children():
-            widget.destroy()
+        Args:
+            nombre: Clave de la vista en la caché
+            clase_vista: Clase de la vista a crear si no existe
+        """
+        self.frame_principal.place_forget()
+        vista = self.vistas.get(nombre)
+        if vista is None:
+            vista = clase_vista(self.ventana, self.volver_menu, self.registro)
+            self.vistas[nombre] = vista
+        else:
+            vista.reiniciar_juego()
+            vista.mostrar()
+        self.vista_actual = vista
             
     def volver_menu(self):
         """Vuelve al menú principal."""
-        self.limpiar_ventana()
-        self.__init__(self.ventana)
+        if self.vista_actual is not None:
+            self.vista_actual.ocultar()
+            self.vista_actual = None
+        self.ventana.configure(bg=COLOR_FONDO)
+        self.frame_principal.place(relx=0.5, rely=0.5, anchor="center")
@@ -0,0 +1,109 @@
+import time
+from utils.constantes import INTERVALO_FRAME_MS, PRESUPUESTO_FRAME_MS
+
+
+class PlanificadorDibujo:
+    """
+    Reparte actualizaciones de dibujo entre frames sucesivos del bucle de Tk.
+
+    Cada actualización se programa con una clave (por ejemplo, el número de
+    carta); si se vuelve a programar la misma clave antes de dibujarse, solo
+    se ejecuta la última. En cada frame se ejecutan actualizaciones hasta
+    agotar el presupuesto de tiempo y el resto queda para el siguiente, de
+    modo que la ventana sigue respondiendo con barajas de miles de cartas.
+
+    Attributes:
+        ventana: Widget de tkinter usado para programar los frames
+        presupuesto (float): Segundos de dibujo por frame
+        intervalo (int): Milisegundos entre frames
+    """
+
+    def __init__(self, ventana, presupuesto_ms=PRESUPUESTO_FRAME_MS,
+                 intervalo_ms=INTERVALO_FRAME_MS):
+        """
+        Inicializa el planificador.
+
+        Args:
+            ventana: Widget de tkinter usado para programar los frames
+            presupuesto_ms: Milisegundos de dibujo por frame
+            intervalo_ms: Milisegundos entre frames
+        """
+        self.ventana = ventana
+        self.presupuesto = presupuesto_ms / 1000
+        self.intervalo = intervalo_ms
+        self._pendientes = {}
+        self._al_terminar = []
+        self._tarea = None
+
+    def programar(self, clave, funcion, *args):
+        """
+        Programa una actualización, sustituyendo la pendiente con la misma clave.
+
+        Args:
+            clave: Identificador del elemento que se redibuja
+            funcion: Función de dibujo
+            *args: Argumentos de la función
+        """
+        self._pendientes[clave] = (funcion, args)
+        if self._tarea is None:
+            self._tarea = self.ventana.after(0, self._procesar_frame)
+
+    def al_terminar(self, funcion):
+        """
+        Llama a una función cuando no queden actualizaciones pendientes.
+
+        Si no hay ninguna pendiente, se llama de inmediato.
+
+        Args:
+            funcion: Función sin argumentos
+        """
+        if self._pendientes:
+            self._al_terminar.append(funcion)
+        else:
+            funcion()
+
+    def vaciar(self):
+        """Ejecuta ya todas las actualizaciones pendientes."""
+        if self._tarea is not None:
+            self.ventana.after_cancel(self._tarea)
+            self._tarea = None
+        while self._pendientes:
+            self._ejecutar_siguiente()
+        self._terminar()
+
+    def cancelar(self):
+        """Descarta las actualizaciones pendientes y sus avisos de final."""
+        if self._tarea is not None:
+            self.ventana.after_cancel(self._tarea)
+            self._tarea = None
+        self._pendientes.clear()
+        self._al_terminar.clear()
+
+    def __len__(self):
+        return len(self._pendientes)
+
+    def _ejecutar_siguiente(self):
+        """Ejecuta la actualización pendiente más antigua."""
+        clave = next(iter(self._pendientes))
+        funcion, args = self._pendientes.pop(clave)
+        funcion(*args)
+
+    def _procesar_frame(self):
+        """Ejecuta actualizaciones hasta agotar el presupuesto del frame."""
+        self._tarea = None
+        limite = time.perf_counter() + self.presupuesto
+        while self._pendientes:
+            self._ejecutar_siguiente()
+            if time.perf_counter() >= limite:
+                break
+        if self._pendientes:
+            self._tarea = self.ventana.after(self.intervalo,
+                                             self._procesar_frame)
+        else:
+            self._terminar()
+
+    def _terminar(self):
+        """Llama a las funciones que esperaban el final del dibujo."""
+        funciones, self._al_terminar = self._al_terminar, []
+        for funcion in funciones:
+            funcion()
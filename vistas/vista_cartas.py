@@ -1,28 +1,41 @@
 import tkinter as tk
-from tkinter import ttk
 from modelos.juego_cartas import JuegoCartas
 from utils.constantes import *
+from vistas.auto_juego import PanelAutoJuego
+from vistas.planificador import PlanificadorDibujo
 
 
 class VistaCartas:
     """
-    Clase que representa la interfaz visual del juego de las 52 cartas.
+    Clase que representa la interfaz visual del juego de las cartas.
+    
+    Los widgets se crean una sola vez: al jugar de nuevo se reinicia el
+    modelo y se redibujan los elementos existentes.
     """
     
-    def __init__(self, ventana, callback_volver):
+    MENSAJE_INICIAL = "Elige una carta. Una de ellas es la GANADORA ⭐"
+    
+    def __init__(self, ventana, callback_volver, registro=None, baraja=None):
         """
         Inicializa la vista del juego de cartas.
         
         Args:
             ventana: Ventana principal de tkinter
             callback_volver: Función para volver al menú
+            registro: EscritorRegistro opcional donde anotar cada partida
+            baraja: Baraja opcional (por defecto, la estándar de 52 cartas)
         """
         self.ventana = ventana
         self.callback_volver = callback_volver
-        self.juego = JuegoCartas()
-        self.fase = "seleccion"  # seleccion, reveladas, final
+        self.registro = registro
+        self.baraja = baraja
+        self.eleccion_inicial = None
+        self.juego = JuegoCartas(baraja=baraja)
+        self.fase = "seleccion"  # seleccion, revelando, decision, final, auto
         self.carta_oculta = None
-        self.canvas_cartas = {}
+        self.items_cartas = {}
+        self.tarea_pendiente = None
+        self.planificador = PlanificadorDibujo(ventana)
         
         self.crear_interfaz()
         
@@ -37,7 +50,7 @@ class VistaCartas:
         # Título
         self.titulo = tk.Label(
             self.frame_principal,
-            text="🃏 JUEGO DE LAS 52 CARTAS",
+            text=f"🃏 JUEGO DE LAS {self.juego.total_opciones} CARTAS",
             font=FUENTE_TITULO,
             bg=COLOR_FONDO,
             fg=COLOR_TEXTO
@@ -47,7 +60,7 @@ class VistaCartas:
         # Mensaje
         self.mensaje = tk.Label(
             self.frame_principal,
-            text="Elige una carta. Una de ellas es la GANADORA ⭐",
+            text=self.MENSAJE_INICIAL,
             font=FUENTE_SUBTITULO,
             bg=COLOR_FONDO,
             fg=COLOR_TEXTO_SECUNDARIO
@@ -60,6 +73,10 @@ class VistaCartas:
         # Frame para botones
         self.frame_botones = tk.Frame(self.frame_principal, bg=COLOR_FONDO)
         self.frame_botones.pack(pady=20)
+        self.crear_botones()
+        
+        # Juego automático
+        self.panel_auto = PanelAutoJuego(self.frame_principal, self)
         
         # Botón volver
         btn_volver = tk.Button(
@@ -73,92 +90,228 @@ class VistaCartas:
         )
         btn_volver.pack(pady=10)
         
+    def crear_botones(self):
+        """Crea los botones de decisión y de nueva partida, sin mostrarlos."""
+        self.btn_mantener = tk.Button(
+            self.frame_botones,
+            text="Mantener mi carta",
+            font=FUENTE_BOTON,
+            bg=COLOR_BOTON_SUCCESS,
+            fg=COLOR_TEXTO,
+            width=20,
+            height=2,
+            cursor="hand2",
+            command=self.mantener_eleccion
+        )
+        
+        self.btn_cambiar = tk.Button(
+            self.frame_botones,
+            text="Cambiar de carta",
+            font=FUENTE_BOTON,
+            bg=COLOR_BOTON_WARNING,
+            fg=COLOR_TEXTO,
+            width=20,
+            height=2,
+            cursor="hand2",
+            command=self.cambiar_eleccion
+        )
+        
+        self.btn_nuevo = tk.Button(
+            self.frame_botones,
+            text="🔄 Jugar de nuevo",
+            font=FUENTE_BOTON,
+            bg=COLOR_BOTON_PRIMARY,
+            fg=COLOR_TEXTO,
+            width=20,
+            height=2,
+            cursor="hand2",
+            command=self.reiniciar_juego
+        )
+        
+    def ocultar_botones(self):
+        """Oculta los botones de decisión y de nueva partida."""
+        for boton in (self.btn_mantener, self.btn_cambiar, self.btn_nuevo):
+            boton.pack_forget()
+        
     def crear_area_cartas(self):
-        """Crea el área para mostrar las cartas."""
+        """
+        Crea el área de las cartas: un único Canvas con todas ellas.
+        
+        Cada carta se compone de elementos persistentes del Canvas que se
+        actualizan con itemconfigure, y los clicks se asignan a una carta
+        según sus coordenadas, de modo que la vista admite barajas de
+        cientos o miles de cartas.
+        """
+        total = self.juego.total_opciones
+        self.calcular_disposicion(total)
+        
         # Frame contenedor para las cartas
         self.frame_cartas = tk.Frame(self.frame_principal, bg=COLOR_FONDO)
         self.frame_cartas.pack(pady=10)
         
-        # Crear las 52 cartas en una cuadrícula de 4 filas x 13 columnas
-        for i in range(1, 53):
-            fila = (i - 1) // 13
-            columna = (i - 1) % 13
+        ancho_total = self.columnas * self.paso_x
+        alto_total = -(-total // self.columnas) * self.paso_y
+        alto_visible = min(alto_total, ALTO_AREA_CARTAS)
+        self.lienzo = tk.Canvas(
+            self.frame_cartas,
+            width=ancho_total,
+            height=alto_visible,
+            bg=COLOR_FONDO,
+            highlightthickness=0,
+            cursor="hand2",
+            scrollregion=(0, 0, ancho_total, alto_total)
+        )
+        self.lienzo.pack(side=tk.LEFT)
+        
+        # Barra de desplazamiento si las cartas no caben
+        if alto_total > alto_visible:
+            barra = tk.Scrollbar(self.frame_cartas, orient=tk.VERTICAL,
+                                 command=self.lienzo.yview)
+            barra.pack(side=tk.RIGHT, fill=tk.Y)
+            self.lienzo.configure(yscrollcommand=barra.set)
+        
+        self.lienzo.bind("<Button-1>", self.click_lienzo)
+        self.crear_items_cartas()
+        
+    def calcular_disposicion(self, total):
+        """
+        Calcula el tamaño de las cartas y el número de columnas.
+        
+        Con 52 cartas se mantiene la cuadrícula de 4 filas x 13 columnas;
+        con más cartas se reducen hasta caber en el área disponible.
+        
+        Args:
+            total: Número de cartas
+        """
+        if total <= 52:
+            escala = 1.0
+            self.columnas = 13
+        else:
+            area_carta = ANCHO_AREA_CARTAS * ALTO_AREA_CARTAS / total
+            escala = max(ESCALA_MINIMA_CARTA,
+                         min(1.0, (area_carta / (54 * 83)) ** 0.5))
+            self.columnas = max(1, int(ANCHO_AREA_CARTAS // (54 * escala)))
+        self.escala = escala
+        self.ancho_carta = 50 * escala
+        self.alto_carta = 65 * escala
+        self.con_etiqueta = escala >= 0.6
+        self.paso_x = self.ancho_carta + 4
+        self.paso_y = self.alto_carta + 4 + (14 if self.con_etiqueta else 0)
+        
+    def crear_items_cartas(self):
+        """Crea los elementos persistentes de cada carta en el Canvas."""
+        self.items_cartas = {}
+        for i in range(1, self.juego.total_opciones + 1):
+            fila = (i - 1) // self.columnas
+            columna = (i - 1) % self.columnas
             self.crear_carta_pequena(i, fila, columna)
             
     def crear_carta_pequena(self, numero, fila, columna):
         """
-        Crea una carta pequeña en la cuadrícula.
+        Crea los elementos de una carta pequeña en la cuadrícula.
         
         Args:
-            numero: Número de la carta (1-52)
+            numero: Número de la carta
             fila: Fila en la cuadrícula
             columna: Columna en la cuadrícula
         """
-        frame = tk.Frame(self.frame_cartas, bg=COLOR_FONDO)
-        frame.grid(row=fila, column=columna, padx=2, pady=2)
-        
-        canvas = tk.Canvas(
-            frame,
-            width=50,
-            height=65,
-            bg=COLOR_FONDO,
-            highlightthickness=0
+        x = columna * self.paso_x + 2
+        y = fila * self.paso_y + 2
+        ancho, alto = self.ancho_carta, self.alto_carta
+        escala = self.escala
+        
+        fondo = self.lienzo.create_rectangle(
+            x + 3 * escala, y + 3 * escala,
+            x + ancho - 3 * escala, y + alto - 3 * escala,
+            width=2
         )
-        canvas.pack()
-        
-        # Dibujar carta boca abajo
-        self.dibujar_carta_dorso(canvas, numero)
-        
-        # Etiqueta con posición
-        label = tk.Label(
-            frame,
-            text=f"#{numero}",
-            font=("Arial", 7),
-            bg=COLOR_FONDO,
-            fg=COLOR_TEXTO_SECUNDARIO
+        texto = self.lienzo.create_text(x + ancho / 2, y + alto / 2)
+        borde = self.lienzo.create_rectangle(
+            x + 1, y + 1, x + ancho - 1, y + alto - 1,
+            outline=COLOR_PUERTA_SELECCIONADA, width=3, state=tk.HIDDEN
+        )
+        estrella = self.lienzo.create_text(
+            x + 30 * escala, y + 10 * escala, text="⭐",
+            font=("Arial", max(6, int(12 * escala))), state=tk.HIDDEN
         )
-        label.pack()
+        if self.con_etiqueta:
+            # Etiqueta con posición
+            self.lienzo.create_text(
+                x + ancho / 2, y + alto + 8, text=f"#{numero}",
+                font=("Arial", 7), fill=COLOR_TEXTO_SECUNDARIO
+            )
         
-        # Bind para click
-        canvas.bind("<Button-1>", lambda e, n=numero: self.click_carta(n))
-        canvas.bind("<Enter>", lambda e: canvas.configure(cursor="hand2"))
+        self.items_cartas[numero] = (fondo, texto, borde, estrella)
+        self.dibujar_carta_dorso(numero)
         
-        self.canvas_cartas[numero] = canvas
+    def carta_en(self, x, y):
+        """
+        Obtiene la carta que ocupa unas coordenadas del Canvas.
         
-    def dibujar_carta_dorso(self, canvas, numero):
+        Args:
+            x: Coordenada horizontal
+            y: Coordenada vertical
+            
+        Returns:
+            Número de la carta, o None si el punto no cae sobre ninguna
+        """
+        columna = int(x // self.paso_x)
+        fila = int(y // self.paso_y)
+        if not 0 <= columna < self.columnas or fila < 0:
+            return None
+        # Descartar el espacio entre cartas y la etiqueta
+        if (x - columna * self.paso_x > self.ancho_carta + 2
+                or y - fila * self.paso_y > self.alto_carta + 2):
+            return None
+        numero = fila * self.columnas + columna + 1
+        return numero if numero <= self.juego.total_opciones else None
+        
+    def click_lienzo(self, evento):
+        """Traduce un click en el Canvas al click de una carta."""
+        numero = self.carta_en(self.lienzo.canvasx(evento.x),
+                               self.lienzo.canvasy(evento.y))
+        if numero is not None:
+            self.click_carta(numero)
+        
+    def dibujar_carta_dorso(self, numero):
         """Dibuja una carta boca abajo."""
-        canvas.delete("all")
+        fondo, texto, borde, estrella = self.items_cartas[numero]
         # Dorso de la carta
-        canvas.create_rectangle(3, 3, 47, 62,
-                               fill=COLOR_CARTA_DORSO,
-                               outline="white", width=2)
+        self.lienzo.itemconfigure(fondo, fill=COLOR_CARTA_DORSO,
+                                  outline="white")
         # Patrón decorativo
-        canvas.create_text(25, 32, text="🂠",
-                          font=("Arial", 24),
-                          fill="white")
+        self.lienzo.itemconfigure(texto, text="🂠", fill="white",
+                                  font=("Arial", max(6, int(24 * self.escala))))
+        self.lienzo.itemconfigure(borde, state=tk.HIDDEN)
+        self.lienzo.itemconfigure(estrella, state=tk.HIDDEN)
         
-    def dibujar_carta_frente(self, canvas, numero):
+    def dibujar_carta_frente(self, numero):
         """Dibuja una carta boca arriba."""
-        canvas.delete("all")
-        carta_texto = self.juego.obtener_carta(numero)
+        fondo, texto, borde, estrella = self.items_cartas[numero]
         color = self.juego.obtener_color_carta(numero)
         color_texto = COLOR_CARTA_ROJA if color == "red" else COLOR_CARTA_NEGRA
         
         # Frente de la carta
-        canvas.create_rectangle(3, 3, 47, 62,
-                               fill=COLOR_CARTA_FRENTE,
-                               outline="gray", width=2)
+        self.lienzo.itemconfigure(fondo, fill=COLOR_CARTA_FRENTE,
+                                  outline="gray")
         # Valor de la carta
-        canvas.create_text(25, 32, text=carta_texto,
-                          font=("Arial", 14, "bold"),
-                          fill=color_texto)
+        self.lienzo.itemconfigure(texto, text=self.juego.obtener_carta(numero),
+                                  fill=color_texto,
+                                  font=("Arial", max(5, int(14 * self.escala)),
+                                        "bold"))
+        self.lienzo.itemconfigure(borde, state=tk.HIDDEN)
         
-    def dibujar_carta_seleccionada(self, canvas, numero):
+    def dibujar_carta_seleccionada(self, numero):
         """Dibuja una carta seleccionada con borde dorado."""
-        self.dibujar_carta_dorso(canvas, numero)
-        canvas.create_rectangle(1, 1, 49, 64,
-                               outline=COLOR_PUERTA_SELECCIONADA,
-                               width=3)
+        self.dibujar_carta_dorso(numero)
+        self.lienzo.itemconfigure(self.items_cartas[numero][2],
+                                  state=tk.NORMAL)
+        
+    def dibujar_carta_ganadora(self, numero):
+        """Dibuja una carta boca arriba marcada con una estrella."""
+        self.dibujar_carta_frente(numero)
+        self.lienzo.itemconfigure(self.items_cartas[numero][3],
+                                  state=tk.NORMAL)
         
     def click_carta(self, numero):
         """
@@ -173,27 +326,40 @@ class VistaCartas:
     def seleccionar_carta(self, numero):
         """Procesa la selección de una carta."""
         self.juego.seleccionar_opcion(numero)
+        self.eleccion_inicial = numero
         
         # Marcar la carta seleccionada
-        self.dibujar_carta_seleccionada(self.canvas_cartas[numero], numero)
+        self.planificador.programar(numero, self.dibujar_carta_seleccionada,
+                                    numero)
         
         self.mensaje.config(
             text=f"Has elegido la carta #{numero}. Revelando cartas..."
         )
         
         # Después de un momento, revelar las cartas
-        self.ventana.after(1000, self.revelar_cartas)
+        self.tarea_pendiente = self.ventana.after(1000, self.revelar_cartas)
         
     def revelar_cartas(self):
-        """Revela 50 de las 51 cartas restantes."""
+        """
+        Revela todas las cartas no elegidas menos una.
+        
+        Las cartas se dibujan repartidas entre varios frames; los botones
+        de decisión aparecen cuando termina el revelado.
+        """
+        self.tarea_pendiente = None
         cartas_reveladas, self.carta_oculta = self.juego.revelar_cartas()
+        self.fase = "revelando"
         
         # Revelar las cartas
         for carta in cartas_reveladas:
-            self.dibujar_carta_frente(self.canvas_cartas[carta], carta)
+            self.planificador.programar(carta, self.dibujar_carta_frente, carta)
+        self.numero_reveladas = len(cartas_reveladas)
+        self.planificador.al_terminar(self.terminar_revelado)
         
+    def terminar_revelado(self):
+        """Informa de las cartas reveladas y pide la decisión."""
         self.mensaje.config(
-            text=f"Se han revelado 50 cartas.\n"
+            text=f"Se han revelado {self.numero_reveladas} cartas.\n"
                  f"Tu carta: #{self.juego.eleccion_usuario} | "
                  f"Otra carta oculta: #{self.carta_oculta}"
         )
@@ -203,35 +369,9 @@ class VistaCartas:
         
     def mostrar_botones_decision(self):
         """Muestra los botones para mantener o cambiar."""
-        # Limpiar botones anteriores
-        for widget in self.frame_botones.winfo_children():
-            widget.destroy()
-        
-        btn_mantener = tk.Button(
-            self.frame_botones,
-            text="Mantener mi carta",
-            font=FUENTE_BOTON,
-            bg=COLOR_BOTON_SUCCESS,
-            fg=COLOR_TEXTO,
-            width=20,
-            height=2,
-            cursor="hand2",
-            command=self.mantener_eleccion
-        )
-        btn_mantener.pack(side=tk.LEFT, padx=10)
-        
-        btn_cambiar = tk.Button(
-            self.frame_botones,
-            text="Cambiar de carta",
-            font=FUENTE_BOTON,
-            bg=COLOR_BOTON_WARNING,
-            fg=COLOR_TEXTO,
-            width=20,
-            height=2,
-            cursor="hand2",
-            command=self.cambiar_eleccion
-        )
-        btn_cambiar.pack(side=tk.LEFT, padx=10)
+        self.ocultar_botones()
+        self.btn_mantener.pack(side=tk.LEFT, padx=10)
+        self.btn_cambiar.pack(side=tk.LEFT, padx=10)
         
     def mantener_eleccion(self):
         """Mantiene la elección actual."""
@@ -246,10 +386,8 @@ class VistaCartas:
         self.juego.cambiar_eleccion(self.carta_oculta)
         
         # Actualizar visualización
-        self.dibujar_carta_dorso(self.canvas_cartas[eleccion_anterior], 
-                                eleccion_anterior)
-        self.dibujar_carta_seleccionada(self.canvas_cartas[self.carta_oculta],
-                                       self.carta_oculta)
+        self.dibujar_carta_dorso(eleccion_anterior)
+        self.dibujar_carta_seleccionada(self.carta_oculta)
         
         self.mensaje.config(
             text=f"Cambiaste de la carta #{eleccion_anterior} "
@@ -261,16 +399,12 @@ class VistaCartas:
         """Revela el resultado final."""
         self.fase = "final"
         
-        # Revelar las dos cartas finales
-        self.dibujar_carta_frente(self.canvas_cartas[self.juego.eleccion_usuario],
-                                 self.juego.eleccion_usuario)
-        self.dibujar_carta_frente(self.canvas_cartas[self.carta_oculta],
-                                 self.carta_oculta)
-        
-        # Marcar la carta ganadora
-        canvas_ganadora = self.canvas_cartas[self.juego.opcion_ganadora]
-        canvas_ganadora.create_text(30, 10, text="⭐",
-                                   font=("Arial", 12))
+        # Revelar las dos cartas finales y marcar la ganadora
+        for carta in (self.juego.eleccion_usuario, self.carta_oculta):
+            self.planificador.programar(carta, self.dibujar_carta_frente, carta)
+        self.planificador.programar(self.juego.opcion_ganadora,
+                                    self.dibujar_carta_ganadora,
+                                    self.juego.opcion_ganadora)
         
         # Mostrar resultado
         carta_ganadora = self.juego.obtener_carta(self.juego.opcion_ganadora)
@@ -285,26 +419,78 @@ class VistaCartas:
             color = "#dc3545"
         
         self.mensaje.config(text=resultado, fg=color)
+        self.registrar_partida()
         
         # Mostrar botones finales
-        for widget in self.frame_botones.winfo_children():
-            widget.destroy()
+        self.ocultar_botones()
+        self.btn_nuevo.pack(pady=10)
         
-        btn_nuevo = tk.Button(
-            self.frame_botones,
-            text="🔄 Jugar de nuevo",
-            font=FUENTE_BOTON,
-            bg=COLOR_BOTON_PRIMARY,
-            fg=COLOR_TEXTO,
-            width=20,
-            height=2,
-            cursor="hand2",
-            command=self.reiniciar_juego
-        )
-        btn_nuevo.pack(pady=10)
+    def jugar_partida_automatica(self, jugador, dibujar=True):
+        """
+        Juega una partida completa sin intervención del usuario.
+        
+        Args:
+            jugador: Jugador de modelos.estrategias que decide si cambiar
+            dibujar: Si es False solo se juega sobre el modelo
+            
+        Returns:
+            True si el jugador cambió de carta
+        """
+        if dibujar:
+            self.reiniciar_juego()
+        else:
+            self.juego.reiniciar()
+        self.eleccion_inicial = self.juego.rng.randint(
+            1, self.juego.total_opciones)
+        self.juego.seleccionar_opcion(self.eleccion_inicial)
+        cartas_reveladas, self.carta_oculta = self.juego.revelar_cartas()
+        cambio = jugador.decidir_cambio(self.juego)
+        if cambio:
+            self.juego.cambiar_eleccion(self.carta_oculta)
+        
+        if dibujar:
+            for carta in cartas_reveladas:
+                self.planificador.programar(carta, self.dibujar_carta_frente,
+                                            carta)
+            self.revelar_resultado()
+            self.fase = "auto"
+            self.ocultar_botones()
+        else:
+            self.registrar_partida()
+        return cambio
+        
+    def registrar_partida(self):
+        """Anota la partida terminada en el registro, si hay uno."""
+        if self.registro is None:
+            return
+        cambio = self.juego.eleccion_usuario != self.eleccion_inicial
+        self.registro.registrar(self.juego.opcion_ganadora,
+                                self.eleccion_inicial, self.carta_oculta,
+                                cambio, self.juego.verificar_victoria())
         
     def reiniciar_juego(self):
-        """Reinicia el juego."""
-        for widget in self.frame_principal.winfo_children():
-            widget.destroy()
-        self.__init__(self.ventana, self.callback_volver)
+        """Reinicia el juego reutilizando los widgets existentes."""
+        if self.tarea_pendiente is not None:
+            self.ventana.after_cancel(self.tarea_pendiente)
+            self.tarea_pendiente = None
+        self.juego.reiniciar()
+        self.fase = "seleccion"
+        self.eleccion_inicial = None
+        self.carta_oculta = None
+        
+        self.planificador.cancelar()
+        for numero in self.items_cartas:
+            self.planificador.programar(numero, self.dibujar_carta_dorso, numero)
+        self.mensaje.config(text=self.MENSAJE_INICIAL,
+                            fg=COLOR_TEXTO_SECUNDARIO)
+        self.ocultar_botones()
+        
+    def mostrar(self):
+        """Vuelve a mostrar la vista después de ocultarla."""
+        self.ventana.configure(bg=COLOR_FONDO)
+        self.frame_principal.pack(fill=tk.BOTH, expand=True)
+        
+    def ocultar(self):
+        """Oculta la vista sin destruir sus widgets."""
+        self.panel_auto.detener()
+        self.frame_principal.pack_forget()
@@ -1,25 +1,35 @@
 import tkinter as tk
 from modelos.juego_puertas import JuegoPuertas
 from utils.constantes import *
+from vistas.auto_juego import PanelAutoJuego
 
 
 class VistaPuertas:
     """
     Clase que representa la interfaz visual del juego de las 3 puertas.
+    
+    Los widgets se crean una sola vez: al jugar de nuevo se reinicia el
+    modelo y se redibujan los elementos existentes.
     """
     
-    def __init__(self, ventana, callback_volver):
+    MENSAJE_INICIAL = ("Elige una puerta. Detrás de una hay un AUTO 🚗\n"
+                       "y detrás de las otras dos hay CABRAS 🐐")
+    
+    def __init__(self, ventana, callback_volver, registro=None):
         """
         Inicializa la vista del juego de puertas.
         
         Args:
             ventana: Ventana principal de tkinter
             callback_volver: Función para volver al menú
+            registro: EscritorRegistro opcional donde anotar cada partida
         """
         self.ventana = ventana
         self.callback_volver = callback_volver
+        self.registro = registro
+        self.eleccion_inicial = None
         self.juego = JuegoPuertas()
-        self.fase = "seleccion"  # seleccion, revelada, final
+        self.fase = "seleccion"  # seleccion, decision, final, auto
         self.puerta_revelada = None
         self.canvas_puertas = {}
         
@@ -46,8 +56,7 @@ class VistaPuertas:
         # Mensaje
         self.mensaje = tk.Label(
             self.frame_principal,
-            text="Elige una puerta. Detrás de una hay un AUTO 🚗\n"
-                 "y detrás de las otras dos hay CABRAS 🐐",
+            text=self.MENSAJE_INICIAL,
             font=FUENTE_SUBTITULO,
             bg=COLOR_FONDO,
             fg=COLOR_TEXTO_SECUNDARIO
@@ -65,6 +74,10 @@ class VistaPuertas:
         # Frame para botones
         self.frame_botones = tk.Frame(self.frame_principal, bg=COLOR_FONDO)
         self.frame_botones.pack(pady=20)
+        self.crear_botones()
+        
+        # Juego automático
+        self.panel_auto = PanelAutoJuego(self.frame_principal, self)
         
         # Botón volver
         btn_volver = tk.Button(
@@ -78,6 +91,49 @@ class VistaPuertas:
         )
         btn_volver.pack(pady=10)
         
+    def crear_botones(self):
+        """Crea los botones de decisión y de nueva partida, sin mostrarlos."""
+        self.btn_mantener = tk.Button(
+            self.frame_botones,
+            text="Mantener mi elección",
+            font=FUENTE_BOTON,
+            bg=COLOR_BOTON_SUCCESS,
+            fg=COLOR_TEXTO,
+            width=20,
+            height=2,
+            cursor="hand2",
+            command=self.mantener_eleccion
+        )
+        
+        self.btn_cambiar = tk.Button(
+            self.frame_botones,
+            text="Cambiar de puerta",
+            font=FUENTE_BOTON,
+            bg=COLOR_BOTON_WARNING,
+            fg=COLOR_TEXTO,
+            width=20,
+            height=2,
+            cursor="hand2",
+            command=self.cambiar_eleccion
+        )
+        
+        self.btn_nuevo = tk.Button(
+            self.frame_botones,
+            text="🔄 Jugar de nuevo",
+            font=FUENTE_BOTON,
+            bg=COLOR_BOTON_PRIMARY,
+            fg=COLOR_TEXTO,
+            width=20,
+            height=2,
+            cursor="hand2",
+            command=self.reiniciar_juego
+        )
+        
+    def ocultar_botones(self):
+        """Oculta los botones de decisión y de nueva partida."""
+        for boton in (self.btn_mantener, self.btn_cambiar, self.btn_nuevo):
+            boton.pack_forget()
+        
     def crear_puerta(self, numero):
         """
         Crea una puerta visual en el canvas.
@@ -98,7 +154,8 @@ class VistaPuertas:
         )
         canvas.pack()
         
-        # Dibujar puerta cerrada
+        # Crear los elementos de la puerta y mostrarla cerrada
+        self.crear_items_puerta(canvas, numero)
         self.dibujar_puerta_cerrada(canvas, numero)
         
         # Etiqueta con número
@@ -117,44 +174,56 @@ class VistaPuertas:
         
         self.canvas_puertas[numero] = canvas
         
-    def dibujar_puerta_cerrada(self, canvas, numero):
-        """Dibuja una puerta cerrada."""
+    def crear_items_puerta(self, canvas, numero):
+        """
+        Crea los elementos persistentes de una puerta.
+        
+        Las puertas se dibujan mostrando u ocultando estos elementos por
+        etiqueta, sin borrar ni crear elementos en cada partida.
+        """
         # Puerta
         canvas.create_rectangle(10, 10, 140, 190, 
                                fill=COLOR_PUERTA_CERRADA,
-                               outline="black", width=3)
+                               outline="black", width=3, tags="cerrada")
         # Marco
         canvas.create_rectangle(20, 20, 130, 180,
-                               outline="gold", width=2)
+                               outline="gold", width=2, tags="cerrada")
         # Número
         canvas.create_text(75, 50, text=str(numero),
                           font=("Arial", 30, "bold"),
-                          fill="gold")
+                          fill="gold", tags="cerrada")
         # Manija
-        canvas.create_oval(120, 95, 130, 105, fill="gold")
-        
-    def dibujar_puerta_abierta(self, canvas, numero, contenido):
-        """Dibuja una puerta abierta con su contenido."""
-        canvas.delete("all")
+        canvas.create_oval(120, 95, 130, 105, fill="gold", tags="cerrada")
         # Fondo abierto
         canvas.create_rectangle(10, 10, 140, 190,
                                fill=COLOR_PUERTA_ABIERTA,
-                               outline="black", width=3)
+                               outline="black", width=3, tags="abierta")
         # Contenido
-        if contenido == "AUTO":
-            canvas.create_text(75, 100, text="🚗",
-                             font=("Arial", 60))
-        else:
-            canvas.create_text(75, 100, text="🐐",
-                             font=("Arial", 60))
+        canvas.create_text(75, 100, font=("Arial", 60),
+                          tags=("abierta", "contenido"))
+        # Borde de selección
+        canvas.create_rectangle(5, 5, 145, 195,
+                               outline=COLOR_PUERTA_SELECCIONADA,
+                               width=5, tags="seleccion")
+        
+    def dibujar_puerta_cerrada(self, canvas, numero):
+        """Dibuja una puerta cerrada."""
+        canvas.itemconfigure("cerrada", state=tk.NORMAL)
+        canvas.itemconfigure("abierta", state=tk.HIDDEN)
+        canvas.itemconfigure("seleccion", state=tk.HIDDEN)
+        
+    def dibujar_puerta_abierta(self, canvas, numero, contenido):
+        """Dibuja una puerta abierta con su contenido."""
+        canvas.itemconfigure("cerrada", state=tk.HIDDEN)
+        canvas.itemconfigure("abierta", state=tk.NORMAL)
+        canvas.itemconfigure("seleccion", state=tk.HIDDEN)
+        canvas.itemconfigure("contenido",
+                             text="🚗" if contenido == "AUTO" else "🐐")
                              
     def dibujar_puerta_seleccionada(self, canvas, numero):
         """Dibuja una puerta seleccionada (con borde dorado)."""
-        canvas.delete("all")
         self.dibujar_puerta_cerrada(canvas, numero)
-        canvas.create_rectangle(5, 5, 145, 195,
-                               outline=COLOR_PUERTA_SELECCIONADA,
-                               width=5)
+        canvas.itemconfigure("seleccion", state=tk.NORMAL)
         
     def click_puerta(self, numero):
         """
@@ -169,6 +238,7 @@ class VistaPuertas:
     def seleccionar_puerta(self, numero):
         """Procesa la selección de una puerta."""
         self.juego.seleccionar_opcion(numero)
+        self.eleccion_inicial = numero
         self.dibujar_puerta_seleccionada(self.canvas_puertas[numero], numero)
         
         # Revelar una puerta
@@ -189,35 +259,9 @@ class VistaPuertas:
         
     def mostrar_botones_decision(self):
         """Muestra los botones para mantener o cambiar."""
-        # Limpiar botones anteriores
-        for widget in self.frame_botones.winfo_children():
-            widget.destroy()
-        
-        btn_mantener = tk.Button(
-            self.frame_botones,
-            text="Mantener mi elección",
-            font=FUENTE_BOTON,
-            bg=COLOR_BOTON_SUCCESS,
-            fg=COLOR_TEXTO,
-            width=20,
-            height=2,
-            cursor="hand2",
-            command=self.mantener_eleccion
-        )
-        btn_mantener.pack(side=tk.LEFT, padx=10)
-        
-        btn_cambiar = tk.Button(
-            self.frame_botones,
-            text="Cambiar de puerta",
-            font=FUENTE_BOTON,
-            bg=COLOR_BOTON_WARNING,
-            fg=COLOR_TEXTO,
-            width=20,
-            height=2,
-            cursor="hand2",
-            command=self.cambiar_eleccion
-        )
-        btn_cambiar.pack(side=tk.LEFT, padx=10)
+        self.ocultar_botones()
+        self.btn_mantener.pack(side=tk.LEFT, padx=10)
+        self.btn_cambiar.pack(side=tk.LEFT, padx=10)
         
     def mantener_eleccion(self):
         """Mantiene la elección actual."""
@@ -256,10 +300,8 @@ class VistaPuertas:
             
             # Marcar la elección del usuario
             if i == self.juego.eleccion_usuario:
-                canvas = self.canvas_puertas[i]
-                canvas.create_rectangle(5, 5, 145, 195,
-                                       outline=COLOR_PUERTA_SELECCIONADA,
-                                       width=5)
+                self.canvas_puertas[i].itemconfigure("seleccion",
+                                                     state=tk.NORMAL)
         
         # Mostrar resultado
         if self.juego.verificar_victoria():
@@ -270,26 +312,74 @@ class VistaPuertas:
             color = "#dc3545"
         
         self.mensaje.config(text=resultado, fg=color)
+        self.registrar_partida()
         
         # Mostrar botones finales
-        for widget in self.frame_botones.winfo_children():
-            widget.destroy()
+        self.ocultar_botones()
+        self.btn_nuevo.pack(pady=10)
         
-        btn_nuevo = tk.Button(
-            self.frame_botones,
-            text="🔄 Jugar de nuevo",
-            font=FUENTE_BOTON,
-            bg=COLOR_BOTON_PRIMARY,
-            fg=COLOR_TEXTO,
-            width=20,
-            height=2,
-            cursor="hand2",
-            command=self.reiniciar_juego
-        )
-        btn_nuevo.pack(pady=10)
+    def jugar_partida_automatica(self, jugador, dibujar=True):
+        """
+        Juega una partida completa sin intervención del usuario.
+        
+        Args:
+            jugador: Jugador de modelos.estrategias que decide si cambiar
+            dibujar: Si es False solo se juega sobre el modelo
+            
+        Returns:
+            True si el jugador cambió de puerta
+        """
+        if dibujar:
+            self.reiniciar_juego()
+        else:
+            self.juego.reiniciar()
+        self.eleccion_inicial = self.juego.rng.randint(1, 3)
+        self.juego.seleccionar_opcion(self.eleccion_inicial)
+        self.puerta_revelada = self.juego.revelar_puerta()
+        cambio = jugador.decidir_cambio(self.juego)
+        if cambio:
+            self.juego.cambiar_eleccion()
+        
+        if dibujar:
+            self.revelar_resultado()
+            self.fase = "auto"
+            self.ocultar_botones()
+        else:
+            self.registrar_partida()
+        return cambio
+        
+    def registrar_partida(self):
+        """Anota la partida terminada en el registro, si hay uno."""
+        if self.registro is None:
+            return
+        cambio = self.juego.eleccion_usuario != self.eleccion_inicial
+        if cambio:
+            puerta_restante = self.juego.eleccion_usuario
+        else:
+            puerta_restante = self.juego.obtener_puerta_restante()
+        self.registro.registrar(self.juego.opcion_ganadora,
+                                self.eleccion_inicial, puerta_restante,
+                                cambio, self.juego.verificar_victoria())
         
     def reiniciar_juego(self):
-        """Reinicia el juego."""
-        for widget in self.frame_principal.winfo_children():
-            widget.destroy()
-        self.__init__(self.ventana, self.callback_volver)
+        """Reinicia el juego reutilizando los widgets existentes."""
+        self.juego.reiniciar()
+        self.fase = "seleccion"
+        self.eleccion_inicial = None
+        self.puerta_revelada = None
+        
+        for numero, canvas in self.canvas_puertas.items():
+            self.dibujar_puerta_cerrada(canvas, numero)
+        self.mensaje.config(text=self.MENSAJE_INICIAL,
+                            fg=COLOR_TEXTO_SECUNDARIO)
+        self.ocultar_botones()
+        
+    def mostrar(self):
+        """Vuelve a mostrar la vista después de ocultarla."""
+        self.ventana.configure(bg=COLOR_FONDO)
+        self.frame_principal.pack(fill=tk.BOTH, expand=True)
+        
+    def ocultar(self):
+        """Oculta la vista sin destruir sus widgets."""
+        self.panel_auto.detener()
+        self.frame_principal.pack_forget()
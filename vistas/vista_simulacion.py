@@ -0,0 +1,333 @@
+import math
+import tkinter as tk
+from modelos.estadisticas import EstadisticasMontyHall
+from modelos.probabilidad_exacta import probabilidades_exactas
+from utils.constantes import *
+
+
+class VistaSimulacion:
+    """
+    Clase que representa el panel de simulación en vivo.
+
+    La simulación por lotes corre en un hilo aparte y publica sus totales en
+    una cola; la vista la consulta periódicamente con ventana.after y dibuja
+    la convergencia de las tasas de victoria sin bloquear el bucle de Tk.
+    """
+
+    MODOS = {"3 puertas": 3, "52 cartas": 52}
+
+    # Área del gráfico dentro del Canvas
+    ANCHO_GRAFICO = 900
+    ALTO_GRAFICO = 300
+    MARGEN = 50
+    DECADA_MINIMA = 3
+
+    # Se añade un punto al gráfico cada vez que las rondas crecen un 5%
+    FACTOR_PUNTOS = 1.05
+
+    def __init__(self, ventana, callback_volver, registro=None):
+        """
+        Inicializa la vista de simulación.
+
+        Args:
+            ventana: Ventana principal de tkinter
+            callback_volver: Función para volver al menú
+            registro: No se usa; se acepta por uniformidad con las demás vistas
+        """
+        self.ventana = ventana
+        self.callback_volver = callback_volver
+        self.registro = registro
+        self.trabajador = None
+        self.tarea_sondeo = None
+        self.puntos = []
+        self.decada_maxima = None
+
+        self.crear_interfaz()
+
+    def crear_interfaz(self):
+        """Crea los elementos de la interfaz del panel."""
+        self.ventana.configure(bg=COLOR_FONDO)
+
+        # Frame principal
+        self.frame_principal = tk.Frame(self.ventana, bg=COLOR_FONDO)
+        self.frame_principal.pack(fill=tk.BOTH, expand=True)
+
+        # Título
+        titulo = tk.Label(
+            self.frame_principal,
+            text="📈 SIMULACIÓN EN VIVO",
+            font=FUENTE_TITULO,
+            bg=COLOR_FONDO,
+            fg=COLOR_TEXTO
+        )
+        titulo.pack(pady=15)
+
+        # Controles
+        frame_controles = tk.Frame(self.frame_principal, bg=COLOR_FONDO)
+        frame_controles.pack(pady=5)
+
+        self.modo = tk.StringVar(self.ventana, value="3 puertas")
+        selector = tk.OptionMenu(frame_controles, self.modo, *self.MODOS)
+        selector.configure(font=FUENTE_TEXTO, bg=COLOR_ACENTO, fg=COLOR_TEXTO,
+                           highlightthickness=0)
+        selector.pack(side=tk.LEFT, padx=10)
+
+        self.btn_iniciar = tk.Button(
+            frame_controles,
+            text="▶ Iniciar",
+            font=FUENTE_BOTON,
+            bg=COLOR_BOTON_SUCCESS,
+            fg=COLOR_TEXTO,
+            width=12,
+            cursor="hand2",
+            command=self.iniciar
+        )
+        self.btn_iniciar.pack(side=tk.LEFT, padx=10)
+
+        self.btn_detener = tk.Button(
+            frame_controles,
+            text="⏹ Detener",
+            font=FUENTE_BOTON,
+            bg=COLOR_BOTON_WARNING,
+            fg=COLOR_TEXTO,
+            width=12,
+            cursor="hand2",
+            state=tk.DISABLED,
+            command=self.detener
+        )
+        self.btn_detener.pack(side=tk.LEFT, padx=10)
+
+        # Resultados
+        self.etiqueta_rondas = tk.Label(
+            self.frame_principal,
+            text="Pulsa Iniciar para simular millones de rondas",
+            font=FUENTE_SUBTITULO,
+            bg=COLOR_FONDO,
+            fg=COLOR_TEXTO_SECUNDARIO
+        )
+        self.etiqueta_rondas.pack(pady=5)
+
+        self.etiqueta_tasas = tk.Label(
+            self.frame_principal,
+            text="",
+            font=FUENTE_TEXTO,
+            bg=COLOR_FONDO,
+            fg=COLOR_TEXTO,
+            justify=tk.LEFT
+        )
+        self.etiqueta_tasas.pack(pady=5)
+
+        # Gráfico de convergencia
+        self.grafico = tk.Canvas(
+            self.frame_principal,
+            width=self.ANCHO_GRAFICO + 2 * self.MARGEN,
+            height=self.ALTO_GRAFICO + 2 * self.MARGEN,
+            bg=COLOR_FONDO_SECUNDARIO,
+            highlightthickness=0
+        )
+        self.grafico.pack(pady=10)
+        self.crear_items_grafico()
+
+        # Botón volver
+        btn_volver = tk.Button(
+            self.frame_principal,
+            text="🏠 Volver al Menú",
+            font=FUENTE_BOTON,
+            bg=COLOR_ACENTO,
+            fg=COLOR_TEXTO,
+            cursor="hand2",
+            command=self.callback_volver
+        )
+        btn_volver.pack(pady=10)
+
+    def crear_items_grafico(self):
+        """Crea los ejes y las líneas del gráfico, que luego solo se mueven."""
+        izquierda, arriba = self.MARGEN, self.MARGEN
+        derecha = izquierda + self.ANCHO_GRAFICO
+        abajo = arriba + self.ALTO_GRAFICO
+
+        # Ejes y marcas del eje vertical
+        self.grafico.create_line(izquierda, arriba, izquierda, abajo,
+                                 fill=COLOR_TEXTO_SECUNDARIO)
+        self.grafico.create_line(izquierda, abajo, derecha, abajo,
+                                 fill=COLOR_TEXTO_SECUNDARIO)
+        for porcentaje in (0, 25, 50, 75, 100):
+            y = self.coordenada_y(porcentaje / 100)
+            self.grafico.create_text(izquierda - 8, y, text=f"{porcentaje}%",
+                                     anchor=tk.E, fill=COLOR_TEXTO_SECUNDARIO,
+                                     font=("Arial", 9))
+        self.grafico.create_text(derecha, abajo + 30, text="rondas",
+                                 anchor=tk.E, fill=COLOR_TEXTO_SECUNDARIO,
+                                 font=("Arial", 9))
+
+        # Probabilidades exactas
+        self.linea_exacta_mantener = self.grafico.create_line(
+            izquierda, abajo, derecha, abajo, fill=COLOR_BOTON_SUCCESS,
+            dash=(4, 4), state=tk.HIDDEN)
+        self.linea_exacta_cambiar = self.grafico.create_line(
+            izquierda, abajo, derecha, abajo, fill=COLOR_BOTON_WARNING,
+            dash=(4, 4), state=tk.HIDDEN)
+
+        # Tasas simuladas
+        self.linea_mantener = self.grafico.create_line(
+            0, 0, 0, 0, fill=COLOR_BOTON_SUCCESS, width=2, state=tk.HIDDEN)
+        self.linea_cambiar = self.grafico.create_line(
+            0, 0, 0, 0, fill=COLOR_BOTON_WARNING, width=2, state=tk.HIDDEN)
+
+        # Leyenda
+        self.grafico.create_text(derecha, arriba - 30, anchor=tk.NE,
+                                 text="— cambiar", fill=COLOR_BOTON_WARNING,
+                                 font=("Arial", 10, "bold"))
+        self.grafico.create_text(derecha - 110, arriba - 30, anchor=tk.NE,
+                                 text="— mantener", fill=COLOR_BOTON_SUCCESS,
+                                 font=("Arial", 10, "bold"))
+
+    def coordenada_y(self, tasa):
+        """Convierte una tasa (0-1) en la coordenada vertical del gráfico."""
+        return self.MARGEN + (1 - tasa) * self.ALTO_GRAFICO
+
+    def coordenada_x(self, decada):
+        """Convierte log10(rondas) en la coordenada horizontal del gráfico."""
+        fraccion = ((decada - self.DECADA_MINIMA)
+                    / (self.decada_maxima - self.DECADA_MINIMA))
+        return self.MARGEN + fraccion * self.ANCHO_GRAFICO
+
+    def dibujar_eje_x(self):
+        """Dibuja las marcas del eje horizontal (escala logarítmica)."""
+        self.grafico.delete("eje_x")
+        abajo = self.MARGEN + self.ALTO_GRAFICO
+        for decada in range(self.DECADA_MINIMA, self.decada_maxima + 1):
+            x = self.coordenada_x(decada)
+            self.grafico.create_line(x, abajo, x, abajo + 5, tags="eje_x",
+                                     fill=COLOR_TEXTO_SECUNDARIO)
+            self.grafico.create_text(x, abajo + 15, text=f"10^{decada}",
+                                     tags="eje_x", fill=COLOR_TEXTO_SECUNDARIO,
+                                     font=("Arial", 9))
+
+    def iniciar(self):
+        """Arranca una simulación nueva en segundo plano."""
+        try:
+            from modelos.simulacion_segundo_plano import SimulacionSegundoPlano
+        except ImportError:
+            self.etiqueta_rondas.config(
+                text="La simulación en vivo necesita NumPy instalado")
+            return
+
+        self.detener()
+        total_opciones = self.MODOS[self.modo.get()]
+        self.trabajador = SimulacionSegundoPlano(total_opciones)
+        self.puntos = []
+        self.decada_maxima = 6
+        self.dibujar_eje_x()
+
+        # Líneas de las probabilidades exactas
+        exacta_mantener, exacta_cambiar = probabilidades_exactas(total_opciones)
+        for linea, exacta in ((self.linea_exacta_mantener, exacta_mantener),
+                              (self.linea_exacta_cambiar, exacta_cambiar)):
+            y = self.coordenada_y(float(exacta))
+            self.grafico.coords(linea, self.MARGEN, y,
+                                self.MARGEN + self.ANCHO_GRAFICO, y)
+            self.grafico.itemconfigure(linea, state=tk.NORMAL)
+        for linea in (self.linea_mantener, self.linea_cambiar):
+            self.grafico.itemconfigure(linea, state=tk.HIDDEN)
+
+        self.etiqueta_rondas.config(text="Simulando...", fg=COLOR_TEXTO)
+        self.btn_iniciar.config(state=tk.DISABLED)
+        self.btn_detener.config(state=tk.NORMAL)
+        self.trabajador.start()
+        self.tarea_sondeo = self.ventana.after(INTERVALO_SONDEO_MS,
+                                               self.sondear)
+
+    def detener(self):
+        """Detiene la simulación en curso, si la hay."""
+        if self.tarea_sondeo is not None:
+            self.ventana.after_cancel(self.tarea_sondeo)
+            self.tarea_sondeo = None
+        if self.trabajador is not None:
+            self.trabajador.detener()
+        self.btn_iniciar.config(state=tk.NORMAL)
+        self.btn_detener.config(state=tk.DISABLED)
+
+    def sondear(self):
+        """Lee sin bloquear los últimos totales publicados y los muestra."""
+        self.tarea_sondeo = None
+        if self.trabajador.is_alive():
+            ultimo = self.trabajador.ultimo()
+            if ultimo is not None:
+                self.actualizar(*ultimo)
+            self.tarea_sondeo = self.ventana.after(INTERVALO_SONDEO_MS,
+                                                   self.sondear)
+        else:
+            # Al terminar, los totales finales pueden no estar en la cola
+            self.actualizar(self.trabajador.resultado,
+                            self.trabajador.velocidad)
+            self.detener()
+
+    def actualizar(self, resultado, velocidad):
+        """
+        Muestra unos totales acumulados.
+
+        Args:
+            resultado: ResultadoSimulacion acumulado
+            velocidad: Rondas simuladas por segundo
+        """
+        if resultado.rondas == 0:
+            return
+        estadisticas = EstadisticasMontyHall()
+        estadisticas.agregar_resultado(resultado)
+        self.etiqueta_rondas.config(
+            text=f"{resultado.rondas:,} rondas ({velocidad:,.0f} rondas/s)"
+        )
+        self.etiqueta_tasas.config(
+            text=f"Mantener: {resultado.tasa_mantener:.4%} "
+                 f"± {estadisticas.mantener.semiancho():.4%}\n"
+                 f"Cambiar:  {resultado.tasa_cambiar:.4%} "
+                 f"± {estadisticas.cambiar.semiancho():.4%}"
+        )
+
+        # Añadir un punto solo si las rondas crecieron lo suficiente
+        if self.puntos and resultado.rondas < (10 ** self.puntos[-1][0]
+                                               * self.FACTOR_PUNTOS):
+            return
+        decada = math.log10(resultado.rondas)
+        self.puntos.append((decada, resultado.tasa_mantener,
+                            resultado.tasa_cambiar))
+        if decada > self.decada_maxima:
+            self.decada_maxima = math.ceil(decada)
+            self.dibujar_eje_x()
+        self.dibujar_lineas()
+
+    def dibujar_lineas(self):
+        """Recoloca las líneas de convergencia con los puntos actuales."""
+        puntos = self.puntos if len(self.puntos) > 1 else self.puntos * 2
+        for linea, indice in ((self.linea_mantener, 1), (self.linea_cambiar, 2)):
+            coordenadas = []
+            for punto in puntos:
+                coordenadas.append(self.coordenada_x(punto[0]))
+                coordenadas.append(self.coordenada_y(punto[indice]))
+            self.grafico.coords(linea, *coordenadas)
+            self.grafico.itemconfigure(linea, state=tk.NORMAL)
+
+    def reiniciar_juego(self):
+        """Detiene la simulación y deja el panel listo para otra."""
+        self.detener()
+        self.trabajador = None
+        self.puntos = []
+        self.grafico.delete("eje_x")
+        for linea in (self.linea_mantener, self.linea_cambiar,
+                      self.linea_exacta_mantener, self.linea_exacta_cambiar):
+            self.grafico.itemconfigure(linea, state=tk.HIDDEN)
+        self.etiqueta_rondas.config(
+            text="Pulsa Iniciar para simular millones de rondas",
+            fg=COLOR_TEXTO_SECUNDARIO)
+        self.etiqueta_tasas.config(text="")
+
+    def mostrar(self):
+        """Vuelve a mostrar la vista después de ocultarla."""
+        self.ventana.configure(bg=COLOR_FONDO)
+        self.frame_principal.pack(fill=tk.BOTH, expand=True)
+
+    def ocultar(self):
+        """Detiene la simulación y oculta la vista sin destruir sus widgets."""
+        self.detener()
+        self.frame_principal.pack_forget()